@@ -0,0 +1,105 @@
+"""Module containing the checkpoint of an annealing run."""
+
+from dataclasses import dataclass
+import json
+from typing import Callable
+import numpy as np
+
+
+@dataclass
+class AnnealingCheckpoint:
+    """Everything needed to continue an annealing run where it stopped.
+
+    Participants are referenced by their UIDs, so a checkpoint can be stored as JSON
+    and resumed with a new set of equal participants.
+    """
+
+    #: the UIDs of the participants in index order
+    participant_uids: list[int]
+    #: the number of groups in each iteration
+    groups_per_iteration: int
+    #: the assignment the normalization bounds of the objective function are calculated from,
+    #: indexed by [iteration, participant]
+    sample_group_ids: np.ndarray
+    #: the current assignment, indexed by [iteration, participant]
+    group_ids: np.ndarray
+    #: the position of every participant inside the member array of its group,
+    #: which decides the swaps drawn from the random source, indexed by [iteration, participant]
+    positions: np.ndarray
+    #: the best assignment visited so far, indexed by [iteration, participant]
+    best_group_ids: np.ndarray
+    #: the cycle the best assignment was found at
+    best_cycle: int
+    #: the number of completed cycles
+    cycle: int
+    #: the number of accepted moves in the current acceptance window
+    accepted: int
+    #: the seconds the run has taken so far
+    elapsed: float
+    #: the initial temperature of the schedule, after calibration
+    initial_temperature: float
+    #: the temperature scaling of the schedule, after calibration
+    temperature_scaling: float
+    #: the state of the random source, as returned by :meth:`random.Random.getstate`
+    random_state: tuple
+
+    def to_json(self) -> str:
+        """Serialize the checkpoint.
+
+        :return: the checkpoint as a JSON string
+        """
+        return json.dumps(
+            {
+                "participant_uids": self.participant_uids,
+                "groups_per_iteration": self.groups_per_iteration,
+                "sample_group_ids": self.sample_group_ids.tolist(),
+                "group_ids": self.group_ids.tolist(),
+                "positions": self.positions.tolist(),
+                "best_group_ids": self.best_group_ids.tolist(),
+                "best_cycle": self.best_cycle,
+                "cycle": self.cycle,
+                "accepted": self.accepted,
+                "elapsed": self.elapsed,
+                "initial_temperature": self.initial_temperature,
+                "temperature_scaling": self.temperature_scaling,
+                "random_state": self.random_state,
+            }
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "AnnealingCheckpoint":
+        """Deserialize a checkpoint.
+
+        :param text: the checkpoint as returned by :meth:`to_json`
+
+        :return: the checkpoint
+        """
+        values: dict = json.loads(text)
+        version, internal_state, gauss_next = values["random_state"]
+        return cls(
+            values["participant_uids"],
+            values["groups_per_iteration"],
+            np.array(values["sample_group_ids"], dtype=np.intp),
+            np.array(values["group_ids"], dtype=np.intp),
+            np.array(values["positions"], dtype=np.intp),
+            np.array(values["best_group_ids"], dtype=np.intp),
+            values["best_cycle"],
+            values["cycle"],
+            values["accepted"],
+            values["elapsed"],
+            values["initial_temperature"],
+            values["temperature_scaling"],
+            (version, tuple(internal_state), gauss_next),
+        )
+
+
+@dataclass
+class CheckpointOptions:
+    """Where an annealing run continues from and how it passes on checkpoints while it runs."""
+
+    #: continue the run this checkpoint was taken of
+    resume_from: AnnealingCheckpoint | None = None
+    #: the number of cycles between two calls of the callback
+    interval: int = 1000
+    #: gets called with a checkpoint of the run every `interval` cycles
+    callback: Callable[[AnnealingCheckpoint], None] | None = None
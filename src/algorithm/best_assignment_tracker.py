@@ -0,0 +1,103 @@
+"""Module containing the tracker of the best assignment visited by a local search."""
+
+import numpy as np
+from algorithm.compact_assignment import CompactAssignment
+
+
+class BestAssignmentTracker:
+    """Keeps track of the lowest-cost assignment a local search has visited.
+
+    Instead of copying the assignment on every improvement, the swaps accepted since the best assignment
+    are kept in a journal, undoing them in reverse order restores the best assignment.
+    Once the journal grows larger than the assignment itself, the best assignment is restored into a snapshot
+    and the journal is dropped until the next improvement.
+
+    :param state: the assignment the search starts with, changed in place by the search
+    :param cost: the cost of the starting assignment
+    """
+
+    cost: float
+    cycle: int
+
+    __state: CompactAssignment
+    __journal: list[tuple[int, int, int]] | None
+    __journal_limit: int
+    __snapshot: np.ndarray | None
+
+    def __init__(self, state: CompactAssignment, cost: float) -> None:
+        self.cost = cost
+        self.cycle = 0
+        self.__state = state
+        self.__journal = []
+        self.__journal_limit = state.group_ids.size
+        self.__snapshot = None
+
+    def record_swap(
+        self, iteration: int, participant_1: int, participant_2: int
+    ) -> None:
+        """Record a swap that has been applied to the assignment.
+
+        :param iteration: the index of the iteration of the swap
+        :param participant_1: the index of the first swapped participant
+        :param participant_2: the index of the second swapped participant
+        """
+        if self.__journal is None:
+            return
+        self.__journal.append((iteration, participant_1, participant_2))
+        if len(self.__journal) > self.__journal_limit:
+            self.__snapshot = self.best_group_ids()
+            self.__journal = None
+
+    def restore(self, group_ids: np.ndarray, cost: float, cycle: int) -> None:
+        """Remember a given assignment as the best one, used when a search continues from a checkpoint.
+
+        :param group_ids: the group ids of the best assignment, indexed by [iteration, participant]
+        :param cost: the cost of the best assignment
+        :param cycle: the cycle the best assignment was found at
+        """
+        self.cost = cost
+        self.cycle = cycle
+        self.__journal = None
+        self.__snapshot = group_ids.copy()
+
+    def update(self, cycle: int, cost: float) -> bool:
+        """Remember the current assignment if it is better than the best one.
+
+        :param cycle: the number of the current cycle
+        :param cost: the cost of the current assignment
+
+        :return: true if the current assignment is the new best one, false otherwise
+        """
+        if cost >= self.cost:
+            return False
+        self.cost = cost
+        self.cycle = cycle
+        self.__journal = []
+        self.__snapshot = None
+        return True
+
+    def best_group_ids(self) -> np.ndarray:
+        """Return the group of every participant in the best assignment.
+
+        :return: a copy of the group ids of the best assignment, indexed by [iteration, participant]
+        """
+        # the journal is only dropped once the best assignment is kept in the snapshot
+        if self.__snapshot is not None:
+            return self.__snapshot.copy()
+        group_ids: np.ndarray = self.__state.group_ids.copy()
+        for iteration, participant_1, participant_2 in reversed(self.__journal or []):
+            group_ids[iteration, [participant_1, participant_2]] = group_ids[
+                iteration, [participant_2, participant_1]
+            ]
+        return group_ids
+
+    def best_assignment(self) -> CompactAssignment:
+        """Return the best assignment.
+
+        :return: an independent copy of the best assignment
+        """
+        return CompactAssignment(
+            self.__state.participants,
+            self.best_group_ids(),
+            self.__state.groups_per_iteration,
+        )
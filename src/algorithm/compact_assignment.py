@@ -0,0 +1,185 @@
+"""Module containing the array-backed assignment representation."""
+
+from random import Random
+import numpy as np
+from data_structures import Participant, Assignment
+
+
+class CompactAssignment:
+    """Array-backed group assignment of indexed participants.
+
+    :attr:`group_ids` holds the group of every participant, indexed by [iteration, participant].
+    :attr:`members` holds the member indices of every group, indexed by [iteration][group],
+    and :attr:`positions` the position of every participant inside its member array,
+    so swapping two participants and picking a random member both take constant time.
+
+    :param participants: the participants in index order
+    :param group_ids: the group of every participant, indexed by [iteration, participant]
+    :param groups_per_iteration: the number of groups in each iteration
+    :param positions: the position of every participant inside its member array,
+    indexed by [iteration, participant], defaults to ordering the members by index
+    """
+
+    participants: list[Participant]
+    group_ids: np.ndarray
+    members: list[list[np.ndarray]]
+    positions: np.ndarray
+
+    def __init__(
+        self,
+        participants: list[Participant],
+        group_ids: np.ndarray,
+        groups_per_iteration: int,
+        positions: np.ndarray | None = None,
+    ) -> None:
+        self.participants = participants
+        self.group_ids = np.array(group_ids, dtype=np.intp)
+        self.positions = (
+            np.zeros_like(self.group_ids)
+            if positions is None
+            else np.array(positions, dtype=np.intp)
+        )
+        self.members = []
+        for iteration_index, iteration_group_ids in enumerate(self.group_ids):
+            order: np.ndarray = np.lexsort(
+                (self.positions[iteration_index], iteration_group_ids)
+            )
+            sizes: np.ndarray = np.bincount(
+                iteration_group_ids, minlength=groups_per_iteration
+            )
+            iteration_members: list[np.ndarray] = np.split(order, np.cumsum(sizes)[:-1])
+            for group_members in iteration_members:
+                self.positions[iteration_index, group_members] = np.arange(
+                    len(group_members)
+                )
+            self.members.append(iteration_members)
+
+    @classmethod
+    def from_assignment(
+        cls, assignment: Assignment, participants: list[Participant] | None = None
+    ) -> "CompactAssignment":
+        """Convert an assignment into the array-backed representation.
+
+        :param assignment: the assignment to convert
+        :param participants: the participants of the assignment in index order,
+        defaults to ordering them by UID
+
+        :return: the converted assignment
+        """
+        if participants is None:
+            participant_set: set[Participant] = set()
+            for group in assignment[0]:
+                participant_set |= group
+            participants = sorted(
+                participant_set, key=lambda participant: participant.uid
+            )
+        indices: dict[Participant, int] = {
+            participant: index for index, participant in enumerate(participants)
+        }
+
+        group_ids: np.ndarray = np.zeros(
+            (len(assignment), len(participants)), dtype=np.intp
+        )
+        for iteration_index, iteration in enumerate(assignment):
+            for group_index, group in enumerate(iteration):
+                group_ids[
+                    iteration_index,
+                    np.fromiter(map(indices.__getitem__, group), dtype=np.intp),
+                ] = group_index
+        return cls(participants, group_ids, len(assignment[0]))
+
+    def to_assignment(self) -> Assignment:
+        """Convert back into the set-based representation.
+
+        :return: the assignment, with groups in the order of their indices
+        """
+        return [
+            [
+                {self.participants[index] for index in group_members.tolist()}
+                for group_members in iteration_members
+            ]
+            for iteration_members in self.members
+        ]
+
+    @property
+    def iteration_count(self) -> int:
+        """Number of iterations.
+
+        :return: the number of iterations
+        """
+        return len(self.members)
+
+    @property
+    def groups_per_iteration(self) -> int:
+        """Number of groups in each iteration.
+
+        :return: the number of groups in each iteration
+        """
+        return len(self.members[0])
+
+    def group_members(self, iteration: int, participant: int) -> np.ndarray:
+        """Return the members of the group of a participant.
+
+        :param iteration: the index of the iteration
+        :param participant: the index of the participant
+
+        :return: the member indices of the group, including the participant
+        """
+        return self.members[iteration][self.group_ids[iteration, participant]]
+
+    def random_swap(self, random: Random) -> tuple[int, int, int]:
+        """Pick a random swap of two participants from different groups of the same iteration.
+
+        :param random: the source of randomness
+
+        :return: the index of the iteration and the indices of the two participants to swap
+        """
+        iteration: int = random.randrange(self.iteration_count)
+        iteration_members: list[np.ndarray] = self.members[iteration]
+        group_1: int = random.randrange(len(iteration_members))
+        position_1: int = random.randrange(len(iteration_members[group_1]))
+
+        group_2: int = -1
+        while group_2 in (-1, group_1):
+            group_2 = random.randrange(len(iteration_members))
+        position_2: int = random.randrange(len(iteration_members[group_2]))
+
+        return (
+            iteration,
+            int(iteration_members[group_1][position_1]),
+            int(iteration_members[group_2][position_2]),
+        )
+
+    def swap(self, iteration: int, participant_1: int, participant_2: int) -> None:
+        """Swap two participants between their groups in place.
+
+        :param iteration: the index of the iteration
+        :param participant_1: the index of the first participant
+        :param participant_2: the index of the second participant
+        """
+        group_1: int = self.group_ids[iteration, participant_1]
+        group_2: int = self.group_ids[iteration, participant_2]
+        position_1: int = self.positions[iteration, participant_1]
+        position_2: int = self.positions[iteration, participant_2]
+
+        self.members[iteration][group_1][position_1] = participant_2
+        self.members[iteration][group_2][position_2] = participant_1
+        self.group_ids[iteration, participant_1] = group_2
+        self.group_ids[iteration, participant_2] = group_1
+        self.positions[iteration, participant_1] = position_2
+        self.positions[iteration, participant_2] = position_1
+
+    def copy(self) -> "CompactAssignment":
+        """Return an independent copy sharing only the participant list.
+
+        :return: the copy
+        """
+        copied: CompactAssignment = CompactAssignment.__new__(CompactAssignment)
+        copied.participants = self.participants
+        copied.group_ids = self.group_ids.copy()
+        copied.positions = self.positions.copy()
+        copied.members = [
+            [group_members.copy() for group_members in iteration_members]
+            for iteration_members in self.members
+        ]
+        return copied
@@ -0,0 +1,243 @@
+"""Combinatorial design constructor module"""
+
+from random import Random
+import numpy as np
+from data_structures import Assignment, Participant
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.meeting_matrix import MeetingMatrix
+
+
+class DesignConstructor:
+    """Constructs assignments in which no pair of participants meets twice, as far as the shape allows.
+
+    Ignoring attributes, finding such an assignment is the social golfer problem, and for many shapes
+    known combinatorial designs solve it without any search:
+
+    - Groups of two are taken from a round-robin table, which pairs every participant
+      with every other one exactly once over `participants - 1` iterations.
+    - Otherwise the participants form a grid of rows of `groups_per_iteration` participants and
+      the participant in row `r` and column `c` joins group `c + t * r` in the iteration of multiplier `t`.
+      If the number of groups is a prime power and no group is larger than the number of groups,
+      the arithmetic of the finite field of that order makes the iterations of all multipliers
+      an affine resolvable design: two participants meet in at most one of them.
+      A full grid adds the rows themselves as one more iteration.
+      For other numbers of groups the arithmetic is taken modulo the number of groups
+      and only multipliers that keep the iterations free of repeats are used.
+
+    If more iterations are requested than the design provides, the design is repeated with a new
+    random arrangement of the participants, which serves as a starting point for a search.
+
+    :param random_instance: An instance of Random that will be used
+    instead of an automatically generated one as a source or randomness, defaults to None
+    """
+
+    __random: Random
+
+    def __init__(self, random_instance: Random = None):
+        self.__random = Random() if random_instance is None else random_instance
+
+    def find_assignment(
+        self, participants: set[Participant], groups_per_iteration: int, iterations: int
+    ) -> Assignment:
+        """Return an assignment built from a combinatorial design,
+        repeating the design with new arrangements where it has too few iterations.
+
+        :param participants: The set of participants to distribute into groups
+        :param groups_per_iteration: The number of groups per iteration
+        :param iterations: The number of iterations to generate groups for
+
+        :return: The generated assignment
+        """
+        order: list[Participant] = sorted(
+            participants, key=lambda participant: participant.uid
+        )
+        design: np.ndarray = self.design_group_ids(len(order), groups_per_iteration)
+        group_ids: np.ndarray = np.zeros((iterations, len(order)), dtype=np.intp)
+        for start in range(0, iterations, len(design)):
+            arrangement: list[int] = list(range(len(order)))
+            self.__random.shuffle(arrangement)
+            count: int = min(len(design), iterations - start)
+            group_ids[start : start + count, arrangement] = design[:count]
+        return CompactAssignment(order, group_ids, groups_per_iteration).to_assignment()
+
+    def find_design(
+        self, participants: set[Participant], groups_per_iteration: int, iterations: int
+    ) -> Assignment | None:
+        """Return an assignment in which no pair of participants meets twice, if a design provides one.
+
+        :param participants: The set of participants to distribute into groups
+        :param groups_per_iteration: The number of groups per iteration
+        :param iterations: The number of iterations to generate groups for
+
+        :return: The generated assignment, None if no known design has enough iterations
+        """
+        assignment: Assignment = self.find_assignment(
+            participants, groups_per_iteration, iterations
+        )
+        meetings: MeetingMatrix = MeetingMatrix.from_compact(
+            CompactAssignment.from_assignment(assignment)
+        )
+        return assignment if meetings.repeat_count == 0 else None
+
+    def design_group_ids(
+        self, participant_count: int, groups_per_iteration: int
+    ) -> np.ndarray:
+        """Return all iterations of the design for a shape, in which no pair meets twice.
+
+        :param participant_count: The number of participants
+        :param groups_per_iteration: The number of groups per iteration
+
+        :return: The group of every participant in every iteration of the design,
+        indexed by [iteration, participant], at least one iteration
+        """
+        if participant_count == 2 * groups_per_iteration and participant_count > 2:
+            return self.__round_robin(participant_count)
+        rows, columns = np.divmod(np.arange(participant_count), groups_per_iteration)
+        row_count: int = int(rows[-1]) + 1 if participant_count > 0 else 0
+        prime, power = self.__prime_power(groups_per_iteration)
+        if power > 0 and row_count <= groups_per_iteration:
+            addition, multiplication = self.__field_tables(prime, power)
+        else:
+            addition, multiplication = self.__ring_tables(groups_per_iteration)
+        multipliers: list[int] = self.__compatible_multipliers(
+            multiplication, groups_per_iteration, row_count
+        )
+        design: list[np.ndarray] = [
+            addition[columns, multiplication[multiplier, rows % groups_per_iteration]]
+            for multiplier in multipliers
+        ]
+        if power > 0 and participant_count == groups_per_iteration**2:
+            design.append(rows)
+        return np.array(design, dtype=np.intp)
+
+    def __round_robin(self, participant_count: int) -> np.ndarray:
+        """Return the iterations of a round-robin table for an even number of participants.
+
+        The last participant stays fixed while the others rotate around a circle,
+        pairing participants on opposite sides of the circle.
+
+        :param participant_count: The even number of participants
+
+        :return: The group of every participant in every iteration, indexed by [iteration, participant]
+        """
+        circle: int = participant_count - 1
+        group_ids: np.ndarray = np.zeros((circle, participant_count), dtype=np.intp)
+        for iteration in range(circle):
+            group_ids[iteration, [iteration, circle]] = 0
+            for offset in range(1, participant_count // 2):
+                group_ids[
+                    iteration,
+                    [(iteration + offset) % circle, (iteration - offset) % circle],
+                ] = offset
+        return group_ids
+
+    def __compatible_multipliers(
+        self, multiplication: np.ndarray, order: int, row_count: int
+    ) -> list[int]:
+        """Select multipliers whose iterations share no pair of participants.
+
+        Two participants in rows differing by `d` meet in the iterations of two multipliers `t` and `u`
+        only if `(t - u) * d` is zero, so a multiplier is kept if this product is nonzero
+        for all kept multipliers and all row differences. In a field every multiplier is kept.
+
+        :param multiplication: The multiplication table of the arithmetic
+        :param order: The number of elements of the arithmetic
+        :param row_count: The number of rows of the grid
+
+        :return: The selected multipliers, at least the first one
+        """
+        multipliers: list[int] = [0]
+        differences: np.ndarray = np.arange(1, row_count) % order
+        for multiplier in range(1, order):
+            gaps: np.ndarray = (multiplier - np.array(multipliers)) % order
+            if not (multiplication[np.ix_(gaps, differences)] == 0).any():
+                multipliers.append(multiplier)
+        return multipliers
+
+    def __prime_power(self, number: int) -> tuple[int, int]:
+        """Decompose a number into a prime and an exponent.
+
+        :param number: The number to decompose
+
+        :return: The prime and the exponent, an exponent of 0 if the number is no prime power
+        """
+        if number < 2:
+            return number, 0
+        prime: int = next(
+            divisor for divisor in range(2, number + 1) if number % divisor == 0
+        )
+        power: int = 0
+        while number % prime == 0:
+            number //= prime
+            power += 1
+        return prime, power if number == 1 else 0
+
+    def __ring_tables(self, order: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the addition and multiplication tables of the integers modulo a number.
+
+        :param order: The modulus
+
+        :return: The addition and the multiplication table
+        """
+        elements: np.ndarray = np.arange(order)
+        return (
+            np.add.outer(elements, elements) % order,
+            np.multiply.outer(elements, elements) % order,
+        )
+
+    def __field_tables(self, prime: int, power: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the addition and multiplication tables of the finite field of a prime power order.
+
+        Elements are polynomials of degree below `power` over the integers modulo `prime`,
+        numbered by reading their coefficients as digits in base `prime`.
+        Products are reduced modulo the first monic polynomial of degree `power`
+        under which every nonzero element has an inverse.
+
+        :param prime: The characteristic of the field
+        :param power: The degree of the field over its prime field
+
+        :return: The addition and the multiplication table
+        """
+        order: int = prime**power
+        if power == 1:
+            return self.__ring_tables(order)
+        digits: np.ndarray = (
+            np.arange(order)[:, np.newaxis] // prime ** np.arange(power)
+        ) % prime
+        places: np.ndarray = prime ** np.arange(power)
+        addition: np.ndarray = ((digits[:, np.newaxis] + digits) % prime) @ places
+        for modulus in range(order):
+            multiplication: np.ndarray = (
+                self.__polynomial_products(digits, digits[modulus], prime) @ places
+            )
+            if all(
+                len(set(multiplication[element, 1:])) == order - 1
+                for element in range(1, order)
+            ):
+                return addition, multiplication
+        raise ValueError(f"No field of order {order} found")
+
+    def __polynomial_products(
+        self, digits: np.ndarray, modulus: np.ndarray, prime: int
+    ) -> np.ndarray:
+        """Multiply all pairs of polynomials modulo a monic polynomial.
+
+        :param digits: The coefficients of every polynomial, lowest degree first
+        :param modulus: The coefficients of the monic modulus below its leading term
+        :param prime: The modulus of the coefficients
+
+        :return: The coefficients of every product, indexed by [factor, factor, degree]
+        """
+        power: int = digits.shape[1]
+        products: np.ndarray = np.zeros(
+            (len(digits), len(digits), 2 * power - 1), dtype=np.intp
+        )
+        for degree_1 in range(power):
+            products[:, :, degree_1 : degree_1 + power] += (
+                digits[:, np.newaxis, degree_1, np.newaxis] * digits[np.newaxis, :, :]
+            )
+        for degree in range(2 * power - 2, power - 1, -1):
+            leading: np.ndarray = products[:, :, degree, np.newaxis]
+            products[:, :, degree - power : degree] -= leading * modulus
+            products[:, :, degree] = 0
+        return products[:, :, :power] % prime
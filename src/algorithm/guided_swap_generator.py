@@ -0,0 +1,144 @@
+"""Module containing the guided generator of swap proposals."""
+
+from random import Random
+import numpy as np
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.meeting_matrix import MeetingMatrix
+from algorithm.objective_function import ObjectiveFunction
+from algorithm.participant_encoding import ParticipantEncoding
+
+
+class GuidedSwapGenerator:
+    """Proposes swaps that are biased towards the groups and participants causing the most cost.
+
+    The contribution of every group to the weighted cost is kept up to date after each applied swap.
+    A guided proposal picks its first group in proportion to these contributions and a second group of the same
+    iteration uniformly. Inside both groups, members are picked in proportion to how many other members share
+    their attribute values and how many other members they meet repeatedly, plus one.
+    The remaining proposals are uniform, so every swap stays reachable.
+
+    :param objective: the objective function the group costs are calculated with
+    :param state: the assignment, changed in place by the search
+    :param meetings: the meeting matrix of the assignment, changed in place by the search,
+    only needed if guided swaps are proposed
+    :param mix_weight: the weight of the mix cost, defaults to 1
+    :param diversity_weight: the weight of the diversity cost, defaults to 1
+    :param guided_rate: the fraction of guided proposals,
+    the group costs are only calculated if it is positive, defaults to 0.5
+    """
+
+    guided_rate: float
+
+    __objective: ObjectiveFunction
+    __state: CompactAssignment
+    __meetings: MeetingMatrix | None
+    __encoding: ParticipantEncoding
+    __mix_weight: float
+    __diversity_weight: float
+    __group_costs: np.ndarray
+
+    def __init__(
+        self,
+        objective: ObjectiveFunction,
+        state: CompactAssignment,
+        meetings: MeetingMatrix | None,
+        mix_weight: float = 1.0,
+        diversity_weight: float = 1.0,
+        guided_rate: float = 0.5,
+    ) -> None:
+        self.guided_rate = guided_rate
+        self.__objective = objective
+        self.__state = state
+        self.__meetings = meetings
+        self.__encoding = objective.encode_state(state)
+        self.__mix_weight = mix_weight
+        self.__diversity_weight = diversity_weight
+        self.__group_costs = np.zeros(
+            (state.iteration_count, state.groups_per_iteration)
+        )
+        if guided_rate > 0:
+            self.__group_costs = objective.group_costs(
+                state, mix_weight, diversity_weight
+            )
+
+    @property
+    def group_costs(self) -> np.ndarray:
+        """Contribution of every group to the weighted cost.
+
+        :return: the weighted cost of every group, indexed by [iteration, group]
+        """
+        return self.__group_costs
+
+    def propose(self, random: Random) -> tuple[int, int, int]:
+        """Propose a swap of two participants from different groups of the same iteration.
+
+        :param random: the source of randomness
+
+        :return: the index of the iteration and the indices of the two participants to swap
+        """
+        if self.guided_rate <= 0 or random.random() >= self.guided_rate:
+            return self.__state.random_swap(random)
+
+        flat_costs: np.ndarray = np.cumsum(self.__group_costs.ravel())
+        if flat_costs[-1] <= 0:
+            return self.__state.random_swap(random)
+        iteration, group_1 = divmod(
+            int(np.searchsorted(flat_costs, random.random() * flat_costs[-1], "right")),
+            self.__state.groups_per_iteration,
+        )
+        group_2: int = random.randrange(self.__state.groups_per_iteration - 1)
+        if group_2 >= group_1:
+            group_2 += 1
+
+        return (
+            iteration,
+            self.__pick_member(random, self.__state.members[iteration][group_1]),
+            self.__pick_member(random, self.__state.members[iteration][group_2]),
+        )
+
+    def update(self, participant_1: int, participant_2: int) -> None:
+        """Update the group costs after a swap has been applied to the assignment and the meeting matrix.
+
+        Besides the two groups of the swap, the groups of both participants in the other iterations
+        change, since they meet different participants now.
+
+        :param participant_1: the index of the first swapped participant
+        :param participant_2: the index of the second swapped participant
+        """
+        touched: set[tuple[int, int]] = set()
+        for touched_iteration in range(self.__state.iteration_count):
+            for participant in (participant_1, participant_2):
+                touched.add(
+                    (
+                        touched_iteration,
+                        int(self.__state.group_ids[touched_iteration, participant]),
+                    )
+                )
+        for touched_iteration, group in touched:
+            self.__group_costs[touched_iteration, group] = self.__objective.group_cost(
+                self.__state,
+                touched_iteration,
+                group,
+                self.__mix_weight,
+                self.__diversity_weight,
+            )
+
+    def __pick_member(self, random: Random, members: np.ndarray) -> int:
+        """Pick a member of a group, preferring members that cause cost.
+
+        :param random: the source of randomness
+        :param members: the indices of the group members
+
+        :return: the index of the picked member
+        """
+        slots: np.ndarray = self.__encoding.slots[members]
+        histogram: np.ndarray = self.__encoding.histogram(members)
+        shared_values: np.ndarray = (
+            (histogram[slots] - 1) * self.__encoding.slot_weights[slots]
+        ).sum(axis=1)
+        if self.__meetings is not None:
+            shared_values += self.__meetings.member_repeat_counts(members)
+        weights: np.ndarray = np.cumsum(shared_values + 1)
+        return int(
+            members[np.searchsorted(weights, random.random() * weights[-1], "right")]
+        )
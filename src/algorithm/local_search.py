@@ -0,0 +1,151 @@
+"""Module containing the moves of a local search on one assignment."""
+
+from random import Random
+import numpy as np
+from algorithm.best_assignment_tracker import BestAssignmentTracker
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.guided_swap_generator import GuidedSwapGenerator
+from algorithm.meeting_matrix import MeetingMatrix
+from algorithm.move_set import (
+    Move,
+    MoveSet,
+    apply_swap,
+    evaluate_move,
+    track_meetings,
+)
+from algorithm.movement_penalty import MovementPenalty
+from algorithm.objective_function import ObjectiveFunction
+
+
+class LocalSearch:
+    """Proposes, evaluates and applies the moves of a local search.
+
+    The meeting matrix, if the moves need it, the guided swap generator and the selection probabilities
+    of the move set are kept in sync with the assignment.
+
+    :param objective: the objective function the moves are evaluated with
+    :param state: the assignment, changed in place by taken moves
+    :param penalty: the penalty for moving participants away from a reference assignment,
+    added to the cost change of every move
+    :param mix_weight: the weight of the mix cost, defaults to 1
+    :param diversity_weight: the weight of the diversity cost, defaults to 1
+    :param guided_rate: the fraction of swaps proposed by a :class:`GuidedSwapGenerator`,
+    the others are picked uniformly, defaults to 0
+    :param move_set: the move types to draw the moves from, its selection probabilities start over,
+    by default only swaps are proposed (optional)
+    """
+
+    __objective: ObjectiveFunction
+    __state: CompactAssignment
+    __penalty: MovementPenalty
+    __meetings: MeetingMatrix | None
+    __generator: GuidedSwapGenerator
+    __move_set: MoveSet | None
+    #: the weights of the mix cost and the diversity cost
+    __weights: tuple[float, float]
+
+    def __init__(
+        self,
+        objective: ObjectiveFunction,
+        state: CompactAssignment,
+        penalty: MovementPenalty,
+        mix_weight: float = 1.0,
+        diversity_weight: float = 1.0,
+        guided_rate: float = 0.0,
+        move_set: MoveSet | None = None,
+    ) -> None:
+        self.__objective = objective
+        self.__state = state
+        self.__penalty = penalty
+        self.__meetings = track_meetings(state, move_set, guided_rate)
+        self.__generator = GuidedSwapGenerator(
+            objective, state, self.__meetings, mix_weight, diversity_weight, guided_rate
+        )
+        self.__move_set = move_set
+        self.__weights = (mix_weight, diversity_weight)
+        if move_set is not None:
+            move_set.reset(state)
+
+    def cost(self, group_ids: np.ndarray | None = None) -> float:
+        """Return the weighted cost of an assignment of the participants, including the penalty.
+
+        :param group_ids: the group of every participant, indexed by [iteration, participant],
+        defaults to the current assignment
+
+        :return: the cost
+        """
+        state: CompactAssignment = self.__state
+        if group_ids is not None:
+            state = CompactAssignment(
+                state.participants, group_ids, state.groups_per_iteration
+            )
+        return self.__objective.calculate_state_cost(
+            state, *self.__weights
+        ) + self.__penalty.cost(state.group_ids)
+
+    def propose(self, random: Random) -> tuple[int, Move, float]:
+        """Propose the next move and evaluate it.
+
+        As in :func:`evaluate_move`, all swaps of the move except the last one are applied afterwards,
+        the caller either takes the move with :meth:`take` or undoes it with :meth:`undo`.
+
+        :param random: the source of randomness
+
+        :return: the index of the move type that proposed the move, 0 without a move set,
+        the swaps of the move and the change of the cost including the penalty
+        """
+        move_type: int = 0
+        if self.__move_set is None:
+            move: Move = [self.__generator.propose(random)]
+        else:
+            move_type, move = self.__move_set.propose(
+                self.__state, self.__meetings, random
+            )
+        delta: float = self.__penalty.delta(self.__state, move)
+        delta += evaluate_move(
+            self.__objective,
+            self.__state,
+            self.__meetings,
+            move,
+            *self.__weights,
+        )
+        return move_type, move, delta
+
+    def take(self, move: Move, best: BestAssignmentTracker) -> None:
+        """Take a proposed move by applying its last swap.
+
+        :param move: the swaps of the move, all but the last one applied
+        :param best: the tracker of the best assignment, the swaps are recorded in it
+        """
+        apply_swap(self.__state, self.__meetings, *move[-1])
+        for swap in move:
+            best.record_swap(*swap)
+            if self.__generator.guided_rate > 0:
+                self.__generator.update(*swap[1:])
+
+    def undo(self, move: Move) -> None:
+        """Undo the swaps a proposed move applied for its evaluation.
+
+        :param move: the swaps of the move, all but the last one applied
+        """
+        for swap in reversed(move[:-1]):
+            apply_swap(self.__state, self.__meetings, *swap)
+
+    def apply(self, move: Move, best: BestAssignmentTracker) -> None:
+        """Apply a move that has been undone after its evaluation.
+
+        :param move: the swaps of the move, none of them applied
+        :param best: the tracker of the best assignment, the swaps are recorded in it
+        """
+        for swap in move[:-1]:
+            apply_swap(self.__state, self.__meetings, *swap)
+        self.take(move, best)
+
+    def record(self, move_type: int, improved: bool) -> None:
+        """Record the outcome of a move in the selection probabilities of the move set, if there is one.
+
+        :param move_type: the index of the move type of the move
+        :param improved: whether the move was taken and lowered the cost
+        """
+        if self.__move_set is not None:
+            self.__move_set.record(move_type, improved)
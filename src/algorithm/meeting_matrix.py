@@ -0,0 +1,276 @@
+"""Module containing the meeting matrix."""
+
+import numpy as np
+from algorithm.compact_assignment import CompactAssignment
+
+
+class MeetingMatrix:
+    """Counts how many times each pair of participants meets in the same group.
+
+    Participants are referred to by their index.
+    Rosters of up to :attr:`DENSE_LIMIT` participants are stored as a dense matrix,
+    larger rosters store one dictionary of nonzero counts per participant.
+    Alongside the counts the number of repeated encounters is maintained,
+    that is the sum of `count choose 2` over all pairs of participants.
+
+    :param participant_count: the number of participants
+    :param sparse: whether to use the sparse storage, defaults to deciding by the number of participants
+    """
+
+    DENSE_LIMIT: int = 3000
+
+    __is_sparse: bool
+    # only the storage selected by __is_sparse is filled, the other one stays empty
+    __dense: np.ndarray
+    __sparse: list[dict[int, int]]
+    __repeat_count: int
+
+    def __init__(self, participant_count: int, sparse: bool | None = None) -> None:
+        self.__is_sparse = (
+            participant_count > self.DENSE_LIMIT if sparse is None else sparse
+        )
+        self.__dense = np.zeros((0, 0), dtype=np.int32)
+        self.__sparse = []
+        if self.__is_sparse:
+            self.__sparse = [dict() for _ in range(participant_count)]
+        else:
+            self.__dense = np.zeros(
+                (participant_count, participant_count), dtype=np.int32
+            )
+        self.__repeat_count = 0
+
+    @classmethod
+    def from_compact(
+        cls, assignment: CompactAssignment, sparse: bool | None = None
+    ) -> "MeetingMatrix":
+        """Create a meeting matrix counting the meetings of a given assignment.
+
+        :param assignment: the assignment to count the meetings of
+        :param sparse: whether to use the sparse storage, defaults to deciding by the number of participants
+
+        :return: the created meeting matrix
+        """
+        matrix: MeetingMatrix = cls(len(assignment.participants), sparse)
+        for iteration_members in assignment.members:
+            for group_members in iteration_members:
+                matrix.add_group(group_members)
+        return matrix
+
+    @property
+    def repeat_count(self) -> int:
+        """Number of repeated encounters, the sum of `count choose 2` over all pairs.
+
+        :return: the number of repeated encounters
+        """
+        return self.__repeat_count
+
+    def count(self, participant_1: int, participant_2: int) -> int:
+        """Return how many times two participants meet.
+
+        :param participant_1: the index of the first participant
+        :param participant_2: the index of the second participant
+
+        :return: the number of groups containing both participants
+        """
+        if self.__is_sparse:
+            return self.__sparse[participant_1].get(participant_2, 0)
+        return int(self.__dense[participant_1, participant_2])
+
+    def partner_count(self, participant: int) -> int:
+        """Return the number of distinct participants a participant meets.
+
+        :param participant: the index of the participant
+
+        :return: the number of other participants sharing at least one group with the participant
+        """
+        if self.__is_sparse:
+            return len(self.__sparse[participant])
+        return int(np.count_nonzero(self.__dense[participant]))
+
+    def repeat_partners(self, participant: int) -> np.ndarray:
+        """Return the participants a participant meets more than once.
+
+        :param participant: the index of the participant
+
+        :return: the indices of the participants meeting the participant at least twice
+        """
+        if self.__is_sparse:
+            return np.array(
+                [
+                    other
+                    for other, count in self.__sparse[participant].items()
+                    if count > 1
+                ],
+                dtype=np.intp,
+            )
+        return np.flatnonzero(self.__dense[participant] > 1)
+
+    def member_repeat_counts(self, members: np.ndarray) -> np.ndarray:
+        """Return how often each member of a group meets the other members in other groups.
+
+        :param members: the indices of the group members, all of them meet each other in the group
+
+        :return: for every member the sum of `count - 1` over the other members
+        """
+        if self.__is_sparse:
+            counts: np.ndarray = np.array(
+                [self.__row_sum(member, members) for member in members.tolist()]
+            )
+        else:
+            counts = self.__dense[np.ix_(members, members)].sum(axis=1)
+        return counts - (len(members) - 1)
+
+    def add_group(self, members: np.ndarray) -> None:
+        """Count a meeting between every pair of members of a group.
+
+        :param members: the indices of the group members
+        """
+        self.__update_group(members, 1)
+
+    def remove_group(self, members: np.ndarray) -> None:
+        """Remove the meetings between every pair of members of a previously added group.
+
+        :param members: the indices of the group members
+        """
+        self.__update_group(members, -1)
+
+    def swap_delta(
+        self,
+        participant_1: int,
+        members_1: np.ndarray,
+        participant_2: int,
+        members_2: np.ndarray,
+    ) -> int:
+        """Return the change of the number of repeated encounters caused by swapping two participants.
+
+        :param participant_1: the index of the first participant
+        :param members_1: the members of the current group of the first participant
+        :param participant_2: the index of the second participant
+        :param members_2: the members of the current group of the second participant
+
+        :return: the number of repeated encounters after the swap minus the number before
+        """
+        others_1: np.ndarray = members_1[members_1 != participant_1]
+        others_2: np.ndarray = members_2[members_2 != participant_2]
+        if not self.__is_sparse:
+            return self.row_swap_delta(
+                self.__dense[participant_1],
+                others_1,
+                self.__dense[participant_2],
+                others_2,
+            )
+        return (
+            self.__row_sum(participant_1, others_2)
+            - self.__row_sum(participant_1, others_1)
+            + self.__row_sum(participant_2, others_1)
+            - self.__row_sum(participant_2, others_2)
+            + len(others_1)
+            + len(others_2)
+        )
+
+    @staticmethod
+    def row_swap_delta(
+        row_1: np.ndarray, others_1: np.ndarray, row_2: np.ndarray, others_2: np.ndarray
+    ) -> int:
+        """Return the change of the number of repeated encounters caused by swapping two participants,
+        given the meeting counts of both swapped participants.
+
+        Leaving a group lowers each of its counts by one, which removes `count - 1` repeated encounters,
+        joining a group raises each of its counts by one, which adds `count` repeated encounters.
+
+        :param row_1: the meeting counts of the first participant with every participant
+        :param others_1: the other members of the group of the first participant
+        :param row_2: the meeting counts of the second participant with every participant
+        :param others_2: the other members of the group of the second participant
+
+        :return: the number of repeated encounters after the swap minus the number before
+        """
+        return (
+            int(
+                row_1[others_2].sum()
+                - row_1[others_1].sum()
+                + row_2[others_1].sum()
+                - row_2[others_2].sum()
+            )
+            + len(others_1)
+            + len(others_2)
+        )
+
+    def swap(
+        self,
+        participant_1: int,
+        members_1: np.ndarray,
+        participant_2: int,
+        members_2: np.ndarray,
+    ) -> None:
+        """Update the counts for swapping two participants between their groups.
+
+        :param participant_1: the index of the first participant
+        :param members_1: the members of the group of the first participant before the swap
+        :param participant_2: the index of the second participant
+        :param members_2: the members of the group of the second participant before the swap
+        """
+        self.__repeat_count += self.swap_delta(
+            participant_1, members_1, participant_2, members_2
+        )
+        others_1: np.ndarray = members_1[members_1 != participant_1]
+        others_2: np.ndarray = members_2[members_2 != participant_2]
+        self.__update_row(participant_1, others_1, -1)
+        self.__update_row(participant_1, others_2, 1)
+        self.__update_row(participant_2, others_2, -1)
+        self.__update_row(participant_2, others_1, 1)
+
+    def __row_sum(self, index: int, others: np.ndarray) -> int:
+        """Return the summed meeting counts of one participant with several others.
+
+        :param index: the index of the participant
+        :param others: the indices of the others
+
+        :return: the summed counts
+        """
+        if self.__is_sparse:
+            row: dict[int, int] = self.__sparse[index]
+            return sum(row.get(other, 0) for other in others.tolist())
+        return int(self.__dense[index, others].sum())
+
+    def __update_row(self, index: int, others: np.ndarray, change: int) -> None:
+        """Change the meeting counts of one participant with several others symmetrically,
+        without touching the number of repeated encounters.
+
+        :param index: the index of the participant
+        :param others: the indices of the others
+        :param change: the value to add to each count
+        """
+        if not self.__is_sparse:
+            self.__dense[index, others] += change
+            self.__dense[others, index] += change
+            return
+        for other in others.tolist():
+            for row, key in ((index, other), (other, index)):
+                count: int = self.__sparse[row].get(key, 0) + change
+                if count == 0:
+                    del self.__sparse[row][key]
+                else:
+                    self.__sparse[row][key] = count
+
+    def __update_group(self, indices: np.ndarray, change: int) -> None:
+        """Change the meeting counts of every pair of the given participants.
+
+        :param indices: the indices of the participants
+        :param change: 1 to add a meeting, -1 to remove one
+        """
+        if self.__is_sparse:
+            for position, index in enumerate(indices.tolist()):
+                others: np.ndarray = indices[position + 1 :]
+                counts: int = self.__row_sum(index, others)
+                self.__repeat_count += counts if change > 0 else len(others) - counts
+                self.__update_row(index, others, change)
+            return
+
+        block: np.ndarray = self.__dense[np.ix_(indices, indices)]
+        pair_counts: int = int(block.sum() - np.trace(block)) // 2
+        pair_total: int = len(indices) * (len(indices) - 1) // 2
+        self.__repeat_count += pair_counts if change > 0 else pair_total - pair_counts
+        block += change
+        np.fill_diagonal(block, 0)
+        self.__dense[np.ix_(indices, indices)] = block
@@ -0,0 +1,347 @@
+"""Module containing the move types of local searches and their adaptive selection."""
+
+from abc import ABC, abstractmethod
+from random import Random
+import numpy as np
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.meeting_matrix import MeetingMatrix
+from algorithm.objective_function import ObjectiveFunction
+
+#: A move as a sequence of swaps, each given by the index of the iteration and the indices of two participants
+type Move = list[tuple[int, int, int]]
+
+
+def apply_swap(
+    state: CompactAssignment,
+    meetings: MeetingMatrix | None,
+    iteration: int,
+    participant_1: int,
+    participant_2: int,
+) -> None:
+    """Swap two participants in place, keeping the meeting matrix in sync.
+
+    A swap is its own inverse, applying it again undoes it.
+
+    :param state: the assignment to change
+    :param meetings: the meeting matrix of the assignment, None if the search does not keep one
+    :param iteration: the index of the iteration
+    :param participant_1: the index of the first participant
+    :param participant_2: the index of the second participant
+    """
+    if meetings is not None:
+        meetings.swap(
+            participant_1,
+            state.group_members(iteration, participant_1),
+            participant_2,
+            state.group_members(iteration, participant_2),
+        )
+    state.swap(iteration, participant_1, participant_2)
+
+
+def evaluate_move(
+    objective: ObjectiveFunction,
+    state: CompactAssignment,
+    meetings: MeetingMatrix | None,
+    move: Move,
+    mix_weight: float,
+    diversity_weight: float,
+) -> float:
+    """Return the change of the weighted cost caused by a move.
+
+    All swaps of the move except the last one are applied to evaluate the following ones,
+    the caller either applies the last swap or undoes the others in reverse order.
+
+    :param objective: the objective function
+    :param state: the assignment
+    :param meetings: the meeting matrix of the assignment, None if the search does not keep one
+    :param move: the swaps of the move
+    :param mix_weight: the weight of the mix cost
+    :param diversity_weight: the weight of the diversity cost
+
+    :return: the weighted cost after the move minus the weighted cost before the move
+    """
+    delta: float = 0.0
+    for position, swap in enumerate(move):
+        delta += objective.swap_delta(state, *swap, mix_weight, diversity_weight)
+        if position < len(move) - 1:
+            apply_swap(state, meetings, *swap)
+    return delta
+
+
+class MoveType(ABC):
+    """Provides an interface for a kind of move of a local search.
+
+    Every move is expressed as a sequence of swaps that are applied in order,
+    so the cost change of a move is the sum of the incremental cost changes of its swaps.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Name of the move type.
+
+        :return: the name
+        """
+
+    @property
+    def uses_meetings(self) -> bool:
+        """Whether the move type proposes its moves from the meeting matrix.
+
+        :return: true if the search has to keep a meeting matrix, false otherwise
+        """
+        return False
+
+    def applies_to(self, state: CompactAssignment) -> bool:
+        """Check whether the move type can produce moves for assignments of the shape of a given one.
+
+        :param state: the assignment
+
+        :return: true if moves can be proposed, false otherwise
+        """
+        return state.groups_per_iteration > 1
+
+    @abstractmethod
+    def propose(
+        self, state: CompactAssignment, meetings: MeetingMatrix | None, random: Random
+    ) -> Move | None:
+        """Propose a random move.
+
+        :param state: the current assignment
+        :param meetings: the meeting matrix of the assignment, only None if the move type does not use it
+        :param random: the source of randomness
+
+        :return: the swaps of the move, None if no move of this type fits the assignment right now
+        """
+
+
+class SwapMove(MoveType):
+    """Swaps two participants between two groups of one iteration."""
+
+    @property
+    def name(self) -> str:
+        return "swap"
+
+    def propose(
+        self, state: CompactAssignment, meetings: MeetingMatrix | None, random: Random
+    ) -> Move | None:
+        return [state.random_swap(random)]
+
+
+class RotationMove(MoveType):
+    """Rotates three participants of three different groups of one iteration,
+    each of them moves into the group of the next one."""
+
+    @property
+    def name(self) -> str:
+        return "rotation"
+
+    def applies_to(self, state: CompactAssignment) -> bool:
+        return state.groups_per_iteration > 2
+
+    def propose(
+        self, state: CompactAssignment, meetings: MeetingMatrix | None, random: Random
+    ) -> Move | None:
+        iteration: int = random.randrange(state.iteration_count)
+        groups: list[int] = random.sample(range(state.groups_per_iteration), 3)
+        first, second, third = (
+            int(random.choice(state.members[iteration][group])) for group in groups
+        )
+        # the first swap moves the first participant, the second swap the other two
+        return [(iteration, first, second), (iteration, second, third)]
+
+
+class RepeatedPairMove(MoveType):
+    """Separates a pair of participants meeting repeatedly in two of their shared iterations,
+    by swapping one of them out of the shared group in the first iteration
+    and the other one in the second iteration."""
+
+    @property
+    def name(self) -> str:
+        return "repeated pair"
+
+    @property
+    def uses_meetings(self) -> bool:
+        return True
+
+    def applies_to(self, state: CompactAssignment) -> bool:
+        return state.groups_per_iteration > 1 and state.iteration_count > 1
+
+    def propose(
+        self, state: CompactAssignment, meetings: MeetingMatrix | None, random: Random
+    ) -> Move | None:
+        if meetings is None:
+            raise ValueError("Repeated pair moves need the meeting matrix")
+        participant_1: int = random.randrange(len(state.participants))
+        partners: np.ndarray = meetings.repeat_partners(participant_1)
+        if len(partners) == 0:
+            return None
+        participant_2: int = int(random.choice(partners))
+        shared: list[int] = np.flatnonzero(
+            state.group_ids[:, participant_1] == state.group_ids[:, participant_2]
+        ).tolist()
+        first_iteration, second_iteration = random.sample(shared, 2)
+        return [
+            (
+                first_iteration,
+                participant_1,
+                self.__outsider(state, first_iteration, participant_1, random),
+            ),
+            (
+                second_iteration,
+                participant_2,
+                self.__outsider(state, second_iteration, participant_2, random),
+            ),
+        ]
+
+    def __outsider(
+        self, state: CompactAssignment, iteration: int, participant: int, random: Random
+    ) -> int:
+        """Pick a random participant outside the group of a participant.
+
+        :param state: the assignment
+        :param iteration: the index of the iteration
+        :param participant: the index of the participant
+        :param random: the source of randomness
+
+        :return: the index of a participant of another group of the iteration
+        """
+        group: int = random.randrange(state.groups_per_iteration - 1)
+        if group >= state.group_ids[iteration, participant]:
+            group += 1
+        return int(random.choice(state.members[iteration][group]))
+
+
+class MoveSet:
+    """Selects the move type of every step of a local search with adaptive probabilities.
+
+    Each move type keeps an exponential moving average of how often its moves improve the cost,
+    and is selected in proportion to that average, but never with less than `min_probability`.
+    Move types that do not apply to an assignment are never selected for it.
+
+    :param move_types: the available move types, defaults to a swap, a rotation and a repeated pair move
+    :param adaptive: whether to adapt the probabilities, otherwise all move types are equally likely,
+    defaults to True
+    :param min_probability: the lowest selection probability of an applicable move type, defaults to 0.05
+    :param adaptation_rate: the weight of the latest result in the moving averages, defaults to 0.01
+    """
+
+    move_types: list[MoveType]
+    adaptive: bool
+    min_probability: float
+    adaptation_rate: float
+
+    __success_rates: list[float]
+    __applicable: list[bool]
+
+    def __init__(
+        self,
+        move_types: list[MoveType] | None = None,
+        adaptive: bool = True,
+        min_probability: float = 0.05,
+        adaptation_rate: float = 0.01,
+    ) -> None:
+        self.move_types = (
+            [SwapMove(), RotationMove(), RepeatedPairMove()]
+            if move_types is None
+            else move_types
+        )
+        self.adaptive = adaptive
+        self.min_probability = min_probability
+        self.adaptation_rate = adaptation_rate
+        self.__success_rates = [1.0] * len(self.move_types)
+        self.__applicable = [True] * len(self.move_types)
+
+    def reset(self, state: CompactAssignment) -> None:
+        """Reset the probabilities for a new search.
+
+        :param state: the initial assignment of the search
+        """
+        self.__success_rates = [1.0] * len(self.move_types)
+        self.__applicable = [
+            move_type.applies_to(state) for move_type in self.move_types
+        ]
+
+    @property
+    def probabilities(self) -> list[float]:
+        """Selection probability of every move type.
+
+        :return: the probabilities, in the order of the move types
+        """
+        # the lists are tiny and read every step, plain Python is faster than numpy here
+        applicable_count: int = sum(self.__applicable)
+        rates: list[float] = [
+            rate if applicable else 0.0
+            for rate, applicable in zip(self.__success_rates, self.__applicable)
+        ]
+        if not self.adaptive or sum(rates) <= 0:
+            rates = [float(applicable) for applicable in self.__applicable]
+        floor: float = min(self.min_probability, 1 / applicable_count)
+        spread: float = (1 - floor * applicable_count) / sum(rates)
+        return [
+            floor + spread * rate if applicable else 0.0
+            for rate, applicable in zip(rates, self.__applicable)
+        ]
+
+    @property
+    def uses_meetings(self) -> bool:
+        """Whether any move type proposes its moves from the meeting matrix.
+
+        :return: true if the search has to keep a meeting matrix, false otherwise
+        """
+        return any(move_type.uses_meetings for move_type in self.move_types)
+
+    def propose(
+        self, state: CompactAssignment, meetings: MeetingMatrix | None, random: Random
+    ) -> tuple[int, Move]:
+        """Select a move type and propose a move of it,
+        falling back to the first move type if the selected one has no move for the assignment.
+
+        :param state: the current assignment
+        :param meetings: the meeting matrix of the assignment, None if no move type uses it
+        :param random: the source of randomness
+
+        :return: the index of the move type that proposed the move and the swaps of the move
+
+        :raises ValueError: if neither the selected nor the first move type proposes a move
+        """
+        index: int = random.choices(
+            range(len(self.move_types)), weights=self.probabilities
+        )[0]
+        move: Move | None = self.move_types[index].propose(state, meetings, random)
+        if move is None:
+            index = 0
+            move = self.move_types[0].propose(state, meetings, random)
+        if move is None:
+            raise ValueError(
+                f"The first move type {self.move_types[0].name} proposed no move"
+            )
+        return index, move
+
+    def record(self, index: int, improved: bool) -> None:
+        """Record the result of a move.
+
+        :param index: the index of the move type of the move
+        :param improved: whether the move was accepted and lowered the cost
+        """
+        self.__success_rates[index] += self.adaptation_rate * (
+            float(improved) - self.__success_rates[index]
+        )
+
+
+def track_meetings(
+    state: CompactAssignment, move_set: MoveSet | None, guided_rate: float
+) -> MeetingMatrix | None:
+    """Build the meeting matrix of an assignment if a search proposes moves from it.
+
+    The mix cost does not depend on the meeting matrix, only repeated pair moves
+    and the member weights of guided swaps do, so other searches skip building and updating it.
+
+    :param state: the initial assignment of the search
+    :param move_set: the move types of the search, None for swaps proposed by the guided generator
+    :param guided_rate: the fraction of guided swaps of the search
+
+    :return: the meeting matrix, None if the search does not need it
+    """
+    if guided_rate > 0 or (move_set is not None and move_set.uses_meetings):
+        return MeetingMatrix.from_compact(state)
+    return None
@@ -0,0 +1,100 @@
+"""Module containing the penalty for moving participants away from a reference assignment."""
+
+import numpy as np
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.move_set import Move
+from data_structures import Assignment, Participant
+
+
+class MovementPenalty:
+    """Penalizes the placements of an assignment that differ from a reference assignment.
+
+    Participants that are not part of the reference assignment are never penalized.
+
+    :param state: the assignment, its participants define the indices of the penalty
+    :param reference_assignment: the assignment whose placements should be kept,
+    with the same number of iterations, None to penalize nothing
+    :param penalty: the cost added if every participant is placed in a different group
+    than in the reference assignment in every iteration, added proportionally for fewer changed placements
+    """
+
+    __reference_group_ids: np.ndarray | None
+    __weight: float
+
+    def __init__(
+        self,
+        state: CompactAssignment,
+        reference_assignment: Assignment | None,
+        penalty: float,
+    ) -> None:
+        self.__reference_group_ids = None
+        self.__weight = penalty / state.group_ids.size
+        if reference_assignment is not None:
+            self.__reference_group_ids = self.__group_ids(state, reference_assignment)
+
+    def cost(self, group_ids: np.ndarray) -> float:
+        """Return the penalty for the placements that differ from the reference assignment.
+
+        :param group_ids: the group of every participant, indexed by [iteration, participant]
+
+        :return: the penalty
+        """
+        if self.__reference_group_ids is None:
+            return 0.0
+        changed: np.ndarray = (self.__reference_group_ids >= 0) & (
+            group_ids != self.__reference_group_ids
+        )
+        return self.__weight * int(changed.sum())
+
+    def delta(self, state: CompactAssignment, move: Move) -> float:
+        """Return the change of the penalty caused by a move, without applying it.
+
+        :param state: the assignment before the move
+        :param move: the swaps of the move
+
+        :return: the penalty after the move minus the penalty before the move
+        """
+        if self.__reference_group_ids is None:
+            return 0.0
+        moved_groups: dict[tuple[int, int], int] = {}
+        for iteration, participant_1, participant_2 in move:
+            group_1: int = moved_groups.get(
+                (iteration, participant_1), state.group_ids[iteration, participant_1]
+            )
+            moved_groups[(iteration, participant_1)] = moved_groups.get(
+                (iteration, participant_2), state.group_ids[iteration, participant_2]
+            )
+            moved_groups[(iteration, participant_2)] = group_1
+        changes: int = 0
+        for (iteration, participant), group in moved_groups.items():
+            reference: int = self.__reference_group_ids[iteration, participant]
+            if reference >= 0:
+                changes += int(group != reference) - int(
+                    state.group_ids[iteration, participant] != reference
+                )
+        return self.__weight * changes
+
+    def __group_ids(
+        self, state: CompactAssignment, reference_assignment: Assignment
+    ) -> np.ndarray:
+        """Return the group of every participant of an assignment in the reference assignment.
+
+        :param state: The assignment
+        :param reference_assignment: The reference assignment, with the same number of iterations
+
+        :return: The group of every participant in the reference assignment, -1 for participants
+        that are not part of it, indexed by [iteration, participant]
+        """
+        indices: dict[Participant, int] = {
+            participant: index for index, participant in enumerate(state.participants)
+        }
+        reference_group_ids: np.ndarray = np.full_like(state.group_ids, -1)
+        for iteration_index, iteration in enumerate(reference_assignment):
+            for group_index, group in enumerate(iteration):
+                members: list[int] = [
+                    indices[participant]
+                    for participant in group
+                    if participant in indices
+                ]
+                reference_group_ids[iteration_index, members] = group_index
+        return reference_group_ids
@@ -1,7 +1,11 @@
 """Module containing the objective function."""
 
-from math import comb, sqrt
-from data_structures import Participant, Group, Assignment
+from math import comb
+import numpy as np
+from data_structures import Participant, Assignment
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.meeting_matrix import MeetingMatrix
+from algorithm.participant_encoding import ParticipantEncoding
 
 
 class ObjectiveFunction:
@@ -11,6 +15,7 @@ class ObjectiveFunction:
     __attribute_weights: dict[str, float]
     __cached_mix_cost_max: float
     __cached_diversity_cost_max: float
+    __encoding: ParticipantEncoding | None
 
     def __init__(
         self, attribute_classes: list[str], attribute_weights: dict[str, float] = dict()
@@ -24,6 +29,7 @@ class ObjectiveFunction:
         self.__cached_mix_cost_max = -1.0
         self.__cached_diversity_cost_max = -1.0
         self.__attribute_weights = attribute_weights
+        self.__encoding = None
 
     def average_meetings(self, assignment: Assignment) -> float:
         """Returns the average number of distinct participants a participant meets in a given assignment.
@@ -31,29 +37,21 @@ class ObjectiveFunction:
         :param assignment: the assignment to calculate the average for
         :return: the average number of participants met
         """
+        compact: CompactAssignment = CompactAssignment.from_assignment(assignment)
+        meetings: MeetingMatrix = MeetingMatrix.from_compact(compact)
 
-        participants: set[Participant] = set()
-        for group in assignment[0]:
-            participants = participants.union(group)
-
-        groups: list[Group] = [
-            group for iteration in assignment for group in iteration
-        ]  # list of all groups in assignment
-
-        amounts_met: list[int] = []
-
-        for participant in participants:
-            people_met: set[Participant] = set()
-            for group in groups:
-                if participant in group:
-                    people_met = people_met.union(group)
-            amounts_met.append(len(people_met) - 1)
+        amounts_met: list[int] = [
+            meetings.partner_count(participant)
+            for participant in range(len(compact.participants))
+        ]
 
         return sum(amounts_met) / len(amounts_met)
 
     def mix_cost(self, assignment: Assignment) -> float:
         """Calculate a score based on the number of different participants each participant meets
 
+        Every pair of groups from different iterations sharing `n` members adds `max(n - 1, 0)`.
+
         :param assignment: the group assignment to evaluate
 
         :return: a score between 0 and 1, the lower the better
@@ -61,16 +59,12 @@ class ObjectiveFunction:
         if len(assignment) == 1:
             return 0
 
-        cost: float = 0.0
-        groups: list[Group] = [
-            group for iteration in assignment for group in iteration
-        ]  # list of all groups in assignment
-
-        for i, group in enumerate(groups):
-            for j in range(i + 1, len(groups)):
-                cost += max(len(group.intersection(groups[j])) - 1, 0)
-
-        return cost / self.__mix_cost_max(assignment)
+        state: CompactAssignment = CompactAssignment.from_assignment(assignment)
+        return float(
+            self.__batch_overlap_costs(
+                state.group_ids[np.newaxis], state.groups_per_iteration
+            )[0]
+        ) / self.__mix_cost_max(assignment)
 
     def __mix_cost_max(self, sample_assignment: Assignment) -> float:
         """Return an upper bound for the unnormalized mix cost,
@@ -81,19 +75,26 @@ class ObjectiveFunction:
         :return: the upper bound,
           holds for all assignments of the same shape
         """
-        if len(sample_assignment) == 1:
-            self.__cached_mix_cost_max = 1
-            return 1
-
         if self.__cached_mix_cost_max < 0.0:
-            participant_count: int = 0
-            for group in sample_assignment[0]:
-                participant_count += len(group)
-            self.__cached_mix_cost_max = (
-                comb(len(sample_assignment), 2) * participant_count
+            self.__cached_mix_cost_max = self.__mix_bound(
+                len(sample_assignment),
+                sum(len(group) for group in sample_assignment[0]),
             )
         return self.__cached_mix_cost_max
 
+    def __mix_bound(self, iteration_count: int, participant_count: int) -> float:
+        """Calculate the upper bound for the unnormalized mix cost.
+
+        Two iterations add at most one less than the number of participants per group,
+        so the number of participants bounds the cost of every pair of iterations.
+
+        :param iteration_count: the number of iterations
+        :param participant_count: the number of participants
+
+        :return: the upper bound, at least 1
+        """
+        return max(comb(iteration_count, 2) * participant_count, 1)
+
     def diversity_cost(self, assignment: Assignment) -> float:
         """Calculate a score between 0 and 1 based on how diverse groups are, the lower the better.
 
@@ -101,69 +102,72 @@ class ObjectiveFunction:
 
         :return: a score between 0 and 1, the lower the better
         """
-        return self.__total_group_diversity_cost(
-            assignment
+        encoding: ParticipantEncoding = self.encode(assignment)
+        histograms: np.ndarray = encoding.group_histograms(
+            encoding.group_ids(assignment), len(assignment[0])
+        )
+        return float(
+            self.histogram_diversity_costs(encoding, histograms).sum()
         ) / self.__diversity_cost_max(assignment)
 
-    def __total_group_diversity_cost(
-        self, assignment: Assignment, match_group: Group | None = None
-    ) -> float:
-        """Calculate the summed unnormalized diversity cost of all groups in an assignment.
+    def encode(self, assignment: Assignment) -> ParticipantEncoding:
+        """Return the encoding of the participants of an assignment, ordered by UID,
+        reusing the stored encoding when it covers the same participants.
 
         :param assignment: the assignment
-        :param match_group: a group of participants to search for matching attribute values in,
-        used only to calculate bounds, defaults to None
-        :return: the sum of the unnormalized diversity costs of all groups in the assignment
-        """
-        cost: float = 0.0
-        for iteration in assignment:
-            for group in iteration:
-                cost += self.__group_diversity_cost(group, match_group)
-        return cost
-
-    def __group_diversity_cost(
-        self, group: Group, match_group: Group | None = None
-    ) -> float:
-        """Calculate the unnormalized diversity cost of a single group.
-
-        :param group: the group to calculate the cost for
-        :param match_group: a second group of participants to search for matching attribute values,
-        used only to calculate bounds, defaults to None
-
-        :return: the calculated diversity cost (or bound on diversity cost)
-        """
-        group_cost: float = 0.0
-        for attribute in self.__attribute_classes:
-            values_checked: set[str] = set()
-            for participant in group:
-                value: str = participant.get_attribute(attribute)
-                if value not in values_checked:
-                    values_checked.add(value)
-                    group_cost += self.__value_diversity_cost(
-                        attribute, value, group if match_group is None else match_group
-                    )
-        return sqrt(group_cost - len(group))
 
-    def __value_diversity_cost(self, attribute: str, value: str, group: Group) -> float:
-        """Calculate the cost contribution of a single value.
+        :return: the encoding of the participants and the considered attributes
+        """
+        participants: set[Participant] = set()
+        for group in assignment[0]:
+            participants |= group
 
-        :param attribute: the attribute to check in
-        :param value: the value to check for
-        :param group: the group to check against
+        if self.__encoding is None or not self.__encoding.matches(participants):
+            self.__encoding = ParticipantEncoding(
+                sorted(participants, key=lambda participant: participant.uid),
+                self.__attribute_classes,
+                self.__attribute_weights,
+            )
+        return self.__encoding
+
+    def encode_state(self, state: CompactAssignment) -> ParticipantEncoding:
+        """Return the encoding matching the participant order of an array-backed assignment,
+        reusing the stored encoding when possible.
+
+        :param state: the array-backed assignment
 
-        :return: the calculated cost contribution
+        :return: the encoding of the participants and the considered attributes
         """
+        if self.__encoding is None or (
+            self.__encoding.participants is not state.participants
+            and self.__encoding.participants != state.participants
+        ):
+            self.__encoding = ParticipantEncoding(
+                state.participants, self.__attribute_classes, self.__attribute_weights
+            )
+        return self.__encoding
+
+    def histogram_diversity_costs(
+        self,
+        encoding: ParticipantEncoding,
+        histograms: np.ndarray,
+        sizes: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Calculate the unnormalized diversity costs of groups from their value counts.
 
-        count: float = 0.0
-        weight: float = 1
+        The cost of a group is the square root of its weighted sum of squared value counts
+        over all attributes, minus the size of the group.
 
-        if attribute in self.__attribute_weights.keys():
-            weight = self.__attribute_weights[attribute]
+        :param encoding: the encoding the value counts refer to
+        :param histograms: value counts as returned by :meth:`ParticipantEncoding.group_histograms`,
+        the last axis is indexed by slot
+        :param sizes: the sizes of the groups, derived from the value counts if not given
 
-        for participant in group:
-            if participant.get_attribute(attribute) == value:
-                count += 1.0
-        return weight * count**2
+        :return: the diversity cost of every group, in the shape of the histograms without the last axis
+        """
+        if sizes is None:
+            sizes = encoding.histogram_sizes(histograms)
+        return np.sqrt(np.maximum(histograms**2 @ encoding.slot_weights - sizes, 0.0))
 
     def __diversity_cost_max(self, sample_assignment: Assignment) -> float:
         """Return an upper bound for the unnormalized diversity cost,
@@ -174,17 +178,58 @@ class ObjectiveFunction:
         :return: the upper bound,
         holds for all assignments of the same shape that contain the same participants
         """
-        participants: set[Participant] = set()
-        for group in sample_assignment[0]:
-            participants = participants.union(group)
-
         if self.__cached_diversity_cost_max < 0.0:
-            self.__cached_diversity_cost_max = self.__total_group_diversity_cost(
-                sample_assignment, participants
+            encoding: ParticipantEncoding = self.encode(sample_assignment)
+            self.__cached_diversity_cost_max = self.__diversity_bound(
+                encoding,
+                encoding.group_histograms(
+                    encoding.group_ids(sample_assignment), len(sample_assignment[0])
+                ),
             )
 
         return self.__cached_diversity_cost_max
 
+    def __diversity_bound(
+        self, encoding: ParticipantEncoding, histograms: np.ndarray
+    ) -> float:
+        """Calculate the upper bound for the unnormalized diversity cost.
+
+        For every value present in a group the bound counts all participants with that value.
+
+        :param encoding: the encoding the value counts refer to
+        :param histograms: the value counts of all groups of a sample assignment
+
+        :return: the upper bound, 1 if the bound would be 0
+        """
+        bound_histograms: np.ndarray = np.where(histograms > 0, encoding.slot_totals, 0)
+        bound: float = float(
+            self.histogram_diversity_costs(
+                encoding, bound_histograms, encoding.histogram_sizes(histograms)
+            ).sum()
+        )
+        return bound if bound > 0.0 else 1.0
+
+    def __ensure_bounds(
+        self,
+        encoding: ParticipantEncoding,
+        group_ids: np.ndarray,
+        groups_per_iteration: int,
+    ) -> None:
+        """Calculate the bounds from a sample assignment unless they are stored already.
+
+        :param encoding: the encoding of the participants
+        :param group_ids: the group of every participant in the sample, indexed by [iteration, participant]
+        :param groups_per_iteration: the number of groups in each iteration
+        """
+        if self.__cached_diversity_cost_max < 0.0:
+            self.__cached_diversity_cost_max = self.__diversity_bound(
+                encoding, encoding.group_histograms(group_ids, groups_per_iteration)
+            )
+        if self.__cached_mix_cost_max < 0.0:
+            self.__cached_mix_cost_max = self.__mix_bound(
+                group_ids.shape[0], group_ids.shape[1]
+            )
+
     def recalculate_bounds(self, sample_assignment: Assignment) -> None:
         """Recalculate the bounds based on a given sample assignment
 
@@ -197,6 +242,192 @@ class ObjectiveFunction:
         self.__cached_mix_cost_max = -1.0
         self.__mix_cost_max(sample_assignment)
 
+    def swap_delta(
+        self,
+        state: CompactAssignment,
+        iteration: int,
+        participant_1: int,
+        participant_2: int,
+        mix_weight: float = 1.0,
+        diversity_weight: float = 1.0,
+    ) -> float:
+        """Return the change of the weighted cost caused by swapping two participants
+        between their groups in one iteration, without applying the swap.
+
+        Only the two touched groups and their overlaps with the groups of the two swapped participants
+        in the other iterations are evaluated, so this is much cheaper than scoring the whole neighbor.
+
+        :param state: the assignment before the swap
+        :param iteration: the index of the iteration in which the swap happens
+        :param participant_1: the index of the first participant to swap
+        :param participant_2: the index of the second participant to swap,
+        in a different group than the first
+        :param mix_weight: the weight of the mix cost, defaults to 1
+        :param diversity_weight: the weight of the diversity cost, defaults to 1
+
+        :return: the weighted cost after the swap minus the weighted cost before the swap
+        """
+        encoding: ParticipantEncoding = self.encode_state(state)
+        self.__ensure_bounds(encoding, state.group_ids, state.groups_per_iteration)
+        members_1: np.ndarray = state.group_members(iteration, participant_1)
+        members_2: np.ndarray = state.group_members(iteration, participant_2)
+
+        mix_delta: float = 0.0
+        if state.iteration_count > 1:
+            mix_delta = (
+                self.__overlap_swap_delta(
+                    state, iteration, participant_1, members_1, participant_2, members_2
+                )
+                / self.__cached_mix_cost_max
+            )
+
+        histograms: np.ndarray = np.stack(
+            [encoding.histogram(members_1), encoding.histogram(members_2)]
+        )
+        swapped_histograms: np.ndarray = histograms.copy()
+        swapped_histograms[0, encoding.slots[participant_1]] -= 1
+        swapped_histograms[0, encoding.slots[participant_2]] += 1
+        swapped_histograms[1, encoding.slots[participant_2]] -= 1
+        swapped_histograms[1, encoding.slots[participant_1]] += 1
+        diversity_delta: float = (
+            float(
+                self.histogram_diversity_costs(encoding, swapped_histograms).sum()
+                - self.histogram_diversity_costs(encoding, histograms).sum()
+            )
+            / self.__cached_diversity_cost_max
+        )
+
+        return (mix_delta * mix_weight + diversity_delta * diversity_weight) / (
+            mix_weight + diversity_weight
+        )
+
+    def group_cost(
+        self,
+        state: CompactAssignment,
+        iteration: int,
+        group: int,
+        mix_weight: float = 1.0,
+        diversity_weight: float = 1.0,
+    ) -> float:
+        """Return the contribution of one group to the weighted cost.
+
+        The mix cost of a pair of overlapping groups is split evenly between both groups,
+        so the contributions of all groups add up to the weighted cost.
+
+        :param state: the assignment
+        :param iteration: the index of the iteration of the group
+        :param group: the index of the group
+        :param mix_weight: the weight of the mix cost, defaults to 1
+        :param diversity_weight: the weight of the diversity cost, defaults to 1
+
+        :return: the weighted cost of the group
+        """
+        encoding: ParticipantEncoding = self.encode_state(state)
+        self.__ensure_bounds(encoding, state.group_ids, state.groups_per_iteration)
+        members: np.ndarray = state.members[iteration][group]
+        diversity: float = (
+            float(
+                self.histogram_diversity_costs(
+                    encoding, encoding.histogram(members)[np.newaxis]
+                )[0]
+            )
+            / self.__cached_diversity_cost_max
+        )
+        mix: float = (
+            self.__group_overlap_cost(state, iteration, members)
+            / 2
+            / self.__cached_mix_cost_max
+        )
+        return (mix * mix_weight + diversity * diversity_weight) / (
+            mix_weight + diversity_weight
+        )
+
+    def group_costs(
+        self,
+        state: CompactAssignment,
+        mix_weight: float = 1.0,
+        diversity_weight: float = 1.0,
+    ) -> np.ndarray:
+        """Return the contribution of every group to the weighted cost, see :meth:`group_cost`.
+
+        :param state: the assignment
+        :param mix_weight: the weight of the mix cost, defaults to 1
+        :param diversity_weight: the weight of the diversity cost, defaults to 1
+
+        :return: the weighted cost of every group, indexed by [iteration, group]
+        """
+        return np.array(
+            [
+                [
+                    self.group_cost(
+                        state, iteration, group, mix_weight, diversity_weight
+                    )
+                    for group in range(state.groups_per_iteration)
+                ]
+                for iteration in range(state.iteration_count)
+            ]
+        )
+
+    def __overlap_swap_delta(
+        self,
+        state: CompactAssignment,
+        iteration: int,
+        participant_1: int,
+        members_1: np.ndarray,
+        participant_2: int,
+        members_2: np.ndarray,
+    ) -> int:
+        """Return the change of the unnormalized mix cost caused by swapping two participants.
+
+        In every other iteration in which both participants are in different groups,
+        each swapped participant leaves the overlap of its group with its group there
+        and joins the overlap of the other swapped group with it.
+        Leaving an overlap of `n` members lowers the cost by one if `n > 1`,
+        joining an overlap of `n` members raises it by one if `n > 0`.
+
+        :param state: the assignment before the swap
+        :param iteration: the index of the iteration of the swap
+        :param participant_1: the index of the first participant
+        :param members_1: the members of the group of the first participant
+        :param participant_2: the index of the second participant
+        :param members_2: the members of the group of the second participant
+
+        :return: the unnormalized mix cost after the swap minus the one before the swap
+        """
+        targets_1: np.ndarray = state.group_ids[:, participant_1, np.newaxis]
+        targets_2: np.ndarray = state.group_ids[:, participant_2, np.newaxis]
+        ids_1: np.ndarray = state.group_ids[:, members_1]
+        ids_2: np.ndarray = state.group_ids[:, members_2]
+        changes: np.ndarray = (
+            ((ids_1 == targets_2).sum(axis=1) > 0).astype(np.int64)
+            + ((ids_2 == targets_1).sum(axis=1) > 0)
+            - ((ids_1 == targets_1).sum(axis=1) > 1)
+            - ((ids_2 == targets_2).sum(axis=1) > 1)
+        )
+        separated: np.ndarray = targets_1[:, 0] != targets_2[:, 0]
+        separated[iteration] = False
+        return int(changes[separated].sum())
+
+    def __group_overlap_cost(
+        self, state: CompactAssignment, iteration: int, members: np.ndarray
+    ) -> int:
+        """Return the unnormalized mix cost of the overlaps of one group with the groups of all other iterations.
+
+        Spread over `d` groups of another iteration, the members add `len(members) - d`.
+
+        :param state: the assignment
+        :param iteration: the index of the iteration of the group
+        :param members: the members of the group
+
+        :return: the summed mix cost of the pairs of groups the group is part of
+        """
+        if members.size == 0:
+            return 0
+        shared: np.ndarray = (
+            np.diff(np.sort(state.group_ids[:, members], axis=1), axis=1) == 0
+        ).sum(axis=1)
+        return int(shared.sum() - shared[iteration])
+
     def calculate_weighted_cost(
         self,
         assignment: Assignment,
@@ -217,3 +448,103 @@ class ObjectiveFunction:
             self.mix_cost(assignment) * mix_weight
             + self.diversity_cost(assignment) * diversity_weight
         ) / (mix_weight + diversity_weight)
+
+    def calculate_state_cost(
+        self,
+        state: CompactAssignment,
+        mix_weight: float = 1.0,
+        diversity_weight: float = 1.0,
+    ) -> float:
+        """Return the weighted cost of an array-backed assignment,
+        see :meth:`calculate_weighted_cost`.
+
+        :param state: the assignment to calculate the cost for
+        :param mix_weight: the weight of the mix cost, defaults to 1
+        :param diversity_weight: the weight of the diversity cost, defaults to 1
+
+        :return: the weighted cost, between 0 and 1, lower is better
+        """
+        return float(
+            self.batch_weighted_costs(
+                self.encode_state(state),
+                state.group_ids[np.newaxis],
+                state.groups_per_iteration,
+                mix_weight,
+                diversity_weight,
+            )[0]
+        )
+
+    def batch_weighted_costs(
+        self,
+        encoding: ParticipantEncoding,
+        group_ids: np.ndarray,
+        groups_per_iteration: int,
+        mix_weight: float = 1.0,
+        diversity_weight: float = 1.0,
+    ) -> np.ndarray:
+        """Return the weighted costs of a stack of assignments in one vectorized pass.
+
+        Bounds that are not stored yet are calculated from the first assignment of the stack.
+        Memory use grows with the size of the stack, so very large stacks should be split into chunks.
+
+        :param encoding: the encoding of the participants
+        :param group_ids: the group of every participant,
+        indexed by [assignment, iteration, participant index of the encoding]
+        :param groups_per_iteration: the number of groups in each iteration
+        :param mix_weight: the weight of the mix cost, defaults to 1
+        :param diversity_weight: the weight of the diversity cost, defaults to 1
+
+        :return: the weighted cost of every assignment, between 0 and 1, lower is better
+        """
+        assignment_count, iteration_count, participant_count = group_ids.shape
+        self.__ensure_bounds(encoding, group_ids[0], groups_per_iteration)
+        histograms: np.ndarray = encoding.group_histograms(
+            group_ids.reshape(-1, participant_count), groups_per_iteration
+        ).reshape(
+            assignment_count, iteration_count, groups_per_iteration, encoding.slot_count
+        )
+        diversity_costs: np.ndarray = (
+            self.histogram_diversity_costs(encoding, histograms).sum(axis=(1, 2))
+            / self.__cached_diversity_cost_max
+        )
+
+        mix_costs: np.ndarray = np.zeros(assignment_count)
+        if iteration_count > 1:
+            mix_costs = (
+                self.__batch_overlap_costs(group_ids, groups_per_iteration)
+                / self.__cached_mix_cost_max
+            )
+
+        return (mix_costs * mix_weight + diversity_costs * diversity_weight) / (
+            mix_weight + diversity_weight
+        )
+
+    def __batch_overlap_costs(
+        self, group_ids: np.ndarray, groups_per_iteration: int
+    ) -> np.ndarray:
+        """Return the unnormalized mix costs of a stack of assignments.
+
+        Two iterations add `max(n - 1, 0)` for every pair of groups sharing `n` members,
+        which sums to the number of participants minus the number of nonempty overlaps.
+
+        :param group_ids: the group of every participant, indexed by [assignment, iteration, participant]
+        :param groups_per_iteration: the number of groups in each iteration
+
+        :return: the unnormalized mix cost of every assignment
+        """
+        assignment_count, iteration_count, participant_count = group_ids.shape
+        overlap_count: int = groups_per_iteration**2
+        offsets: np.ndarray = np.arange(assignment_count)[:, np.newaxis] * overlap_count
+        costs: np.ndarray = np.zeros(assignment_count, dtype=np.int64)
+        for first in range(iteration_count):
+            for second in range(first + 1, iteration_count):
+                keys: np.ndarray = (
+                    group_ids[:, first] * groups_per_iteration
+                    + group_ids[:, second]
+                    + offsets
+                )
+                overlaps: np.ndarray = np.bincount(
+                    keys.ravel(), minlength=assignment_count * overlap_count
+                ).reshape(assignment_count, overlap_count)
+                costs += participant_count - np.count_nonzero(overlaps, axis=1)
+        return costs
@@ -0,0 +1,574 @@
+"""Parallel tempering algorithm module"""
+
+from concurrent.futures import ProcessPoolExecutor
+from math import exp
+import multiprocessing
+from random import Random
+from threading import Event
+import time
+from typing import Callable, Self
+import numpy as np
+from algorithm.annealing_checkpoint import CheckpointOptions
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.move_set import MoveSet
+from algorithm.objective_function import ObjectiveFunction
+from algorithm.progress_reporter import ProgressReporter, ReportingOptions
+from algorithm.random_algorithm import RandomAlgorithm
+from algorithm.search_algorithm import SearchAlgorithm
+from algorithm.stopping_criteria import StoppingCriteria, StoppingOptions
+from algorithm.stratified_seeder import StratifiedSeeder
+from algorithm.temperature_calibration import calibrate_temperature
+from data_structures import Assignment, Participant
+
+
+class ParallelTemperingAlgorithm(SearchAlgorithm):
+    """Contains the calculations for generating group assignments using parallel tempering.
+
+    Several replicas are optimized at a fixed ladder of temperatures.
+    After every segment of `exchange_interval` cycles neighboring replicas may exchange their assignments,
+    which lets good assignments found at high temperatures sink down to the coldest replica.
+    The temperatures span the same range as the schedule of :class:`SimulatedAnnealingAlgorithm`.
+
+    :param attributes: A list of attributes that are considered for optimization
+    :param random_instance: An instance of Random that will be used
+    instead of an automatically generated one as a source or randomness, defaults to None
+    :param attribute_weights: a dict mapping attributes to float weights, defaults to an empty dict
+    :param replica_count: the number of replicas, defaults to 8
+    :param exchange_interval: the number of cycles between two exchange rounds, defaults to 100
+    :param process_count: the number of processes the replicas are spread across,
+    1 runs all replicas in the calling thread, which runs in a child process of :meth:`find_assignment_in_process`
+    have to use, as that process cannot start processes of its own, defaults to 1
+    """
+
+    __random: Random
+    replica_count: int
+    exchange_interval: int
+    process_count: int
+
+    def __init__(
+        self,
+        attributes: list[str],
+        random_instance: Random = None,
+        attribute_weights: dict[str, float] = dict(),
+        replica_count: int = 8,
+        exchange_interval: int = 100,
+        process_count: int = 1,
+    ):
+        random: Random = Random() if random_instance is None else random_instance
+        super().__init__(attributes, random, attribute_weights)
+        self.__random = random
+        self.replica_count = replica_count
+        self.exchange_interval = exchange_interval
+        self.process_count = process_count
+
+    def with_seed(self, seed: int) -> Self:
+        """Return an algorithm with the same settings and a new random source.
+
+        :param seed: the seed of the random source
+
+        :return: the new algorithm
+        """
+        return type(self)(
+            self.attributes,
+            Random(seed),
+            self.attribute_weights,
+            self.replica_count,
+            self.exchange_interval,
+            self.process_count,
+        )
+
+    def find_assignment(
+        self,
+        participants: set[Participant],
+        groups_per_iteration: int,
+        iterations: int,
+        max_cycles: int | None,
+        intitial_temperature: float = 1,
+        temperature_scaling: float = 15,
+        mix_weight: float = 1,
+        diversity_weight: float = 1,
+        progress_callback: Callable[[int, int], None] | None = None,
+        stopping: StoppingOptions | None = None,
+        auto_temperature: bool = False,
+        guided_rate: float = 0.0,
+        move_set: MoveSet | None = None,
+        stratified_start: bool = False,
+        initial_assignment: Assignment | None = None,
+        reference_assignment: Assignment | None = None,
+        movement_penalty: float = 0.0,
+        checkpointing: CheckpointOptions | None = None,
+        cancellation: Event | None = None,
+        cancellation_interval: int = 100,
+        reporting: ReportingOptions | None = None,
+    ) -> Assignment:
+        """Return a group assignment generated using parallel tempering.
+
+        Takes the arguments of :meth:`SimulatedAnnealingAlgorithm.find_assignment` in the same order,
+        so both algorithms can be driven by the same caller.
+        The run ends after `max_cycles` cycles or once the time budget has passed, whichever comes first,
+        or earlier once the lowest cost stalls, the coldest replica accepts too few moves within a segment
+        or the run is cancelled, which is recorded in :attr:`cancelled`. All criteria are checked at the exchange
+        rounds. Without a time budget and a cancellation the result does not depend on the number of processes.
+        The cost of the returned assignment and the cycle of the exchange round it was found at
+        are stored in :attr:`best_cost` and :attr:`best_cycle`, 0 meaning the initial assignments.
+
+        :param participants: the set of participants to distribute into groups
+        :param groups_per_iteration: the number of groups in each iteration
+        :param iterations: the total number of iterations
+        :param max_cycles: the maximum number of cycles every replica runs, None to only use the time budget
+        :param intitial_temperature: the temperature of the hottest replica, deafults to 1
+        :param temperature_scaling: the temperature of the coldest replica is
+        `exp(-temperature_scaling)` times the one of the hottest, defaults to 15
+        :param mix_weight: the weight of the mix cost when evaluating assignments,
+        only the size of this number compared to the diversity weight matters, defaults to 1
+        :param diversity_weight: the weight of the diversity cost, defaults to 1
+        :param progress_callback: gets called with current progress and total progress,
+        at the start and the end of the run and at most once per progress interval in between (optional)
+        :param stopping: the time budget and the convergence criteria of the run, the acceptance rate
+        is measured over the segments instead of the acceptance window, defaults to only the cycle limit (optional)
+        :param auto_temperature: derive the initial temperature and the temperature scaling from sampled swaps
+        of the first replica instead of using the given values, see :func:`calibrate_temperature`, defaults to False
+        :param guided_rate: ignored, the replicas propose uniform swaps
+        :param move_set: ignored, the replicas propose uniform swaps
+        :param stratified_start: start the first replica from an assignment of a :class:`StratifiedSeeder`
+        instead of a random one, defaults to False
+        :param initial_assignment: an assignment of the participants to start the first replica from
+        instead of a generated one (optional)
+        :param reference_assignment: has to be None, parallel tempering has no movement penalty
+        :param movement_penalty: ignored without a reference assignment
+        :param checkpointing: has to be empty, parallel tempering can neither continue from nor emit checkpoints
+        (optional)
+        :param cancellation: stop the run once this event is set, checked at every exchange round,
+        it may be set from another thread (optional)
+        :param cancellation_interval: ignored, the cancellation is checked at every exchange round
+        :param reporting: the callback receiving :class:`ProgressReport` objects about the coldest replica
+        and the interval of all progress reports, defaults to an interval of 0.05 seconds (optional)
+
+        :return: the assignment with the lowest cost seen at any exchange round
+
+        :raises ValueError: if neither a maximum number of cycles nor a time budget is given,
+        or if a reference assignment, a checkpoint or a checkpoint callback is given
+        """
+        criteria: StoppingCriteria = StoppingCriteria(
+            max_cycles, stopping, cancellation, 1
+        )
+        if reference_assignment is not None or (
+            checkpointing is not None
+            and (
+                checkpointing.resume_from is not None
+                or checkpointing.callback is not None
+            )
+        ):
+            raise ValueError(
+                "Parallel tempering supports neither reference assignments nor checkpoints"
+            )
+        self.cancelled = False
+        objective: ObjectiveFunction = ObjectiveFunction(
+            self.attributes, self.attribute_weights
+        )
+        states: list[CompactAssignment] = self.__initial_states(
+            objective,
+            participants,
+            groups_per_iteration,
+            iterations,
+            stratified_start,
+            initial_assignment,
+        )
+        if auto_temperature:
+            calibration: tuple[float, float] | None = calibrate_temperature(
+                objective,
+                states[0],
+                self.__random,
+                mix_weight,
+                diversity_weight,
+                final_progress=None,
+            )
+            if calibration is not None:
+                intitial_temperature, temperature_scaling = calibration
+        costs: list[float] = [
+            objective.calculate_state_cost(state, mix_weight, diversity_weight)
+            for state in states
+        ]
+
+        executor: ProcessPoolExecutor | None = None
+        if self.process_count > 1:
+            executor = ProcessPoolExecutor(
+                self.process_count,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_share_context,
+                initargs=(
+                    objective,
+                    states[0].participants,
+                    groups_per_iteration,
+                    mix_weight,
+                    diversity_weight,
+                ),
+            )
+        try:
+            best_group_ids: np.ndarray = self.__temper(
+                executor,
+                objective,
+                states,
+                costs,
+                self.get_temperatures(intitial_temperature, temperature_scaling),
+                criteria,
+                ProgressReporter.from_options(
+                    criteria.progress_total, progress_callback, reporting
+                ),
+                mix_weight,
+                diversity_weight,
+            )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return CompactAssignment(
+            states[0].participants, best_group_ids, groups_per_iteration
+        ).to_assignment()
+
+    def __initial_states(
+        self,
+        objective: ObjectiveFunction,
+        participants: set[Participant],
+        groups_per_iteration: int,
+        iterations: int,
+        stratified_start: bool,
+        initial_assignment: Assignment | None,
+    ) -> list[CompactAssignment]:
+        """Return the assignments the replicas start from and normalize the objective function.
+
+        The costs are normalized by the bounds of a random assignment, which is the first replica
+        unless it starts from a given or stratified assignment.
+
+        :param objective: The objective function of the run
+        :param participants: The set of participants to distribute into groups
+        :param groups_per_iteration: The number of groups in each iteration
+        :param iterations: The total number of iterations
+        :param stratified_start: Whether to start the first replica from an assignment of a :class:`StratifiedSeeder`
+        :param initial_assignment: The assignment to start the first replica from, None to generate one
+
+        :return: The assignment of every replica, hottest first, with the participants in the same order
+        """
+        random: RandomAlgorithm = RandomAlgorithm(self.__random)
+        sample: Assignment = random.find_assignment(
+            participants, groups_per_iteration, iterations
+        )
+        objective.recalculate_bounds(sample)
+        order: list[Participant] = objective.encode(sample).participants
+        if initial_assignment is None and stratified_start:
+            initial_assignment = StratifiedSeeder(
+                self.attributes, self.__random, self.attribute_weights
+            ).find_assignment(participants, groups_per_iteration, iterations)
+        return [
+            CompactAssignment.from_assignment(
+                sample if initial_assignment is None else initial_assignment, order
+            )
+        ] + [
+            CompactAssignment.from_assignment(
+                random.find_assignment(participants, groups_per_iteration, iterations),
+                order,
+            )
+            for _ in range(self.replica_count - 1)
+        ]
+
+    def __temper(
+        self,
+        executor: ProcessPoolExecutor | None,
+        objective: ObjectiveFunction,
+        states: list[CompactAssignment],
+        costs: list[float],
+        temperatures: list[float],
+        criteria: StoppingCriteria,
+        reporter: ProgressReporter,
+        mix_weight: float,
+        diversity_weight: float,
+    ) -> np.ndarray:
+        """Run segments and exchange rounds until one of the stopping criteria is met.
+
+        :param executor: The executor to run the replicas in, None to run them in the calling thread
+        :param objective: The objective function, its bounds shared by all replicas
+        :param states: The assignment of every replica, hottest first
+        :param costs: The cost of every assignment
+        :param temperatures: The temperature of every replica
+        :param criteria: The stopping criteria of the run, checked at every exchange round
+        :param reporter: Reports the progress of the run and the cost of the coldest replica
+        :param mix_weight: The weight of the mix cost
+        :param diversity_weight: The weight of the diversity cost
+
+        :return: The assignment with the lowest cost seen at any exchange round, indexed by [iteration, participant]
+        """
+        self.best_cost = min(costs)
+        self.best_cycle = 0
+        best_group_ids: np.ndarray = states[
+            costs.index(self.best_cost)
+        ].group_ids.copy()
+        start: float = time.perf_counter()
+        cycles: int = 0
+        exchange_round: int = 0
+        progress: float = 0.0
+        reporter.start(progress, cycles, costs[-1], self.best_cost)
+        while progress < 1:
+            segment: int = self.exchange_interval
+            if criteria.max_cycles is not None:
+                segment = min(segment, criteria.max_cycles - cycles)
+            seeds: list[int] = [
+                self.__random.getrandbits(64) for _ in range(self.replica_count)
+            ]
+            accepted: list[int] = self.__run_segments(
+                executor,
+                objective,
+                states,
+                costs,
+                temperatures,
+                segment,
+                seeds,
+                mix_weight,
+                diversity_weight,
+            )
+            cycles += segment
+            progress = criteria.progress(cycles, time.perf_counter() - start)
+
+            if min(costs) < self.best_cost:
+                self.best_cost = min(costs)
+                self.best_cycle = cycles
+                best_group_ids = states[costs.index(self.best_cost)].group_ids.copy()
+            self.__exchange(states, costs, temperatures, exchange_round % 2)
+            exchange_round += 1
+            reporter.update(progress, cycles, costs[-1], self.best_cost)
+            if (
+                criteria.is_frozen(accepted[-1], segment)
+                or criteria.is_stalled(cycles, self.best_cycle)
+                or criteria.is_cancelled(exchange_round)
+            ):
+                break
+
+        reporter.finish(progress, cycles, costs[-1], self.best_cost)
+        self.cancelled = criteria.cancelled
+        return best_group_ids
+
+    def __run_segments(
+        self,
+        executor: ProcessPoolExecutor | None,
+        objective: ObjectiveFunction,
+        states: list[CompactAssignment],
+        costs: list[float],
+        temperatures: list[float],
+        cycles: int,
+        seeds: list[int],
+        mix_weight: float,
+        diversity_weight: float,
+    ) -> list[int]:
+        """Run every replica for one segment, updating the assignments and costs in place.
+
+        Without an executor the replicas keep their assignments and are run in the calling thread,
+        otherwise only the assignments and costs are sent to the worker processes.
+
+        :param executor: The executor to run the replicas in, None to run them in the calling thread
+        :param objective: The objective function, its bounds shared by all replicas
+        :param states: The assignment of every replica
+        :param costs: The cost of every assignment
+        :param temperatures: The temperature of every replica
+        :param cycles: The number of cycles of the segment
+        :param seeds: The seed of the random source of every replica
+        :param mix_weight: The weight of the mix cost
+        :param diversity_weight: The weight of the diversity cost
+
+        :return: The number of accepted moves of every replica
+        """
+        if executor is None:
+            accepted: list[int] = []
+            for replica, (state, temperature, seed) in enumerate(
+                zip(states, temperatures, seeds)
+            ):
+                costs[replica], replica_accepted = _run_replica(
+                    objective,
+                    state,
+                    costs[replica],
+                    temperature,
+                    cycles,
+                    seed,
+                    mix_weight,
+                    diversity_weight,
+                )
+                accepted.append(replica_accepted)
+            return accepted
+        results: list[tuple[np.ndarray, np.ndarray, float, int]] = list(
+            executor.map(
+                _run_segment,
+                [state.group_ids for state in states],
+                [state.positions for state in states],
+                costs,
+                temperatures,
+                [cycles] * len(states),
+                seeds,
+            )
+        )
+        for replica, (group_ids, positions, cost, _) in enumerate(results):
+            states[replica] = CompactAssignment(
+                states[replica].participants,
+                group_ids,
+                states[replica].groups_per_iteration,
+                positions,
+            )
+            costs[replica] = cost
+        return [count for _, _, _, count in results]
+
+    def get_temperatures(
+        self, intitial_temperature: float, scaling: float
+    ) -> list[float]:
+        """Return the geometric temperature ladder of the replicas, hottest first.
+
+        :param intitial_temperature: The temperature of the hottest replica
+        :param scaling: The coldest temperature is `exp(-scaling)` times the hottest
+
+        :return: The temperature of every replica
+        """
+        if self.replica_count == 1:
+            return [intitial_temperature]
+        return [
+            intitial_temperature * exp(-scaling * rung / (self.replica_count - 1))
+            for rung in range(self.replica_count)
+        ]
+
+    def __exchange(
+        self,
+        states: list[CompactAssignment],
+        costs: list[float],
+        temperatures: list[float],
+        parity: int,
+    ) -> None:
+        """Attempt exchanges between neighboring replicas in place.
+
+        Alternating rounds pair the replicas starting at the first or the second one,
+        every pair exchanges its assignments with the replica exchange Metropolis probability.
+
+        :param states: The assignment of every replica, hottest first
+        :param costs: The cost of every assignment
+        :param temperatures: The temperature of every replica
+        :param parity: 0 to pair the replicas starting with the first one, 1 to start with the second one
+        """
+        for hot in range(parity, self.replica_count - 1, 2):
+            cold: int = hot + 1
+            exponent: float = (1 / temperatures[hot] - 1 / temperatures[cold]) * (
+                costs[hot] - costs[cold]
+            )
+            if exponent >= 0 or exp(exponent) >= self.__random.random():
+                states[hot], states[cold] = states[cold], states[hot]
+                costs[hot], costs[cold] = costs[cold], costs[hot]
+
+
+#: the objective function, the participants in index order, the number of groups per iteration
+#: and the cost weights shared by the segments of a run, only set in its worker processes
+_context: tuple[ObjectiveFunction, list[Participant], int, float, float] | None = None
+
+
+def _share_context(
+    objective: ObjectiveFunction,
+    participants: list[Participant],
+    groups_per_iteration: int,
+    mix_weight: float,
+    diversity_weight: float,
+) -> None:
+    """Store the context of a parallel tempering run in a worker process,
+    used as the initializer of the worker processes so it is sent only once.
+
+    :param objective: the objective function with its bounds calculated
+    :param participants: the participants in index order
+    :param groups_per_iteration: the number of groups in each iteration
+    :param mix_weight: the weight of the mix cost
+    :param diversity_weight: the weight of the diversity cost
+    """
+    global _context  # pylint: disable=global-statement
+    _context = (
+        objective,
+        participants,
+        groups_per_iteration,
+        mix_weight,
+        diversity_weight,
+    )
+
+
+def _run_segment(
+    group_ids: np.ndarray,
+    positions: np.ndarray,
+    cost: float,
+    temperature: float,
+    cycles: int,
+    seed: int,
+) -> tuple[np.ndarray, np.ndarray, float, int]:
+    """Run one replica with the shared context of this worker process, used as the task of a segment.
+
+    The positions are passed along with the groups, so the replica draws the same swaps as in the calling process.
+
+    :param group_ids: the assignment of the replica, indexed by [iteration, participant]
+    :param positions: the position of every participant inside the member array of its group
+    :param cost: the cost of the assignment
+    :param temperature: the temperature of the replica
+    :param cycles: the number of cycles
+    :param seed: the seed of the random source of the segment
+
+    :return: the assignment of the replica after the segment, its positions, its cost and the number of accepted moves
+
+    :raises RuntimeError: if no context was shared with this process
+    """
+    if _context is None:
+        raise RuntimeError("No parallel tempering context was shared with this process")
+    objective, participants, groups_per_iteration, mix_weight, diversity_weight = (
+        _context
+    )
+    state: CompactAssignment = CompactAssignment(
+        participants, group_ids, groups_per_iteration, positions
+    )
+    cost, accepted = _run_replica(
+        objective,
+        state,
+        cost,
+        temperature,
+        cycles,
+        seed,
+        mix_weight,
+        diversity_weight,
+    )
+    return state.group_ids, state.positions, cost, accepted
+
+
+def _run_replica(
+    objective: ObjectiveFunction,
+    state: CompactAssignment,
+    cost: float,
+    temperature: float,
+    cycles: int,
+    seed: int,
+    mix_weight: float,
+    diversity_weight: float,
+) -> tuple[float, int]:
+    """Run one replica at a fixed temperature for a number of cycles, changing its assignment in place.
+
+    :param objective: the objective function, its bounds shared by all replicas
+    :param state: the assignment of the replica
+    :param cost: the cost of the assignment
+    :param temperature: the temperature of the replica
+    :param cycles: the number of cycles
+    :param seed: the seed of the random source of the segment
+    :param mix_weight: the weight of the mix cost
+    :param diversity_weight: the weight of the diversity cost
+
+    :return: the cost of the assignment after the segment and the number of accepted moves
+    """
+    random: Random = Random(seed)
+    accepted: int = 0
+    for _ in range(cycles):
+        index, participant_1, participant_2 = state.random_swap(random)
+        delta: float = objective.swap_delta(
+            state,
+            index,
+            participant_1,
+            participant_2,
+            mix_weight,
+            diversity_weight,
+        )
+        if delta <= 0 or exp(-delta / temperature) >= random.random():
+            state.swap(index, participant_1, participant_2)
+            cost += delta
+            accepted += 1
+    return cost, accepted
@@ -0,0 +1,162 @@
+"""Module containing the integer encoding of participants."""
+
+from typing import Iterable
+import numpy as np
+from data_structures import Participant, Group, Assignment
+
+
+class ParticipantEncoding:
+    """Integer encoding of a set of participants and their attribute values.
+
+    Participants are indexed in the given order.
+    The values of every attribute are numbered in order of first appearance
+    and stored in :attr:`codes` with one column per attribute class.
+    :attr:`slots` offsets those codes so that the values of all attributes share one range,
+    which allows the value counts of a group over all attributes to be computed with a single `bincount`.
+
+    :param participants: the participants to encode, in index order
+    :param attribute_classes: the attributes to encode, in column order
+    :param attribute_weights: a dict mapping attributes to float weights, defaults to an empty dict
+    """
+
+    participants: list[Participant]
+    attribute_classes: list[str]
+    codes: np.ndarray
+    slots: np.ndarray
+    slot_weights: np.ndarray
+    slot_totals: np.ndarray
+
+    __indices: dict[Participant, int]
+
+    def __init__(
+        self,
+        participants: list[Participant],
+        attribute_classes: list[str],
+        attribute_weights: dict[str, float] = dict(),
+    ) -> None:
+        self.participants = participants
+        self.attribute_classes = list(attribute_classes)
+        self.__indices = {
+            participant: index for index, participant in enumerate(self.participants)
+        }
+
+        self.codes = np.zeros(
+            (len(self.participants), len(self.attribute_classes)), dtype=np.intp
+        )
+        offsets: list[int] = []
+        weights: list[float] = []
+        for column, attribute in enumerate(self.attribute_classes):
+            values: dict[str, int] = {}
+            for row, participant in enumerate(self.participants):
+                self.codes[row, column] = values.setdefault(
+                    participant.get_attribute(attribute), len(values)
+                )
+            offsets.append(len(weights))
+            weights += [attribute_weights.get(attribute, 1)] * len(values)
+
+        self.slots = self.codes + np.array(offsets, dtype=np.intp)
+        self.slot_weights = np.array(weights, dtype=float)
+        self.slot_totals = np.bincount(self.slots.ravel(), minlength=len(weights))
+
+    @property
+    def slot_count(self) -> int:
+        """Number of distinct values over all attributes.
+
+        :return: the number of slots
+        """
+        return len(self.slot_weights)
+
+    def index_of(self, participant: Participant) -> int:
+        """Return the index of a participant.
+
+        :param participant: the participant
+
+        :return: the row of the participant in :attr:`codes`
+        """
+        return self.__indices[participant]
+
+    def indices(self, group: Group) -> np.ndarray:
+        """Return the indices of the members of a group.
+
+        :param group: the group
+
+        :return: an array of participant indices
+        """
+        return np.fromiter(map(self.__indices.__getitem__, group), dtype=np.intp)
+
+    def matches(self, participants: Iterable[Participant]) -> bool:
+        """Check whether the encoding was created for exactly the given participants.
+
+        :param participants: the participants to check
+
+        :return: true if the participants are the encoded ones, false otherwise
+        """
+        return set(participants) == self.__indices.keys()
+
+    def covers(self, participants: Iterable[Participant]) -> bool:
+        """Check whether all given participants are encoded.
+
+        :param participants: the participants to check
+
+        :return: true if every participant has an index, false otherwise
+        """
+        return all(participant in self.__indices for participant in participants)
+
+    def group_ids(self, assignment: Assignment) -> np.ndarray:
+        """Return the group of every participant in every iteration of an assignment.
+
+        :param assignment: an assignment of the encoded participants
+
+        :return: an array of group indices, indexed by [iteration, participant]
+        """
+        group_ids: np.ndarray = np.zeros(
+            (len(assignment), len(self.participants)), dtype=np.intp
+        )
+        for iteration_index, iteration in enumerate(assignment):
+            for group_index, group in enumerate(iteration):
+                group_ids[iteration_index, self.indices(group)] = group_index
+        return group_ids
+
+    def histogram(self, members: np.ndarray) -> np.ndarray:
+        """Return how many members of a group have each attribute value.
+
+        :param members: the indices of the group members
+
+        :return: an array of value counts, indexed by slot
+        """
+        return np.bincount(self.slots[members].ravel(), minlength=self.slot_count)
+
+    def group_histograms(
+        self, group_ids: np.ndarray, groups_per_iteration: int
+    ) -> np.ndarray:
+        """Return the value counts of every group of an assignment.
+
+        :param group_ids: the group of every participant, indexed by [iteration, participant]
+        :param groups_per_iteration: the number of groups in each iteration
+
+        :return: an array of value counts, indexed by [iteration, group, slot]
+        """
+        iteration_count: int = group_ids.shape[0]
+        group_keys: np.ndarray = (
+            group_ids + np.arange(iteration_count)[:, np.newaxis] * groups_per_iteration
+        )
+        keys: np.ndarray = (
+            group_keys[:, :, np.newaxis] * self.slot_count + self.slots[np.newaxis]
+        )
+        return np.bincount(
+            keys.ravel(),
+            minlength=iteration_count * groups_per_iteration * self.slot_count,
+        ).reshape(iteration_count, groups_per_iteration, self.slot_count)
+
+    def histogram_sizes(self, histograms: np.ndarray) -> np.ndarray:
+        """Return the group sizes belonging to value counts.
+
+        :param histograms: value counts, the last axis is indexed by slot
+
+        :return: the size of every group, in the shape of the histograms without the last axis
+        """
+        if len(self.attribute_classes) == 0:
+            return np.zeros(histograms.shape[:-1], dtype=np.intp)
+        # every participant has exactly one value of the first attribute
+        first_attribute_slots: int = int(self.codes[:, 0].max()) + 1
+        return histograms[..., :first_attribute_slots].sum(axis=-1)
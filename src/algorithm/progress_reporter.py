@@ -0,0 +1,183 @@
+"""Module containing the rate-limited progress reporting of optimization runs."""
+
+from dataclasses import dataclass
+import time
+from typing import Callable, Self
+
+
+@dataclass
+class ProgressReport:
+    """A snapshot of the progress of an optimization run."""
+
+    #: the current progress, from 0 to `total`
+    current: int
+    #: the total progress
+    total: int
+    #: the number of completed cycles
+    cycle: int
+    #: the number of cycles per second since the previous report
+    cycles_per_second: float
+    #: the cost of the current assignment
+    cost: float
+    #: the lowest cost visited so far
+    best_cost: float
+    #: the estimated number of seconds until the run ends, None before any progress was made
+    remaining_seconds: float | None
+
+
+@dataclass
+class ReportingOptions:
+    """How an optimization run reports its progress besides the progress callback."""
+
+    #: gets called with a :class:`ProgressReport` of the run, as often as the progress callback
+    report_callback: Callable[[ProgressReport], None] | None = None
+    #: the minimum number of seconds between two progress reports
+    progress_interval: float = 0.05
+
+
+class ProgressReporter:
+    """Passes the progress of an optimization run to callbacks at most once per interval.
+
+    Calling a callback, which for example emits a signal to another thread, on every cycle
+    can take a considerable share of the runtime of a fast run,
+    so intermediate updates within `interval` seconds of the previous report are dropped.
+    The first and the last report of a run are always passed on.
+
+    :param total: the total progress
+    :param progress_callback: gets called with current progress and total progress (optional)
+    :param report_callback: gets called with a :class:`ProgressReport` (optional)
+    :param interval: the minimum number of seconds between two reports, defaults to 0.05
+    """
+
+    total: int
+    interval: float
+
+    __progress_callback: Callable[[int, int], None] | None
+    __report_callback: Callable[[ProgressReport], None] | None
+    __start: float
+    __last_time: float
+    __last_cycle: int
+    __last_current: int | None
+    __start_progress: float
+
+    def __init__(
+        self,
+        total: int,
+        progress_callback: Callable[[int, int], None] | None = None,
+        report_callback: Callable[[ProgressReport], None] | None = None,
+        interval: float = 0.05,
+    ) -> None:
+        self.total = total
+        self.interval = interval
+        self.__progress_callback = progress_callback
+        self.__report_callback = report_callback
+        self.__start = time.perf_counter()
+        self.__last_time = self.__start
+        self.__last_cycle = 0
+        self.__last_current = None
+        self.__start_progress = 0.0
+
+    @classmethod
+    def from_options(
+        cls,
+        total: int,
+        progress_callback: Callable[[int, int], None] | None,
+        options: ReportingOptions | None,
+    ) -> Self:
+        """Create a reporter for the progress callback and the reporting options of a run.
+
+        :param total: the total progress
+        :param progress_callback: gets called with current progress and total progress (optional)
+        :param options: the report callback and the interval, defaults to an interval of 0.05 seconds (optional)
+
+        :return: the reporter
+        """
+        if options is None:
+            options = ReportingOptions()
+        return cls(
+            total, progress_callback, options.report_callback, options.progress_interval
+        )
+
+    def start(self, progress: float, cycle: int, cost: float, best_cost: float) -> None:
+        """Report the start of a run, restarting the clock of the estimates.
+
+        :param progress: the completed fraction of the run, 0 unless it is continued
+        :param cycle: the number of completed cycles, 0 unless the run is continued
+        :param cost: the cost of the starting assignment
+        :param best_cost: the lowest cost visited so far
+        """
+        self.__start = time.perf_counter()
+        self.__last_time = self.__start
+        self.__last_cycle = cycle
+        self.__last_current = None
+        self.__start_progress = progress
+        self.__report(progress, cycle, cost, best_cost, self.__start)
+
+    def update(
+        self, progress: float, cycle: int, cost: float, best_cost: float
+    ) -> None:
+        """Report the progress of a run if the interval has passed since the previous report.
+
+        The remaining time is extrapolated from the progress made since the start of the run.
+
+        :param progress: the completed fraction of the run
+        :param cycle: the number of completed cycles
+        :param cost: the cost of the current assignment
+        :param best_cost: the lowest cost visited so far
+        """
+        now: float = time.perf_counter()
+        if now - self.__last_time >= self.interval:
+            self.__report(progress, cycle, cost, best_cost, now)
+
+    def finish(
+        self, progress: float, cycle: int, cost: float, best_cost: float
+    ) -> None:
+        """Report the end of a run, unless its last cycle has already been reported.
+
+        A run stopped early, for example because it converged or was cancelled,
+        reports the progress it actually made.
+
+        :param progress: the completed fraction of the run
+        :param cycle: the number of completed cycles
+        :param cost: the cost of the current assignment
+        :param best_cost: the lowest cost visited so far
+        """
+        if self.__last_current is None or self.__last_cycle != cycle:
+            self.__report(progress, cycle, cost, best_cost, time.perf_counter())
+
+    def __report(
+        self, progress: float, cycle: int, cost: float, best_cost: float, now: float
+    ) -> None:
+        """Pass the progress to the callbacks.
+
+        :param progress: the completed fraction of the run
+        :param cycle: the number of completed cycles
+        :param cost: the cost of the current assignment
+        :param best_cost: the lowest cost visited so far
+        :param now: the current time of :func:`time.perf_counter`
+        """
+        progress = min(progress, 1.0)
+        current: int = round(progress * self.total)
+        if self.__progress_callback is not None:
+            self.__progress_callback(current, self.total)
+        if self.__report_callback is not None:
+            duration: float = now - self.__last_time
+            elapsed: float = now - self.__start
+            self.__report_callback(
+                ProgressReport(
+                    current,
+                    self.total,
+                    cycle,
+                    (cycle - self.__last_cycle) / duration if duration > 0 else 0.0,
+                    cost,
+                    best_cost,
+                    (
+                        elapsed * (1 - progress) / (progress - self.__start_progress)
+                        if progress > self.__start_progress
+                        else None
+                    ),
+                )
+            )
+        self.__last_time = now
+        self.__last_cycle = cycle
+        self.__last_current = current
@@ -1,10 +1,16 @@
 """Random algorithm module"""
 
-from copy import copy
-from math import ceil
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import multiprocessing
 from random import Random
-from data_structures import Assignment, Group, Participant
+import time
+from typing import Iterator
+import numpy as np
+from data_structures import Assignment, Participant
+from algorithm.compact_assignment import CompactAssignment
 from algorithm.objective_function import ObjectiveFunction
+from algorithm.participant_encoding import ParticipantEncoding
 
 
 class RandomAlgorithm:
@@ -14,6 +20,8 @@ class RandomAlgorithm:
     instead of an automatically generated one as a source or randomness, defaults to None
     """
 
+    BATCH_SIZE: int = 256
+
     __random: Random
 
     def __init__(self, random_instance: Random = None):
@@ -24,61 +32,244 @@ class RandomAlgorithm:
     ) -> Assignment:
         """Return a randomly generated group assignment.
 
+        Every iteration shuffles the participants and deals them into the groups in turn,
+        so the sizes of the groups differ by at most one and the first groups are the larger ones.
+
         :param participants: The set of participants to distribute into groups
         :param groups_per_round: The number of goups per iteration
         :param iterations: The number of iterations to generate groups for
 
         :return: The generated assignment
         """
-        max_group_size: int = ceil(len(participants) / groups_per_iteration)
+        deck: list[Participant] = sorted(
+            participants, key=lambda participant: participant.uid
+        )
         assignment: Assignment = []
         for _ in range(iterations):
-            remaining_participants: set[Participant] = copy(participants)
-            iteration: list[Group] = [set() for _ in range(groups_per_iteration)]
-            for _ in range(max_group_size):
-                for group in iteration:
-                    if len(remaining_participants) == 0:
-                        break
-                    participant: Participant = self.__random.choice(
-                        tuple(remaining_participants)
-                    )
-                    group.add(participant)
-                    remaining_participants.discard(participant)
-            assignment.append(iteration)
-
+            self.__random.shuffle(deck)
+            assignment.append(
+                [
+                    set(deck[group::groups_per_iteration])
+                    for group in range(groups_per_iteration)
+                ]
+            )
         return assignment
 
+    def batch_group_ids(
+        self,
+        participant_count: int,
+        groups_per_iteration: int,
+        iterations: int,
+        count: int,
+    ) -> np.ndarray:
+        """Return many random assignments at once as arrays of group indices.
+
+        The groups have the same sizes as those of :meth:`find_assignment`.
+        Every row of the result is a random permutation of the group index of every position of the deal,
+        drawn by a numpy generator seeded from the random source of this instance.
+
+        :param participant_count: The number of participants
+        :param groups_per_iteration: The number of groups per iteration
+        :param iterations: The number of iterations of every assignment
+        :param count: The number of assignments
+
+        :return: The group of every participant, indexed by [assignment, iteration, participant]
+        """
+        generator: np.random.Generator = np.random.default_rng(
+            self.__random.getrandbits(64)
+        )
+        deal: np.ndarray = (
+            np.arange(participant_count, dtype=np.intp) % groups_per_iteration
+        )
+        return generator.permuted(
+            np.broadcast_to(deal, (count, iterations, participant_count)), axis=2
+        )
+
     def brute_force_assignment(
         self,
         participants: set[Participant],
         groups_per_iteration: int,
         iterations: int,
-        max_cycles: int,
+        max_cycles: int | None,
+        process_count: int = 1,
+        target_cost: float | None = None,
+        time_budget: float | None = None,
     ) -> Assignment:
         """Generates a number of random assignments and returns the best.
 
+        The assignments are generated and scored in chunks of :attr:`BATCH_SIZE` by :meth:`batch_group_ids`.
+        All chunks share one objective function whose bounds are calculated once from the first assignment.
+        With more than one process the chunks are spread over worker processes,
+        each of which receives the objective function and the encoding of the participants once.
+        The seed of every chunk is drawn from the random source of this instance
+        and the chunks are evaluated in order, so without a time budget
+        the result does not depend on the number of processes.
+
         :param participants: The set of participants to distribute into groups
         :param groups_per_round: The number of goups per iteration
         :param iterations: The number of iterations to generate groups for
-        :param max_cycles: The number of assignments to generate
+        :param max_cycles: The number of assignments to generate, None to only use the time budget
+        :param process_count: The number of worker processes, defaults to 1, which scores in this process
+        :param target_cost: Stop once an assignment with at most this cost is found (optional)
+        :param time_budget: Stop after the first chunk that ends this many seconds after the start (optional)
 
         :return: The best assignment
+
+        :raises ValueError: if neither a maximum number of cycles nor a time budget is given
         """
+        if max_cycles is None and time_budget is None:
+            raise ValueError("Either max_cycles or time_budget must be set")
+        start: float = time.perf_counter()
         best: Assignment = self.find_assignment(
             participants, groups_per_iteration, iterations
         )
 
         attributes: set[str] = list(participants)[0].attributes.keys()
         objective: ObjectiveFunction = ObjectiveFunction(list(attributes))
+        encoding: ParticipantEncoding = objective.encode(best)
 
         best_score: float = objective.calculate_weighted_cost(best)
+        if target_cost is not None and best_score <= target_cost:
+            return best
 
-        for _ in range(max_cycles):
-            new: Assignment = self.find_assignment(
-                participants, groups_per_iteration, iterations
+        tasks: Iterator[tuple[int, int, int, int]] = (
+            (self.__random.getrandbits(64), count, groups_per_iteration, iterations)
+            for count in self.__chunk_sizes(max_cycles)
+        )
+        executor: ProcessPoolExecutor | None = None
+        if process_count > 1:
+            executor = ProcessPoolExecutor(
+                process_count,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_share_context,
+                initargs=(objective, encoding),
             )
-            new_score: float = objective.calculate_weighted_cost(new)
-            if new_score < best_score:
-                best = new
-                best_score = new_score
+        try:
+            for score, group_ids in self.__map_chunks(
+                executor, process_count, tasks, objective, encoding
+            ):
+                if score < best_score:
+                    best = CompactAssignment(
+                        encoding.participants, group_ids, groups_per_iteration
+                    ).to_assignment()
+                    best_score = score
+                if (target_cost is not None and best_score <= target_cost) or (
+                    time_budget is not None
+                    and time.perf_counter() - start >= time_budget
+                ):
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
         return best
+
+    def __chunk_sizes(self, max_cycles: int | None) -> Iterator[int]:
+        """Split a number of assignments into chunks.
+
+        :param max_cycles: The number of assignments, None for an endless sequence of chunks
+
+        :return: The size of every chunk
+        """
+        remaining: float = float("inf") if max_cycles is None else max_cycles
+        while remaining > 0:
+            count: int = int(min(self.BATCH_SIZE, remaining))
+            remaining -= count
+            yield count
+
+    def __map_chunks(
+        self,
+        executor: ProcessPoolExecutor | None,
+        process_count: int,
+        tasks: Iterator[tuple[int, int, int, int]],
+        objective: ObjectiveFunction,
+        encoding: ParticipantEncoding,
+    ) -> Iterator[tuple[float, np.ndarray]]:
+        """Score chunks in order, keeping two chunks per process in flight if an executor is given.
+
+        Unlike :meth:`ProcessPoolExecutor.map` only as many tasks are taken as are in flight,
+        so the tasks may be endless and stopping early does not leave a backlog of submitted chunks.
+
+        :param executor: The executor to score the chunks in, None to score them in this process
+        :param process_count: The number of worker processes of the executor
+        :param tasks: The arguments of :func:`_score_chunk` for every chunk
+        :param objective: The objective function to score the chunks with in this process
+        :param encoding: The encoding of the participants to score the chunks with in this process
+
+        :return: The results of :func:`_score_chunk` in the order of the tasks
+        """
+        if executor is None:
+            yield from (_score_batch(objective, encoding, *task) for task in tasks)
+            return
+        pending: deque[Future] = deque()
+        for task in tasks:
+            pending.append(executor.submit(_score_chunk, *task))
+            if len(pending) >= 2 * process_count:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+#: the objective function and participant encoding shared by the chunks of a brute force run,
+#: only set in its worker processes
+_context: tuple[ObjectiveFunction, ParticipantEncoding] | None = None
+
+
+def _share_context(objective: ObjectiveFunction, encoding: ParticipantEncoding) -> None:
+    """Store the context of a brute force run in a worker process,
+    used as the initializer of the worker processes so it is sent only once.
+
+    :param objective: the objective function with its bounds calculated
+    :param encoding: the encoding of the participants
+    """
+    global _context  # pylint: disable=global-statement
+    _context = (objective, encoding)
+
+
+def _score_chunk(
+    seed: int, count: int, groups_per_iteration: int, iterations: int
+) -> tuple[float, np.ndarray]:
+    """Generate and score a chunk of random assignments with the shared context of this worker process.
+
+    :param seed: the seed of the random source of the chunk
+    :param count: the number of assignments
+    :param groups_per_iteration: the number of groups per iteration
+    :param iterations: the number of iterations of every assignment
+
+    :return: the lowest cost of the chunk and the group of every participant in that assignment,
+    indexed by [iteration, participant]
+
+    :raises RuntimeError: if no context was shared with this process
+    """
+    if _context is None:
+        raise RuntimeError("No brute force context was shared with this process")
+    return _score_batch(*_context, seed, count, groups_per_iteration, iterations)
+
+
+def _score_batch(
+    objective: ObjectiveFunction,
+    encoding: ParticipantEncoding,
+    seed: int,
+    count: int,
+    groups_per_iteration: int,
+    iterations: int,
+) -> tuple[float, np.ndarray]:
+    """Generate and score a chunk of random assignments.
+
+    :param objective: the objective function with its bounds calculated
+    :param encoding: the encoding of the participants
+    :param seed: the seed of the random source of the chunk
+    :param count: the number of assignments
+    :param groups_per_iteration: the number of groups per iteration
+    :param iterations: the number of iterations of every assignment
+
+    :return: the lowest cost of the chunk and the group of every participant in that assignment,
+    indexed by [iteration, participant]
+    """
+    candidates: np.ndarray = RandomAlgorithm(Random(seed)).batch_group_ids(
+        len(encoding.participants), groups_per_iteration, iterations, count
+    )
+    scores: np.ndarray = objective.batch_weighted_costs(
+        encoding, candidates, groups_per_iteration
+    )
+    index: int = int(np.argmin(scores))
+    return float(scores[index]), candidates[index]
@@ -0,0 +1,63 @@
+"""Module containing the repair of assignments after roster changes."""
+
+from random import Random
+from data_structures import Assignment, Group, Participant
+
+
+def repair_assignment(
+    assignment: Assignment,
+    added: set[Participant],
+    removed: set[Participant],
+    random: Random,
+) -> Assignment:
+    """Adapt an assignment to added and removed participants, changing as few groups as possible.
+
+    Removed participants leave their groups and added participants join the smallest groups.
+    If the sizes of the groups of an iteration then differ by more than one, members of the largest groups
+    move to the smallest ones, added participants first, so published placements stay as they are where possible.
+
+    :param assignment: the assignment to repair, it is not changed
+    :param added: the participants to add
+    :param removed: the participants to remove
+    :param random: the source of randomness, used to break ties
+
+    :return: the repaired assignment, with the groups in the same order
+    """
+    repaired: Assignment = []
+    for iteration in assignment:
+        groups: list[Group] = [group - removed for group in iteration]
+        for participant in sorted(added, key=lambda participant: participant.uid):
+            _smallest_group(groups, random).add(participant)
+        _balance(groups, added, random)
+        repaired.append(groups)
+    return repaired
+
+
+def _balance(groups: list[Group], added: set[Participant], random: Random) -> None:
+    """Move members from the largest to the smallest groups in place until the sizes differ by at most one.
+
+    :param groups: the groups of one iteration
+    :param added: the participants that have no published placement, they are moved first
+    :param random: the source of randomness, used to break ties
+    """
+    largest: Group = max(groups, key=len)
+    while len(largest) - min(len(group) for group in groups) > 1:
+        candidates: list[Participant] = sorted(
+            largest & added or largest, key=lambda participant: participant.uid
+        )
+        participant: Participant = random.choice(candidates)
+        largest.discard(participant)
+        _smallest_group(groups, random).add(participant)
+        largest = max(groups, key=len)
+
+
+def _smallest_group(groups: list[Group], random: Random) -> Group:
+    """Pick one of the smallest groups.
+
+    :param groups: the groups of one iteration
+    :param random: the source of randomness, used to break ties
+
+    :return: the picked group
+    """
+    size: int = min(len(group) for group in groups)
+    return random.choice([group for group in groups if len(group) == size])
@@ -0,0 +1,459 @@
+"""Module containing the base class of the search algorithms and their runs in other processes."""
+
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+import multiprocessing
+from multiprocessing.connection import Connection
+from random import Random
+from threading import Event, Thread
+import time
+from typing import Callable, Self
+import numpy as np
+from algorithm.annealing_checkpoint import CheckpointOptions
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.move_set import MoveSet
+from algorithm.objective_function import ObjectiveFunction
+from algorithm.participant_encoding import ParticipantEncoding
+from algorithm.progress_reporter import ProgressReport, ReportingOptions
+from algorithm.random_algorithm import RandomAlgorithm
+from algorithm.stopping_criteria import StoppingOptions
+from data_structures import Assignment, Participant
+
+
+@dataclass
+class ChainStatistics:
+    """Statistics of one chain of a multi-start run."""
+
+    #: the seed of the random source of the chain
+    seed: int
+    #: the weighted cost of the assignment found by the chain,
+    #: normalized by the bounds of one random sample shared by all chains of the run
+    cost: float
+    #: the wall-clock duration of the chain in seconds
+    duration: float
+
+
+class SearchAlgorithm(ABC):
+    """Provides the interface of the algorithms searching for group assignments
+    and runs them in other processes.
+
+    Every search algorithm takes the arguments of :meth:`SimulatedAnnealingAlgorithm.find_assignment`
+    and stores the results of its last run in :attr:`best_cost`, :attr:`best_cycle` and :attr:`cancelled`.
+
+    :param attributes: A list of attributes that are considered for optimization
+    :param random_instance: The source of randomness of the algorithm, the seeds of other processes are drawn from it
+    :param attribute_weights: a dict mapping attributes to float weights
+    """
+
+    __random: Random
+    attributes: list[str]
+    attribute_weights: dict[str, float]
+    best_cost: float
+    best_cycle: int
+    cancelled: bool
+
+    def __init__(
+        self,
+        attributes: list[str],
+        random_instance: Random,
+        attribute_weights: dict[str, float],
+    ) -> None:
+        self.__random = random_instance
+        self.attributes = attributes
+        self.attribute_weights = attribute_weights
+        self.best_cost = 0.0
+        self.best_cycle = 0
+        self.cancelled = False
+
+    @abstractmethod
+    def find_assignment(
+        self,
+        participants: set[Participant],
+        groups_per_iteration: int,
+        iterations: int,
+        max_cycles: int | None,
+        intitial_temperature: float = 1,
+        temperature_scaling: float = 15,
+        mix_weight: float = 1,
+        diversity_weight: float = 1,
+        progress_callback: Callable[[int, int], None] | None = None,
+        stopping: StoppingOptions | None = None,
+        auto_temperature: bool = False,
+        guided_rate: float = 0.0,
+        move_set: MoveSet | None = None,
+        stratified_start: bool = False,
+        initial_assignment: Assignment | None = None,
+        reference_assignment: Assignment | None = None,
+        movement_penalty: float = 0.0,
+        checkpointing: CheckpointOptions | None = None,
+        cancellation: Event | None = None,
+        cancellation_interval: int = 100,
+        reporting: ReportingOptions | None = None,
+    ) -> Assignment:
+        """Return a group assignment found by the search.
+
+        The arguments are described in detail by :meth:`SimulatedAnnealingAlgorithm.find_assignment`,
+        algorithms without a temperature ignore the temperature arguments.
+
+        :param participants: the set of participants to distribute into groups
+        :param groups_per_iteration: the number of groups in each iteration
+        :param iterations: the total number of iterations
+        :param max_cycles: the maximum number of cycles, None to only use the time budget
+        :param intitial_temperature: the initial temperature, defaults to 1
+        :param temperature_scaling: controls the rate of temperature decay, defaults to 15
+        :param mix_weight: the weight of the mix cost when evaluating assignments, defaults to 1
+        :param diversity_weight: the weight of the diversity cost, defaults to 1
+        :param progress_callback: gets called with current progress and total progress (optional)
+        :param stopping: the time budget and the convergence criteria of the run (optional)
+        :param auto_temperature: derive the temperatures from sampled swaps, defaults to False
+        :param guided_rate: the fraction of swaps proposed by a :class:`GuidedSwapGenerator`, defaults to 0
+        :param move_set: the move types to use besides plain swaps (optional)
+        :param stratified_start: start from an assignment of a :class:`StratifiedSeeder`, defaults to False
+        :param initial_assignment: an assignment of the participants to start from (optional)
+        :param reference_assignment: an assignment whose placements should be kept (optional)
+        :param movement_penalty: the cost of moving every participant away from the reference assignment,
+        defaults to 0
+        :param checkpointing: the checkpoint to continue from and the callback receiving checkpoints (optional)
+        :param cancellation: stop the run once this event is set (optional)
+        :param cancellation_interval: the number of cycles between two checks of the cancellation,
+        defaults to 100
+        :param reporting: the callback receiving :class:`ProgressReport` objects
+        and the interval of all progress reports (optional)
+
+        :return: the assignment with the lowest cost visited during the run
+
+        :raises ValueError: if neither a maximum number of cycles nor a time budget is given
+        """
+
+    @abstractmethod
+    def with_seed(self, seed: int) -> Self:
+        """Return an algorithm with the same settings and a new random source.
+
+        :param seed: the seed of the random source
+
+        :return: the new algorithm
+        """
+
+    def find_assignment_multi_start(
+        self,
+        participants: set[Participant],
+        groups_per_iteration: int,
+        iterations: int,
+        max_cycles: int,
+        chain_count: int,
+        max_workers: int | None = None,
+        intitial_temperature: float = 1,
+        temperature_scaling: float = 15,
+        mix_weight: float = 1,
+        diversity_weight: float = 1,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> tuple[Assignment, list[ChainStatistics]]:
+        """Run several independent chains in parallel processes and return the best result.
+
+        The seed of every chain is drawn from the random source of this instance before any chain starts,
+        so a seeded instance produces the same result regardless of the number of workers.
+        The chains are compared by costs normalized by the bounds of one random assignment,
+        drawn from the random source after the seeds, so all costs share the same scale.
+
+        :param participants: the set of participants to distribute into groups
+        :param groups_per_iteration: the number of groups in each iteration
+        :param iterations: the total number of iterations
+        :param max_cycles: the maximum number of cycles of every chain
+        :param chain_count: the number of independent chains
+        :param max_workers: the maximum number of worker processes, defaults to the number of processors
+        :param intitial_temperature: the initial temperature of every chain, deafults to 1
+        :param temperature_scaling: controls the rate of temperature decay, higher means quicker,
+        defaults to 15
+        :param mix_weight: the weight of the mix cost when evaluating assignments, defaults to 1
+        :param diversity_weight: the weight of the diversity cost, defaults to 1
+        :param progress_callback: gets called with the number of finished chains and the number of chains (optional)
+
+        :return: the assignment with the lowest cost and the statistics of every chain in start order
+        """
+        seeds: list[int] = [self.__random.getrandbits(64) for _ in range(chain_count)]
+        objective: ObjectiveFunction = ObjectiveFunction(
+            self.attributes, self.attribute_weights
+        )
+        objective.recalculate_bounds(
+            RandomAlgorithm(self.__random).find_assignment(
+                participants, groups_per_iteration, iterations
+            )
+        )
+        results: list[tuple[Assignment, float]] = [([], 0.0)] * chain_count
+        if progress_callback is not None:
+            progress_callback(0, chain_count)
+        with ProcessPoolExecutor(
+            max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures: dict[Future, int] = {
+                executor.submit(
+                    _run_chain,
+                    self.with_seed(seed),
+                    participants,
+                    groups_per_iteration,
+                    iterations,
+                    max_cycles,
+                    intitial_temperature,
+                    temperature_scaling,
+                    mix_weight,
+                    diversity_weight,
+                ): chain
+                for chain, seed in enumerate(seeds)
+            }
+            for finished, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                if progress_callback is not None:
+                    progress_callback(finished, chain_count)
+
+        # processes return copies of the participants, map them back to the given objects
+        originals: dict[Participant, Participant] = {
+            participant: participant for participant in participants
+        }
+        assignments: list[Assignment] = []
+        statistics: list[ChainStatistics] = []
+        for seed, (assignment, duration) in zip(seeds, results):
+            assignments.append(
+                [
+                    [set(map(originals.__getitem__, group)) for group in iteration]
+                    for iteration in assignment
+                ]
+            )
+            statistics.append(
+                ChainStatistics(
+                    seed,
+                    objective.calculate_weighted_cost(
+                        assignments[-1], mix_weight, diversity_weight
+                    ),
+                    duration,
+                )
+            )
+        best: int = min(range(chain_count), key=lambda chain: statistics[chain].cost)
+        return assignments[best], statistics
+
+    def find_assignment_in_process(
+        self,
+        participants: set[Participant],
+        groups_per_iteration: int,
+        iterations: int,
+        max_cycles: int | None,
+        cancellation: Event | None = None,
+        reporting: ReportingOptions | None = None,
+        poll_interval: float = 0.05,
+        **options,
+    ) -> Assignment:
+        """Run :meth:`find_assignment` in a child process, which neither holds the interpreter lock
+        of this process nor competes with its threads for a processor core.
+
+        The participants are sent once as their UIDs and the integer codes of their considered attribute values,
+        the child process reports its progress and returns the group of every participant over a pipe.
+        The seed of the child process is drawn from the random source of this instance,
+        so a seeded instance produces the same result every time,
+        though not the same as :meth:`find_assignment`, because the attribute values are replaced by codes.
+        :attr:`best_cost`, :attr:`best_cycle` and :attr:`cancelled` are taken over from the child process,
+        any other state of the run stays in it.
+
+        :param participants: the set of participants to distribute into groups
+        :param groups_per_iteration: the number of groups in each iteration
+        :param iterations: the total number of iterations
+        :param max_cycles: the maximum number of cycles, None to only use the time budget
+        :param cancellation: stop the run once this event is set,
+        it may be set from another thread (optional)
+        :param reporting: the callback receiving the :class:`ProgressReport` objects of the child process
+        and the interval the child process reports at, defaults to an interval of 0.05 seconds (optional)
+        :param poll_interval: the number of seconds between two checks of the cancellation, defaults to 0.05
+        :param options: further keyword arguments of :meth:`find_assignment`, except callbacks
+
+        :return: the assignment with the lowest cost visited during the run
+
+        :raises RuntimeError: if the child process fails
+        """
+        if reporting is None:
+            reporting = ReportingOptions()
+        encoding: ParticipantEncoding = ParticipantEncoding(
+            sorted(participants, key=lambda participant: participant.uid),
+            self.attributes,
+        )
+        connection, child_connection = multiprocessing.Pipe()
+        process: multiprocessing.process.BaseProcess = multiprocessing.get_context(
+            "spawn"
+        ).Process(
+            target=_run_in_process,
+            args=(
+                child_connection,
+                self.with_seed(self.__random.getrandbits(64)),
+                np.array([participant.uid for participant in encoding.participants]),
+                encoding.codes,
+                groups_per_iteration,
+                iterations,
+                max_cycles,
+                reporting.progress_interval,
+                options,
+            ),
+            daemon=True,
+        )
+        process.start()
+        # only the child process may hold the other end, so its exit is noticed as the end of the pipe
+        child_connection.close()
+        try:
+            group_ids, self.best_cost, self.best_cycle, self.cancelled = (
+                self.__receive_result(
+                    connection, cancellation, reporting.report_callback, poll_interval
+                )
+            )
+        finally:
+            connection.close()
+            process.join()
+        return CompactAssignment(
+            encoding.participants, group_ids, groups_per_iteration
+        ).to_assignment()
+
+    def __receive_result(
+        self,
+        connection: Connection,
+        cancellation: Event | None,
+        report_callback: Callable[[ProgressReport], None] | None,
+        poll_interval: float,
+    ) -> tuple[np.ndarray, float, int, bool]:
+        """Pass on the progress reports of a child process until it sends its result.
+
+        :param connection: The end of the pipe to the child process
+        :param cancellation: Passed on to the child process once it is set, None if the run cannot be cancelled
+        :param report_callback: Gets called with the progress reports (optional)
+        :param poll_interval: The number of seconds between two checks of the cancellation
+
+        :return: The group of every participant, the best cost, the best cycle and whether the run was cancelled
+
+        :raises RuntimeError: if the child process fails
+        """
+        cancelling: bool = False
+        while True:
+            if cancellation is not None and cancellation.is_set() and not cancelling:
+                connection.send(("cancel",))
+                cancelling = True
+            if not connection.poll(poll_interval):
+                continue
+            try:
+                message: tuple = connection.recv()
+            except EOFError as error:
+                raise RuntimeError("The search process ended unexpectedly") from error
+            if message[0] == "result":
+                return message[1:]
+            if message[0] == "error":
+                raise RuntimeError(f"The search process failed: {message[1]}")
+            if report_callback is not None:
+                report_callback(message[1])
+
+
+def _run_in_process(
+    connection: Connection,
+    algorithm: SearchAlgorithm,
+    uids: np.ndarray,
+    codes: np.ndarray,
+    groups_per_iteration: int,
+    iterations: int,
+    max_cycles: int | None,
+    progress_interval: float,
+    options: dict,
+) -> None:
+    """Run :meth:`SearchAlgorithm.find_assignment` as the target of a child process.
+
+    Participants are rebuilt from their UIDs with the codes as attribute values,
+    which have the same costs as the original values.
+    Progress is sent over the pipe as `("report", report)`, the result as
+    `("result", group_ids, best_cost, best_cycle, cancelled)` with groups indexed like the UIDs,
+    an exception as `("error", message)`. A `("cancel",)` message from the other end cancels the run.
+
+    :param connection: the end of the pipe to the parent process
+    :param algorithm: the algorithm to run, with the random source of the child process
+    :param uids: the UIDs of the participants
+    :param codes: the attribute value codes of the participants, indexed by [participant, attribute]
+    :param groups_per_iteration: the number of groups in each iteration
+    :param iterations: the total number of iterations
+    :param max_cycles: the maximum number of cycles, None to only use the time budget
+    :param progress_interval: the minimum number of seconds between two progress reports
+    :param options: further keyword arguments of :meth:`SearchAlgorithm.find_assignment`
+    """
+    participants: list[Participant] = [
+        Participant(int(uid), dict(zip(algorithm.attributes, map(str, row))))
+        for uid, row in zip(uids, codes)
+    ]
+    cancellation: Event = Event()
+    Thread(target=_await_cancel, args=(connection, cancellation), daemon=True).start()
+    try:
+        assignment: Assignment = algorithm.find_assignment(
+            set(participants),
+            groups_per_iteration,
+            iterations,
+            max_cycles,
+            cancellation=cancellation,
+            reporting=ReportingOptions(
+                lambda report: connection.send(("report", report)), progress_interval
+            ),
+            **options,
+        )
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        connection.send(("error", repr(error)))
+        return
+    connection.send(
+        (
+            "result",
+            CompactAssignment.from_assignment(assignment, participants).group_ids,
+            algorithm.best_cost,
+            algorithm.best_cycle,
+            algorithm.cancelled,
+        )
+    )
+
+
+def _await_cancel(connection: Connection, cancellation: Event) -> None:
+    """Set an event once a cancel message arrives, used as a thread of the child process of a run.
+
+    :param connection: the end of the pipe to the parent process
+    :param cancellation: the event to set
+    """
+    try:
+        while connection.recv()[0] != "cancel":
+            pass
+    except (EOFError, OSError):
+        return
+    cancellation.set()
+
+
+def _run_chain(
+    algorithm: SearchAlgorithm,
+    participants: set[Participant],
+    groups_per_iteration: int,
+    iterations: int,
+    max_cycles: int,
+    intitial_temperature: float,
+    temperature_scaling: float,
+    mix_weight: float,
+    diversity_weight: float,
+) -> tuple[Assignment, float]:
+    """Run one chain, used as the task of the worker processes of a multi-start run.
+
+    :param algorithm: the algorithm to run, with the random source of the chain
+    :param participants: the set of participants to distribute into groups
+    :param groups_per_iteration: the number of groups in each iteration
+    :param iterations: the total number of iterations
+    :param max_cycles: the maximum number of cycles
+    :param intitial_temperature: the initial temperature
+    :param temperature_scaling: controls the rate of temperature decay
+    :param mix_weight: the weight of the mix cost
+    :param diversity_weight: the weight of the diversity cost
+
+    :return: the found assignment and the duration of the chain in seconds
+    """
+    start: float = time.perf_counter()
+    assignment: Assignment = algorithm.find_assignment(
+        participants,
+        groups_per_iteration,
+        iterations,
+        max_cycles,
+        intitial_temperature,
+        temperature_scaling,
+        mix_weight,
+        diversity_weight,
+    )
+    return assignment, time.perf_counter() - start
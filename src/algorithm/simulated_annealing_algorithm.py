@@ -1,131 +1,600 @@
 """Simulated Annealing algorithm module"""
 
-from copy import copy
 from math import exp
 from random import Random
-from typing import Any, Callable
+from threading import Event
+import time
+from typing import Callable, Self
+import numpy as np
+from algorithm.annealing_checkpoint import AnnealingCheckpoint, CheckpointOptions
+from algorithm.best_assignment_tracker import BestAssignmentTracker
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.design_constructor import DesignConstructor
+from algorithm.local_search import LocalSearch
+from algorithm.move_set import MoveSet
+from algorithm.movement_penalty import MovementPenalty
 from algorithm.objective_function import ObjectiveFunction
+from algorithm.progress_reporter import ProgressReporter, ReportingOptions
 from algorithm.random_algorithm import RandomAlgorithm
-from data_structures import Assignment, Iteration, Participant
+from algorithm.roster_repair import repair_assignment
+from algorithm.search_algorithm import SearchAlgorithm
+from algorithm.single_iteration_solver import SingleIterationSolver
+from algorithm.stopping_criteria import StoppingCriteria, StoppingOptions
+from algorithm.stratified_seeder import StratifiedSeeder
+from algorithm.temperature_calibration import calibrate_temperature
+from algorithm.trace_recorder import TraceRecorder
+from data_structures import Assignment, Participant
 
 
-class SimulatedAnnealingAlgorithm:
+class SimulatedAnnealingAlgorithm(SearchAlgorithm):
     """Contains the calculations for generating group assignments using simulated annealing.
 
     :param attributes: A list of attributes that are considered for optimization
     :param random_instance: An instance of Random that will be used
     instead of an automatically generated one as a source or randomness, defaults to None
+    :param attribute_weights: a dict mapping attributes to float weights, defaults to an empty dict
+    :param trace_capacity: the maximum number of cycles kept in :attr:`trace`, defaults to 10000
+    :param trace_stride: only every `trace_stride`-th cycle is recorded in :attr:`trace`, defaults to 1
     """
 
-    __random: Random
-    attributes: list[str]
-    attribute_weights: dict[str, float]
+    #: the acceptance rate of uphill swaps the temperature is calibrated to when starting from a constructed
+    #: assignment, lower than for a random start so the annealing refines the assignment instead of melting it
+    WARM_START_ACCEPTANCE_RATE: float = 0.05
 
-    temperatures: list[float] = []
-    scores: list[float] = []
+    __random: Random
+    trace: TraceRecorder
+    checkpoint: AnnealingCheckpoint | None
 
     def __init__(
         self,
         attributes: list[str],
         random_instance: Random = None,
         attribute_weights: dict[str, float] = dict(),
+        trace_capacity: int = 10000,
+        trace_stride: int = 1,
     ):
-        self.__random = Random() if random_instance is None else random_instance
-        self.attributes = attributes
-        self.attribute_weights = attribute_weights
+        random: Random = Random() if random_instance is None else random_instance
+        super().__init__(attributes, random, attribute_weights)
+        self.__random = random
+        self.trace = TraceRecorder(trace_capacity, trace_stride)
+        self.checkpoint = None
+
+    def with_seed(self, seed: int) -> Self:
+        """Return an algorithm with the same settings and a new random source.
+
+        :param seed: the seed of the random source
+
+        :return: the new algorithm
+        """
+        return type(self)(
+            self.attributes,
+            Random(seed),
+            self.attribute_weights,
+            self.trace.capacity,
+            self.trace.stride,
+        )
 
     def find_assignment(
         self,
         participants: set[Participant],
         groups_per_iteration: int,
         iterations: int,
-        max_cycles: int,
+        max_cycles: int | None,
         intitial_temperature: float = 1,
         temperature_scaling: float = 15,
         mix_weight: float = 1,
         diversity_weight: float = 1,
         progress_callback: Callable[[int, int], None] | None = None,
+        stopping: StoppingOptions | None = None,
+        auto_temperature: bool = False,
+        guided_rate: float = 0.0,
+        move_set: MoveSet | None = None,
+        stratified_start: bool = False,
+        initial_assignment: Assignment | None = None,
+        reference_assignment: Assignment | None = None,
+        movement_penalty: float = 0.0,
+        checkpointing: CheckpointOptions | None = None,
+        cancellation: Event | None = None,
+        cancellation_interval: int = 100,
+        reporting: ReportingOptions | None = None,
     ) -> Assignment:
         """Return a group assignment generated using simulated annealing.
 
+        A single iteration has no mix cost, it is solved directly by a :class:`SingleIterationSolver`
+        without annealing and without entries in :attr:`trace`,
+        unless the run is warm-started, resumed, checkpointed or compared against a reference assignment.
+        Without a diversity cost, because its weight is 0 or no attributes are considered,
+        the run starts from a combinatorial design of a :class:`DesignConstructor`.
+        Otherwise the run ends after `max_cycles` cycles or once the time budget has passed,
+        whichever comes first, and the temperature follows the larger of the two progress fractions.
+        It ends early once the assignment has converged according to the stopping options,
+        reached a cost of 0, which cannot be improved, or is cancelled, which is recorded in :attr:`cancelled`.
+        The temperature and cost of the cycles of the run are recorded in :attr:`trace`,
+        the cost of the returned assignment and the cycle it was found at
+        in :attr:`best_cost` and :attr:`best_cycle`, 0 meaning the initial assignment,
+        and the state at the end of the run in :attr:`checkpoint`.
+
+        A run continued from a checkpoint takes the same decisions as if it had not been interrupted,
+        provided it gets the same cycle limit and options, only the selection probabilities of a move set
+        start over. Its temperature schedule is the one of the checkpoint,
+        the progress through it follows the limits given now, so extending a finished run with more cycles
+        reheats it to the temperature of its new progress.
+
         :param participants: the set of participants to distribute into groups
         :param groups_per_iteration: the number of groups in each iteration
         :param iterations: the total number of iterations
         :param max_cycles: the maximum number of times
-        the algorithm will iteratively improve the assignment
+        the algorithm will iteratively improve the assignment, None to only use the time budget
         :param intitial_temperature: the initial Temperature, deafults to 1
         :param temperature_scaling: controls the rate of temperature decay, higher means quicker,
         defaults to 15
         :param mix_weight: the weight of the mix cost when evaluating assignments,
         only the size of this number compared to the diversity weight matters, defaults to 1
         :param diversity_weight: the weight of the diversity cost, defaults to 1
-        :param progress_callback: gets called with current progress and total progress (optional)
-
-        :return: the generated assignment
+        :param progress_callback: gets called with current progress and total progress,
+        at the start and the end of the run and at most once per progress interval in between (optional)
+        :param stopping: the time budget and the convergence criteria of the run,
+        defaults to only the cycle limit (optional)
+        :param auto_temperature: derive the initial temperature and the temperature scaling from sampled swaps
+        instead of using the given values, see :func:`calibrate_temperature`, defaults to False
+        :param guided_rate: the fraction of swaps proposed by a :class:`GuidedSwapGenerator`,
+        the others are picked uniformly, defaults to 0
+        :param move_set: the move types to use besides plain swaps and their selection,
+        by default only swaps are proposed (optional)
+        :param stratified_start: start from an assignment of a :class:`StratifiedSeeder`
+        instead of a random one, a calibrated temperature then starts at
+        :attr:`WARM_START_ACCEPTANCE_RATE` as it does when starting from a design, defaults to False
+        :param initial_assignment: an assignment of the participants to start from instead of a generated one,
+        a calibrated temperature then starts at :attr:`WARM_START_ACCEPTANCE_RATE` (optional)
+        :param reference_assignment: an assignment whose placements should be kept,
+        used with the movement penalty (optional)
+        :param movement_penalty: the cost added if every participant of the reference assignment
+        is placed in a different group than in it in every iteration, added proportionally
+        for fewer changed placements and included in :attr:`best_cost` and :attr:`trace`, defaults to 0
+        :param checkpointing: the checkpoint to continue from, it has to match the participants,
+        the number of groups and the number of iterations, and the callback receiving checkpoints of the run,
+        defaults to neither (optional)
+        :param cancellation: stop the run once this event is set,
+        it may be set from another thread (optional)
+        :param cancellation_interval: the number of cycles between two checks of the cancellation,
+        defaults to 100
+        :param reporting: the callback receiving :class:`ProgressReport` objects of the run
+        and the interval of all progress reports, defaults to an interval of 0.05 seconds (optional)
+
+        :return: the assignment with the lowest cost visited during the run
+
+        :raises ValueError: if neither a maximum number of cycles nor a time budget is given,
+        or if the checkpoint does not match the run
         """
-        random: RandomAlgorithm = RandomAlgorithm(self.__random)
-        assignment: Assignment = random.find_assignment(
-            participants, groups_per_iteration, iterations
+        criteria: StoppingCriteria = StoppingCriteria(
+            max_cycles, stopping, cancellation, cancellation_interval
+        )
+        if checkpointing is None:
+            checkpointing = CheckpointOptions()
+        checkpoint: AnnealingCheckpoint | None = checkpointing.resume_from
+        self.checkpoint = None
+        self.cancelled = False
+        reporter: ProgressReporter = ProgressReporter.from_options(
+            criteria.progress_total, progress_callback, reporting
         )
+        if (
+            iterations == 1
+            and initial_assignment is None
+            and reference_assignment is None
+            and checkpoint is None
+            and checkpointing.callback is None
+        ):
+            return self.__solve_single_iteration(
+                participants,
+                groups_per_iteration,
+                mix_weight,
+                diversity_weight,
+                reporter,
+            )
+        mix_only: bool = diversity_weight == 0 or len(self.attributes) == 0
         objective: ObjectiveFunction = ObjectiveFunction(
             self.attributes, self.attribute_weights
         )
-        if progress_callback is not None:
-            progress_callback(0, max_cycles)
-        for i in range(1, max_cycles + 1):
-            temperature: float = self.get_temperature(
-                i / max_cycles, intitial_temperature, temperature_scaling
+        if checkpoint is None:
+            state: CompactAssignment = self.__initial_state(
+                objective,
+                participants,
+                groups_per_iteration,
+                iterations,
+                initial_assignment,
+                stratified_start,
+                mix_only,
             )
-            neighbor: Assignment = self.find_neighbor(assignment)
-            if self.__should_take_step(
-                assignment,
-                neighbor,
-                temperature,
+            sample_group_ids: np.ndarray = state.group_ids.copy()
+        else:
+            state = self.__restore(
+                objective, participants, groups_per_iteration, iterations, checkpoint
+            )
+            sample_group_ids = checkpoint.sample_group_ids
+            intitial_temperature = checkpoint.initial_temperature
+            temperature_scaling = checkpoint.temperature_scaling
+        if auto_temperature and checkpoint is None:
+            intitial_temperature, temperature_scaling = self.__calibrate(
                 objective,
+                state,
                 mix_weight,
                 diversity_weight,
+                stratified_start or mix_only or initial_assignment is not None,
+                (intitial_temperature, temperature_scaling),
+            )
+        search: LocalSearch = LocalSearch(
+            objective,
+            state,
+            MovementPenalty(state, reference_assignment, movement_penalty),
+            mix_weight,
+            diversity_weight,
+            guided_rate,
+            move_set,
+        )
+        self.trace.clear()
+
+        cost: float = search.cost()
+        best: BestAssignmentTracker = BestAssignmentTracker(state, cost)
+        cycle: int = 0
+        elapsed: float = 0.0
+        if checkpoint is not None:
+            best.restore(
+                checkpoint.best_group_ids,
+                search.cost(checkpoint.best_group_ids),
+                checkpoint.best_cycle,
+            )
+            cycle, criteria.accepted, elapsed = (
+                checkpoint.cycle,
+                checkpoint.accepted,
+                checkpoint.elapsed,
+            )
+        self.__anneal(
+            search,
+            state,
+            best,
+            cost,
+            cycle,
+            elapsed,
+            criteria,
+            reporter,
+            checkpointing,
+            sample_group_ids,
+            intitial_temperature,
+            temperature_scaling,
+        )
+        self.best_cost = best.cost
+        self.best_cycle = best.cycle
+        return best.best_assignment().to_assignment()
+
+    def __anneal(
+        self,
+        search: LocalSearch,
+        state: CompactAssignment,
+        best: BestAssignmentTracker,
+        cost: float,
+        cycle: int,
+        elapsed: float,
+        criteria: StoppingCriteria,
+        reporter: ProgressReporter,
+        checkpointing: CheckpointOptions,
+        sample_group_ids: np.ndarray,
+        intitial_temperature: float,
+        temperature_scaling: float,
+    ) -> None:
+        """Run the annealing cycles until one of the stopping criteria is met, changing the assignment in place.
+
+        :param search: Proposes and applies the moves of the run
+        :param state: The current assignment
+        :param best: The tracker of the best assignment
+        :param cost: The cost of the current assignment
+        :param cycle: The number of completed cycles, 0 unless the run is continued
+        :param elapsed: The seconds the run has taken so far, 0 unless it is continued
+        :param criteria: The stopping criteria of the run
+        :param reporter: Reports the progress of the run
+        :param checkpointing: Receives the checkpoints of the run
+        :param sample_group_ids: The assignment the normalization bounds are calculated from
+        :param intitial_temperature: The initial temperature of the schedule
+        :param temperature_scaling: The temperature scaling of the schedule
+        """
+        start: float = time.perf_counter() - elapsed
+        progress: float = criteria.progress(cycle, elapsed)
+        reporter.start(progress, cycle, cost, best.cost)
+        # the cost is a running sum of deltas, rounding errors may keep it from reaching exactly 0
+        while progress < 1 and best.cost > 1e-9:
+            cycle += 1
+            progress = criteria.progress(cycle, time.perf_counter() - start)
+            temperature: float = self.get_temperature(
+                progress, intitial_temperature, temperature_scaling
+            )
+            move_type, move, delta = search.propose(self.__random)
+            taken: bool = self.__should_take_step(cost, cost + delta, temperature)
+            if taken:
+                search.take(move, best)
+                cost += delta
+            else:
+                search.undo(move)
+            search.record(move_type, taken and delta < 0)
+            best.update(cycle, cost)
+            self.trace.record(cycle, temperature, cost)
+            reporter.update(progress, cycle, cost, best.cost)
+
+            if criteria.should_stop(cycle, best.cycle, taken):
+                break
+            if (
+                checkpointing.callback is not None
+                and cycle % checkpointing.interval == 0
             ):
-                assignment = neighbor
-            self.scores.append(
-                objective.calculate_weighted_cost(
-                    assignment, mix_weight, diversity_weight
+                checkpointing.callback(
+                    self.__checkpoint(
+                        state,
+                        best,
+                        sample_group_ids,
+                        cycle,
+                        criteria.accepted,
+                        time.perf_counter() - start,
+                        intitial_temperature,
+                        temperature_scaling,
+                    )
                 )
-            )
-            if progress_callback is not None:
-                progress_callback(i, max_cycles)
-        return assignment
 
-    def __should_take_step(
+        reporter.finish(progress, cycle, cost, best.cost)
+        self.cancelled = criteria.cancelled
+        self.checkpoint = self.__checkpoint(
+            state,
+            best,
+            sample_group_ids,
+            cycle,
+            criteria.accepted,
+            time.perf_counter() - start,
+            intitial_temperature,
+            temperature_scaling,
+        )
+
+    def __calibrate(
+        self,
+        objective: ObjectiveFunction,
+        state: CompactAssignment,
+        mix_weight: float,
+        diversity_weight: float,
+        warm_start: bool,
+        schedule: tuple[float, float],
+    ) -> tuple[float, float]:
+        """Derive the temperature schedule of a new run from sampled swaps.
+
+        :param objective: The objective function of the run
+        :param state: The initial assignment
+        :param mix_weight: The weight of the mix cost
+        :param diversity_weight: The weight of the diversity cost
+        :param warm_start: Whether the initial assignment was constructed or given instead of drawn at random,
+        the temperature then starts at :attr:`WARM_START_ACCEPTANCE_RATE`
+        :param schedule: The given initial temperature and temperature scaling
+
+        :return: The calibrated initial temperature and temperature scaling,
+        the given ones if no sampled swap raises the cost
+        """
+        calibration: tuple[float, float] | None = calibrate_temperature(
+            objective,
+            state,
+            self.__random,
+            mix_weight,
+            diversity_weight,
+            initial_acceptance_rate=(
+                self.WARM_START_ACCEPTANCE_RATE if warm_start else 0.8
+            ),
+        )
+        return schedule if calibration is None else calibration
+
+    def reoptimize(
         self,
         assignment: Assignment,
-        neighbor: Assignment,
-        temperature: float,
+        added: set[Participant],
+        removed: set[Participant],
+        max_cycles: int = 2000,
+        movement_penalty: float = 0.5,
+        mix_weight: float = 1,
+        diversity_weight: float = 1,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> Assignment:
+        """Adapt a published assignment to added and removed participants.
+
+        The assignment is repaired locally by :func:`repair_assignment`,
+        then a short run starting from the repaired assignment at a calibrated warm-start temperature
+        improves it, penalizing every changed placement of a participant of the published assignment.
+
+        :param assignment: the published assignment, it is not changed
+        :param added: the participants to add
+        :param removed: the participants to remove
+        :param max_cycles: the maximum number of cycles of the run, defaults to 2000
+        :param movement_penalty: the cost added if every participant changed groups in every iteration,
+        see :meth:`find_assignment`, defaults to 0.5
+        :param mix_weight: the weight of the mix cost, defaults to 1
+        :param diversity_weight: the weight of the diversity cost, defaults to 1
+        :param progress_callback: gets called with current progress and total progress (optional)
+
+        :return: the adapted assignment, with the groups in the same order as the published one
+        """
+        repaired: Assignment = repair_assignment(
+            assignment, added, removed, self.__random
+        )
+        participants: set[Participant] = set().union(*repaired[0])
+        return self.find_assignment(
+            participants,
+            len(repaired[0]),
+            len(repaired),
+            max_cycles,
+            mix_weight=mix_weight,
+            diversity_weight=diversity_weight,
+            progress_callback=progress_callback,
+            auto_temperature=True,
+            initial_assignment=repaired,
+            reference_assignment=assignment,
+            movement_penalty=movement_penalty,
+        )
+
+    def __initial_state(
+        self,
         objective: ObjectiveFunction,
+        participants: set[Participant],
+        groups_per_iteration: int,
+        iterations: int,
+        initial_assignment: Assignment | None,
+        stratified_start: bool,
+        mix_only: bool,
+    ) -> CompactAssignment:
+        """Return the assignment a new run starts from.
+
+        :param objective: The objective function of the run
+        :param participants: The set of participants to distribute into groups
+        :param groups_per_iteration: The number of groups in each iteration
+        :param iterations: The total number of iterations
+        :param initial_assignment: The assignment to start from, None to generate one
+        :param stratified_start: Whether to generate the assignment with a :class:`StratifiedSeeder`
+        :param mix_only: Whether only the mix cost matters, the assignment is then generated
+        with a :class:`DesignConstructor`
+
+        :return: The initial assignment, its participants ordered like the encoding of the objective function
+        """
+        if initial_assignment is None:
+            seeder: RandomAlgorithm | StratifiedSeeder | DesignConstructor = (
+                RandomAlgorithm(self.__random)
+            )
+            if mix_only:
+                seeder = DesignConstructor(self.__random)
+            elif stratified_start:
+                seeder = StratifiedSeeder(
+                    self.attributes, self.__random, self.attribute_weights
+                )
+            initial_assignment = seeder.find_assignment(
+                participants, groups_per_iteration, iterations
+            )
+        return CompactAssignment.from_assignment(
+            initial_assignment, objective.encode(initial_assignment).participants
+        )
+
+    def __restore(
+        self,
+        objective: ObjectiveFunction,
+        participants: set[Participant],
+        groups_per_iteration: int,
+        iterations: int,
+        checkpoint: AnnealingCheckpoint,
+    ) -> CompactAssignment:
+        """Restore the assignment, the normalization and the random source of a checkpoint.
+
+        :param objective: The objective function of the run
+        :param participants: The set of participants to distribute into groups
+        :param groups_per_iteration: The number of groups in each iteration
+        :param iterations: The total number of iterations
+        :param checkpoint: The checkpoint to continue from
+
+        :return: The current assignment of the checkpoint
+
+        :raises ValueError: if the checkpoint does not match the participants or the shape of the run
+        """
+        participants_by_uid: dict[int, Participant] = {
+            participant.uid: participant for participant in participants
+        }
+        if (
+            checkpoint.groups_per_iteration != groups_per_iteration
+            or checkpoint.group_ids.shape != (iterations, len(participants))
+            or participants_by_uid.keys() != set(checkpoint.participant_uids)
+        ):
+            raise ValueError("The checkpoint does not match the participants and shape")
+        order: list[Participant] = [
+            participants_by_uid[uid] for uid in checkpoint.participant_uids
+        ]
+        objective.recalculate_bounds(
+            CompactAssignment(
+                order, checkpoint.sample_group_ids, groups_per_iteration
+            ).to_assignment()
+        )
+        self.__random.setstate(checkpoint.random_state)
+        return CompactAssignment(
+            order, checkpoint.group_ids, groups_per_iteration, checkpoint.positions
+        )
+
+    def __checkpoint(
+        self,
+        state: CompactAssignment,
+        best: BestAssignmentTracker,
+        sample_group_ids: np.ndarray,
+        cycle: int,
+        accepted: int,
+        elapsed: float,
+        intitial_temperature: float,
+        temperature_scaling: float,
+    ) -> AnnealingCheckpoint:
+        """Capture the state of a run.
+
+        :param state: The current assignment
+        :param best: The tracker of the best assignment
+        :param sample_group_ids: The assignment the normalization bounds are calculated from
+        :param cycle: The number of completed cycles
+        :param accepted: The number of accepted moves in the current acceptance window
+        :param elapsed: The seconds the run has taken so far
+        :param intitial_temperature: The initial temperature of the schedule
+        :param temperature_scaling: The temperature scaling of the schedule
+
+        :return: The checkpoint
+        """
+        return AnnealingCheckpoint(
+            [participant.uid for participant in state.participants],
+            state.groups_per_iteration,
+            sample_group_ids.copy(),
+            state.group_ids.copy(),
+            state.positions.copy(),
+            best.best_group_ids(),
+            best.cycle,
+            cycle,
+            accepted,
+            elapsed,
+            intitial_temperature,
+            temperature_scaling,
+            self.__random.getstate(),
+        )
+
+    def __solve_single_iteration(
+        self,
+        participants: set[Participant],
+        groups_per_iteration: int,
         mix_weight: float,
         diversity_weight: float,
+        reporter: ProgressReporter,
+    ) -> Assignment:
+        """Return the groups of a single iteration found by a :class:`SingleIterationSolver`.
+
+        :param participants: The set of participants to distribute into groups
+        :param groups_per_iteration: The number of groups
+        :param mix_weight: The weight of the mix cost
+        :param diversity_weight: The weight of the diversity cost
+        :param reporter: Reports the end of the run once the assignment is found
+
+        :return: The assignment
+        """
+        assignment: Assignment = SingleIterationSolver(
+            self.attributes, self.__random, self.attribute_weights
+        ).find_assignment(participants, groups_per_iteration)
+        self.trace.clear()
+        self.best_cost = ObjectiveFunction(
+            self.attributes, self.attribute_weights
+        ).calculate_weighted_cost(assignment, mix_weight, diversity_weight)
+        self.best_cycle = 0
+        reporter.finish(1.0, 0, self.best_cost, self.best_cost)
+        return assignment
+
+    def __should_take_step(
+        self, cost: float, neighbor_cost: float, temperature: float
     ) -> bool:
         """Determines whether the algorithm takes the step to a given neighbor.
 
-        :param assignment: the current assignment
-        :param neighbor: the neighboring assignment
+        :param cost: the cost of the current assignment
+        :param neighbor_cost: the cost of the neighboring assignment
         :param temperature: the current temperature
-        :param objective: the objective function to use
-        :param mix_weight: the weight of the mix cost when evaluating assignments,
-        only the size of this number compared to the diversity weight matters
-        :param diversity_weight: the weight of the diversity cost
 
         :return: true if the steep should be taken, false otherwise
         """
         return (
-            self.get_step_probability(
-                objective.calculate_weighted_cost(
-                    assignment, mix_weight, diversity_weight
-                ),
-                objective.calculate_weighted_cost(
-                    neighbor, mix_weight, diversity_weight
-                ),
-                temperature,
-            )
+            self.get_step_probability(cost, neighbor_cost, temperature)
             >= self.__random.random()
         )
 
@@ -140,14 +609,7 @@ class SimulatedAnnealingAlgorithm:
 
         :return: The temperature value
         """
-
-        temperature: float = (
-            intitial_temperature * (1 - progress) * exp(-scaling * progress)
-        )
-
-        self.temperatures.append(temperature)
-
-        return temperature
+        return intitial_temperature * (1 - progress) * exp(-scaling * progress)
 
     def find_neighbor(self, assignment: Assignment) -> Assignment:
         """Return a random group assignment that is one swap removed from the given assignment.
@@ -156,57 +618,9 @@ class SimulatedAnnealingAlgorithm:
 
         :return: The found neighbor
         """
-        neighbor: Assignment = self.__half_deep_copy(assignment)
-        index = self.__random.randrange(len(assignment))
-        iteration: Iteration = assignment[index]
-        group_index_1: int = self.__random.randrange(len(iteration))
-        participant_index_1: int = self.__random.randrange(
-            len(iteration[group_index_1])
-        )
-
-        group_index_2: int = -1
-        while group_index_2 in (-1, group_index_1):
-            group_index_2 = self.__random.randrange(len(iteration))
-        participant_index_2: int = self.__random.randrange(
-            len(iteration[group_index_2])
-        )
-
-        self.__swap_between_sets(
-            neighbor[index][group_index_1],
-            neighbor[index][group_index_2],
-            list(iteration[group_index_1])[participant_index_1],
-            list(iteration[group_index_2])[participant_index_2],
-        )
-        return neighbor
-
-    def __swap_between_sets(
-        self, set_1: set, set_2: set, element_1: Any, element_2: Any
-    ) -> None:
-        """Swaps two elements between two sets.
-
-        :param set_1: the first set
-        :param set_2: the second set
-        :param element_1: the first element, initially in set_1
-        :param element_2: the second element, initially in set_2
-        """
-        set_1.discard(element_1)
-        set_2.add(element_1)
-        set_2.discard(element_2)
-        set_1.add(element_2)
-
-    def __half_deep_copy(self, obj: Any) -> Any:
-        """Return a recursive deep copy of the given object
-        that stops at any element that isn't a set or list.
-
-        :param obj: The object to copy
-
-        :return: The copy
-        """
-        if isinstance(obj, list):
-            return [self.__half_deep_copy(item) for item in obj]
-        if isinstance(obj, set):
-            return {self.__half_deep_copy(item) for item in obj}
-        return copy(obj)
+        state: CompactAssignment = CompactAssignment.from_assignment(assignment)
+        state.swap(*state.random_swap(self.__random))
+        return state.to_assignment()
 
     def get_step_probability(
         self, energy_old: float, energy_new: float, temperature: float
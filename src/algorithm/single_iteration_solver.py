@@ -0,0 +1,233 @@
+"""Single iteration solver module"""
+
+from random import Random
+import numpy as np
+from data_structures import Assignment, Participant
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.participant_encoding import ParticipantEncoding
+
+
+class SingleIterationSolver:
+    """Calculates the groups of a single iteration by balancing attribute value counts directly.
+
+    With a single iteration no pair can meet twice, so only the diversity cost matters,
+    and it only depends on how many participants of each attribute profile,
+    the tuple of all attribute values, every group receives.
+    The solver distributes these counts instead of individual participants:
+    participants are placed greedily, largest profile first, into the group whose cost grows least,
+    then pairs of participants of different profiles are exchanged between groups as long as
+    the best exchange lowers the cost. Participants sharing a profile are interchangeable,
+    which of them joins which group is random.
+
+    :param attributes: A list of attributes that are considered for optimization
+    :param random_instance: An instance of Random that will be used
+    instead of an automatically generated one as a source or randomness, defaults to None
+    :param attribute_weights: a dict mapping attributes to float weights, defaults to an empty dict
+    :param max_exchanges: the maximum number of exchanges, defaults to 10000
+    """
+
+    __random: Random
+    attributes: list[str]
+    attribute_weights: dict[str, float]
+    max_exchanges: int
+
+    def __init__(
+        self,
+        attributes: list[str],
+        random_instance: Random = None,
+        attribute_weights: dict[str, float] = dict(),
+        max_exchanges: int = 10000,
+    ):
+        self.__random = Random() if random_instance is None else random_instance
+        self.attributes = attributes
+        self.attribute_weights = attribute_weights
+        self.max_exchanges = max_exchanges
+
+    def find_assignment(
+        self, participants: set[Participant], groups_per_iteration: int
+    ) -> Assignment:
+        """Return an assignment of one iteration with balanced attribute values.
+
+        :param participants: The set of participants to distribute into groups
+        :param groups_per_iteration: The number of groups
+
+        :return: The generated assignment
+        """
+        encoding: ParticipantEncoding = ParticipantEncoding(
+            sorted(participants, key=lambda participant: participant.uid),
+            self.attributes,
+            self.attribute_weights,
+        )
+        profiles, profile_ids = np.unique(encoding.slots, axis=0, return_inverse=True)
+        profile_ids = profile_ids.reshape(-1)
+        # indicator of the attribute values of every profile, indexed by [profile, slot]
+        values: np.ndarray = np.zeros((len(profiles), encoding.slot_count))
+        np.put_along_axis(values, profiles, 1.0, axis=1)
+        sizes: np.ndarray = np.full(
+            groups_per_iteration, len(participants) // groups_per_iteration
+        )
+        sizes[: len(participants) % groups_per_iteration] += 1
+
+        counts: np.ndarray = self.__place_greedily(
+            values, np.bincount(profile_ids), sizes, encoding.slot_weights
+        )
+        self.__exchange(counts, values, sizes, encoding.slot_weights)
+
+        members: list[list[int]] = [
+            np.flatnonzero(profile_ids == profile).tolist()
+            for profile in range(len(profiles))
+        ]
+        group_ids: np.ndarray = np.zeros((1, len(participants)), dtype=np.intp)
+        for profile, profile_members in enumerate(members):
+            self.__random.shuffle(profile_members)
+            group_ids[0, profile_members] = np.repeat(
+                np.arange(groups_per_iteration), counts[profile]
+            )
+        return CompactAssignment(
+            encoding.participants, group_ids, groups_per_iteration
+        ).to_assignment()
+
+    def __place_greedily(
+        self,
+        values: np.ndarray,
+        profile_sizes: np.ndarray,
+        sizes: np.ndarray,
+        weights: np.ndarray,
+    ) -> np.ndarray:
+        """Place the participants one by one, largest profile first,
+        into the group with free places whose cost grows least.
+
+        :param values: The attribute values of every profile, indexed by [profile, slot]
+        :param profile_sizes: The number of participants of every profile
+        :param sizes: The size of every group
+        :param weights: The weight of every slot
+
+        :return: The number of participants of every profile in every group, indexed by [profile, group]
+        """
+        counts: np.ndarray = np.zeros((len(values), len(sizes)), dtype=np.intp)
+        histograms: np.ndarray = np.zeros((len(sizes), values.shape[1]))
+        filled: np.ndarray = np.zeros(len(sizes), dtype=np.intp)
+        for profile in np.argsort(-profile_sizes, kind="stable"):
+            for _ in range(profile_sizes[profile]):
+                growth: np.ndarray = self.__group_costs(
+                    histograms + values[profile], filled + 1, weights
+                ) - self.__group_costs(histograms, filled, weights)
+                growth[filled >= sizes] = np.inf
+                group: int = int(np.argmin(growth))
+                counts[profile, group] += 1
+                histograms[group] += values[profile]
+                filled[group] += 1
+        return counts
+
+    def __exchange(
+        self,
+        counts: np.ndarray,
+        values: np.ndarray,
+        sizes: np.ndarray,
+        weights: np.ndarray,
+    ) -> None:
+        """Exchange participants of different profiles between groups in place while that lowers the cost.
+
+        For every group the best exchange with any other group is applied if it lowers the cost,
+        until no group has an improving exchange left.
+
+        :param counts: The number of participants of every profile in every group, indexed by [profile, group]
+        :param values: The attribute values of every profile, indexed by [profile, slot]
+        :param sizes: The size of every group
+        :param weights: The weight of every slot
+        """
+        # weighted overlap of the attribute values of every pair of profiles
+        overlaps: np.ndarray = (values * weights) @ values.T
+        histograms: np.ndarray = counts.T @ values
+        exchanges: int = 0
+        improved: bool = True
+        while improved and exchanges < self.max_exchanges:
+            improved = False
+            for group in range(len(sizes)):
+                exchange: tuple[int, int, int] | None = self.__best_exchange(
+                    group, counts, histograms, overlaps, values, sizes, weights
+                )
+                if exchange is None:
+                    continue
+                profile_1, profile_2, other_group = exchange
+                counts[[profile_1, profile_2], [group, other_group]] -= 1
+                counts[[profile_2, profile_1], [group, other_group]] += 1
+                histograms[group] += values[profile_2] - values[profile_1]
+                histograms[other_group] += values[profile_1] - values[profile_2]
+                exchanges += 1
+                improved = True
+
+    def __best_exchange(
+        self,
+        group: int,
+        counts: np.ndarray,
+        histograms: np.ndarray,
+        overlaps: np.ndarray,
+        values: np.ndarray,
+        sizes: np.ndarray,
+        weights: np.ndarray,
+    ) -> tuple[int, int, int] | None:
+        """Find the exchange of a participant of a group that lowers the cost most.
+
+        The weighted sum of squared value counts of a group changes by
+        `overlap(out, out) + overlap(in, in) - 2 overlap(out, in) + 2 (in - out) . weighted histogram`,
+        which is evaluated for all profiles of the group against all occupied profile and group pairs at once.
+
+        :param group: The index of the group
+        :param counts: The number of participants of every profile in every group, indexed by [profile, group]
+        :param histograms: The value counts of every group, indexed by [group, slot]
+        :param overlaps: The weighted overlap of the values of every pair of profiles
+        :param values: The attribute values of every profile, indexed by [profile, slot]
+        :param sizes: The size of every group
+        :param weights: The weight of every slot
+
+        :return: The profile leaving the group, the profile joining it and the other group,
+        None if no exchange lowers the cost
+        """
+        outgoing: np.ndarray = np.flatnonzero(counts[:, group])
+        incoming, other_groups = np.nonzero(counts)
+        squares: np.ndarray = histograms**2 @ weights
+        projections: np.ndarray = (histograms * weights) @ values.T
+        changes: np.ndarray = (
+            np.diag(overlaps)[outgoing, np.newaxis]
+            + np.diag(overlaps)[np.newaxis, incoming]
+            - 2 * overlaps[np.ix_(outgoing, incoming)]
+        )
+        new_squares: np.ndarray = (
+            squares[group]
+            + changes
+            + 2 * projections[group, incoming]
+            - 2 * projections[group, outgoing, np.newaxis]
+        )
+        other_new_squares: np.ndarray = (
+            squares[other_groups]
+            + changes
+            + 2 * projections[other_groups, outgoing[:, np.newaxis]]
+            - 2 * projections[other_groups, incoming]
+        )
+        costs: np.ndarray = self.__group_costs(histograms, sizes, weights)
+        deltas: np.ndarray = (
+            np.sqrt(np.maximum(new_squares - sizes[group], 0.0))
+            + np.sqrt(np.maximum(other_new_squares - sizes[other_groups], 0.0))
+            - costs[group]
+            - costs[other_groups]
+        )
+        deltas[(other_groups == group) | (outgoing[:, np.newaxis] == incoming)] = np.inf
+        if deltas.size == 0 or deltas.min() >= -1e-12:
+            return None
+        row, column = np.unravel_index(int(np.argmin(deltas)), deltas.shape)
+        return int(outgoing[row]), int(incoming[column]), int(other_groups[column])
+
+    def __group_costs(
+        self, histograms: np.ndarray, sizes: np.ndarray, weights: np.ndarray
+    ) -> np.ndarray:
+        """Calculate the unnormalized diversity costs of groups,
+        see :meth:`ObjectiveFunction.histogram_diversity_costs`.
+
+        :param histograms: The value counts of every group, indexed by [group, slot]
+        :param sizes: The size of every group
+        :param weights: The weight of every slot
+
+        :return: The diversity cost of every group
+        """
+        return np.sqrt(np.maximum(histograms**2 @ weights - sizes, 0.0))
@@ -0,0 +1,154 @@
+"""Module containing the stopping criteria of local search runs."""
+
+from dataclasses import dataclass
+from threading import Event
+
+
+@dataclass
+class StoppingOptions:
+    """Criteria that end a local search run besides its maximum number of cycles."""
+
+    #: the maximum wall-clock duration of the run in seconds
+    time_budget: float | None = None
+    #: stop once the lowest cost has not improved for this many cycles
+    stall_cycles: int | None = None
+    #: stop once the fraction of accepted moves within an acceptance window falls below this rate
+    min_acceptance_rate: float | None = None
+    #: the number of cycles the acceptance rate is measured over
+    acceptance_window: int = 1000
+
+
+class StoppingCriteria:
+    """Decides how far a local search run has progressed and when it stops.
+
+    A run ends after `max_cycles` cycles or once the time budget has passed, whichever comes first,
+    or earlier once the lowest cost stalls, too few moves are accepted or the run is cancelled.
+
+    :param max_cycles: the maximum number of cycles, None to only use the time budget
+    :param options: the further stopping criteria, defaults to none
+    :param cancellation: stop the run once this event is set,
+    it may be set from another thread (optional)
+    :param cancellation_interval: the number of cycles between two checks of the cancellation, defaults to 100
+
+    :raises ValueError: if neither a maximum number of cycles nor a time budget is given
+    """
+
+    max_cycles: int | None
+    options: StoppingOptions
+    #: the number of accepted moves counted by :meth:`should_stop` in the current acceptance window
+    accepted: int
+    #: whether a check found the run cancelled
+    cancelled: bool
+
+    __cancellation: Event | None
+    __cancellation_interval: int
+
+    def __init__(
+        self,
+        max_cycles: int | None,
+        options: StoppingOptions | None = None,
+        cancellation: Event | None = None,
+        cancellation_interval: int = 100,
+    ) -> None:
+        self.max_cycles = max_cycles
+        self.options = StoppingOptions() if options is None else options
+        if max_cycles is None and self.options.time_budget is None:
+            raise ValueError("Either max_cycles or time_budget must be set")
+        self.accepted = 0
+        self.cancelled = False
+        self.__cancellation = cancellation
+        self.__cancellation_interval = cancellation_interval
+
+    @property
+    def progress_total(self) -> int:
+        """Total progress to report, the number of cycles if they are limited.
+
+        :return: the maximum number of cycles, or 1000 so that progress is reported in steps of a tenth of a percent
+        """
+        return 1000 if self.max_cycles is None else self.max_cycles
+
+    def progress(self, cycle: int, elapsed: float) -> float:
+        """Return the fraction of the run that has passed.
+
+        :param cycle: the number of completed cycles
+        :param elapsed: the seconds passed since the start of the run
+
+        :return: the larger of the passed fractions of the cycles and the time budget, at most 1
+        """
+        progress: float = 0.0
+        if self.max_cycles is not None:
+            progress = cycle / self.max_cycles
+        if self.options.time_budget is not None:
+            progress = max(progress, elapsed / self.options.time_budget)
+        return min(progress, 1.0)
+
+    def is_stalled(self, cycle: int, best_cycle: int) -> bool:
+        """Check whether the lowest cost has not improved for too long.
+
+        :param cycle: the number of completed cycles
+        :param best_cycle: the cycle the lowest cost was found at
+
+        :return: true if the run should stop, false otherwise
+        """
+        return (
+            self.options.stall_cycles is not None
+            and cycle - best_cycle >= self.options.stall_cycles
+        )
+
+    def is_window_complete(self, cycle: int) -> bool:
+        """Check whether a cycle completes an acceptance window.
+
+        :param cycle: the number of completed cycles
+
+        :return: true if the acceptance rate should be checked and its count restarted, false otherwise
+        """
+        return cycle % self.options.acceptance_window == 0
+
+    def is_frozen(self, accepted: int, cycles: int | None = None) -> bool:
+        """Check whether too few moves were accepted to continue.
+
+        :param accepted: the number of accepted moves
+        :param cycles: the number of cycles the moves were accepted in, defaults to the acceptance window
+
+        :return: true if the run should stop, false otherwise
+        """
+        if cycles is None:
+            cycles = self.options.acceptance_window
+        return (
+            self.options.min_acceptance_rate is not None
+            and accepted < self.options.min_acceptance_rate * cycles
+        )
+
+    def is_cancelled(self, cycle: int) -> bool:
+        """Check whether the run has been cancelled, every `cancellation_interval` cycles.
+
+        :param cycle: the number of completed cycles
+
+        :return: true if the run should stop, false otherwise
+        """
+        self.cancelled = self.cancelled or (
+            self.__cancellation is not None
+            and cycle % self.__cancellation_interval == 0
+            and self.__cancellation.is_set()
+        )
+        return self.cancelled
+
+    def should_stop(self, cycle: int, best_cycle: int, accepted: bool) -> bool:
+        """Count the result of a cycle and check whether the run should stop after it.
+
+        The count of accepted moves starts over with every acceptance window.
+
+        :param cycle: the number of completed cycles
+        :param best_cycle: the cycle the lowest cost was found at
+        :param accepted: whether the move of the cycle was accepted
+
+        :return: true if the run has stalled, has been cancelled or accepted too few moves, false otherwise
+        """
+        self.accepted += accepted
+        if self.is_stalled(cycle, best_cycle) or self.is_cancelled(cycle):
+            return True
+        if self.is_window_complete(cycle):
+            if self.is_frozen(self.accepted):
+                return True
+            self.accepted = 0
+        return False
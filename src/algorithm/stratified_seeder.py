@@ -0,0 +1,88 @@
+"""Stratified seeder module"""
+
+from random import Random
+import numpy as np
+from data_structures import Assignment, Participant
+from algorithm.compact_assignment import CompactAssignment
+
+
+class StratifiedSeeder:
+    """Constructs group assignments that spread similar participants across the groups.
+
+    The participants are sorted by their attribute values, the attribute with the highest weight first,
+    and dealt into the groups round-robin, so every group receives a share of every stratum.
+    Equal participants are ordered randomly.
+
+    Seen as rows of `groups_per_iteration` consecutive sorted participants, the participant in row `r`
+    and column `c` joins group `(c + t * r) mod groups_per_iteration` in iteration `t`.
+    Every row is still spread over all groups, but the start offset of each row is staggered
+    from iteration to iteration. If the number of groups is prime and not smaller than
+    the group size, two participants meet in at most one of the first `groups_per_iteration` iterations.
+    After that many iterations the participants are sorted again with new random tie-breaking.
+
+    :param attributes: A list of attributes that are considered for optimization
+    :param random_instance: An instance of Random that will be used
+    instead of an automatically generated one as a source or randomness, defaults to None
+    :param attribute_weights: a dict mapping attributes to float weights, defaults to an empty dict
+    """
+
+    __random: Random
+    attributes: list[str]
+    attribute_weights: dict[str, float]
+
+    def __init__(
+        self,
+        attributes: list[str],
+        random_instance: Random = None,
+        attribute_weights: dict[str, float] = dict(),
+    ):
+        self.__random = Random() if random_instance is None else random_instance
+        self.attributes = attributes
+        self.attribute_weights = attribute_weights
+
+    def find_assignment(
+        self, participants: set[Participant], groups_per_iteration: int, iterations: int
+    ) -> Assignment:
+        """Return a stratified group assignment.
+
+        :param participants: The set of participants to distribute into groups
+        :param groups_per_iteration: The number of groups per iteration
+        :param iterations: The number of iterations to generate groups for
+
+        :return: The generated assignment
+        """
+        order: list[Participant] = sorted(
+            participants, key=lambda participant: participant.uid
+        )
+        rows, columns = np.divmod(np.arange(len(order)), groups_per_iteration)
+        group_ids: np.ndarray = np.zeros((iterations, len(order)), dtype=np.intp)
+        sorted_indices: np.ndarray = np.arange(len(order))
+        for iteration in range(iterations):
+            stride: int = iteration % groups_per_iteration
+            if stride == 0:
+                sorted_indices = self.__sorted_indices(order)
+            group_ids[iteration, sorted_indices] = (
+                columns + stride * rows
+            ) % groups_per_iteration
+        return CompactAssignment(order, group_ids, groups_per_iteration).to_assignment()
+
+    def __sorted_indices(self, participants: list[Participant]) -> np.ndarray:
+        """Return the indices of participants sorted by their attribute values, ties broken randomly.
+
+        :param participants: The participants to sort
+
+        :return: The indices of the participants in sorted order
+        """
+        attributes: list[str] = sorted(
+            self.attributes,
+            key=lambda attribute: -self.attribute_weights.get(attribute, 1),
+        )
+        indices: list[int] = list(range(len(participants)))
+        self.__random.shuffle(indices)
+        indices.sort(
+            key=lambda index: tuple(
+                str(participants[index].get_attribute(attribute))
+                for attribute in attributes
+            )
+        )
+        return np.array(indices, dtype=np.intp)
@@ -0,0 +1,289 @@
+"""Tabu search algorithm module"""
+
+from math import inf
+from random import Random
+from threading import Event
+import time
+from typing import Callable, Self
+import numpy as np
+from algorithm.annealing_checkpoint import CheckpointOptions
+from algorithm.best_assignment_tracker import BestAssignmentTracker
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.local_search import LocalSearch
+from algorithm.move_set import Move, MoveSet
+from algorithm.movement_penalty import MovementPenalty
+from algorithm.objective_function import ObjectiveFunction
+from algorithm.progress_reporter import ProgressReporter, ReportingOptions
+from algorithm.random_algorithm import RandomAlgorithm
+from algorithm.search_algorithm import SearchAlgorithm
+from algorithm.stopping_criteria import StoppingCriteria, StoppingOptions
+from algorithm.stratified_seeder import StratifiedSeeder
+from algorithm.trace_recorder import TraceRecorder
+from data_structures import Assignment, Participant
+
+
+class TabuSearchAlgorithm(SearchAlgorithm):
+    """Contains the calculations for generating group assignments using tabu search.
+
+    Every cycle evaluates a sample of candidate moves and takes the one with the lowest cost,
+    even if it raises the cost. A participant moved by a taken move stays tabu in that iteration
+    for `tabu_tenure` cycles, moves involving it are only taken if they lead to a new lowest cost.
+
+    :param attributes: A list of attributes that are considered for optimization
+    :param random_instance: An instance of Random that will be used
+    instead of an automatically generated one as a source or randomness, defaults to None
+    :param attribute_weights: a dict mapping attributes to float weights, defaults to an empty dict
+    :param candidate_count: the number of candidate moves evaluated every cycle, defaults to 50
+    :param tabu_tenure: the number of cycles a moved participant stays tabu in its iteration,
+    defaults to a fiftieth of the number of participants times the number of iterations, at least 2
+    :param trace_capacity: the maximum number of cycles kept in :attr:`trace`, defaults to 10000
+    :param trace_stride: only every `trace_stride`-th cycle is recorded in :attr:`trace`, defaults to 1
+    """
+
+    __random: Random
+    candidate_count: int
+    tabu_tenure: int | None
+    trace: TraceRecorder
+
+    def __init__(
+        self,
+        attributes: list[str],
+        random_instance: Random = None,
+        attribute_weights: dict[str, float] = dict(),
+        candidate_count: int = 50,
+        tabu_tenure: int | None = None,
+        trace_capacity: int = 10000,
+        trace_stride: int = 1,
+    ):
+        random: Random = Random() if random_instance is None else random_instance
+        super().__init__(attributes, random, attribute_weights)
+        self.__random = random
+        self.candidate_count = candidate_count
+        self.tabu_tenure = tabu_tenure
+        self.trace = TraceRecorder(trace_capacity, trace_stride)
+
+    def with_seed(self, seed: int) -> Self:
+        """Return an algorithm with the same settings and a new random source.
+
+        :param seed: the seed of the random source
+
+        :return: the new algorithm
+        """
+        return type(self)(
+            self.attributes,
+            Random(seed),
+            self.attribute_weights,
+            self.candidate_count,
+            self.tabu_tenure,
+            self.trace.capacity,
+            self.trace.stride,
+        )
+
+    def find_assignment(
+        self,
+        participants: set[Participant],
+        groups_per_iteration: int,
+        iterations: int,
+        max_cycles: int | None,
+        intitial_temperature: float = 1,
+        temperature_scaling: float = 15,
+        mix_weight: float = 1,
+        diversity_weight: float = 1,
+        progress_callback: Callable[[int, int], None] | None = None,
+        stopping: StoppingOptions | None = None,
+        auto_temperature: bool = False,
+        guided_rate: float = 0.0,
+        move_set: MoveSet | None = None,
+        stratified_start: bool = False,
+        initial_assignment: Assignment | None = None,
+        reference_assignment: Assignment | None = None,
+        movement_penalty: float = 0.0,
+        checkpointing: CheckpointOptions | None = None,
+        cancellation: Event | None = None,
+        cancellation_interval: int = 100,
+        reporting: ReportingOptions | None = None,
+    ) -> Assignment:
+        """Return a group assignment generated using tabu search.
+
+        Takes the arguments of :meth:`SimulatedAnnealingAlgorithm.find_assignment` in the same order,
+        so both algorithms can be driven by the same caller.
+        Tabu search uses no temperature, the temperature arguments are ignored and the temperatures
+        in :attr:`trace` are 0. It keeps no checkpoints.
+        The cost of the returned assignment and the cycle it was found at are stored
+        in :attr:`best_cost` and :attr:`best_cycle`, 0 meaning the initial assignment,
+        a cancelled run is recorded in :attr:`cancelled`.
+
+        :param participants: the set of participants to distribute into groups
+        :param groups_per_iteration: the number of groups in each iteration
+        :param iterations: the total number of iterations
+        :param max_cycles: the maximum number of moves, None to only use the time budget
+        :param intitial_temperature: ignored, tabu search uses no temperature
+        :param temperature_scaling: ignored, tabu search uses no temperature
+        :param mix_weight: the weight of the mix cost when evaluating assignments,
+        only the size of this number compared to the diversity weight matters, defaults to 1
+        :param diversity_weight: the weight of the diversity cost, defaults to 1
+        :param progress_callback: gets called with current progress and total progress,
+        at the start and the end of the run and at most once per progress interval in between (optional)
+        :param stopping: the time budget and the convergence criteria of the run,
+        the acceptance rate counts the moves lowering the cost, defaults to only the cycle limit (optional)
+        :param auto_temperature: ignored, tabu search uses no temperature
+        :param guided_rate: the fraction of candidate swaps proposed by a :class:`GuidedSwapGenerator`,
+        the others are picked uniformly, defaults to 0
+        :param move_set: the move types to draw the candidates from besides plain swaps,
+        by default only swaps are proposed (optional)
+        :param stratified_start: start from an assignment of a :class:`StratifiedSeeder`
+        instead of a random one, defaults to False
+        :param initial_assignment: an assignment of the participants to start from instead of a generated one
+        (optional)
+        :param reference_assignment: an assignment whose placements should be kept,
+        used with the movement penalty (optional)
+        :param movement_penalty: the cost added if every participant of the reference assignment
+        is placed in a different group than in it in every iteration, added proportionally
+        for fewer changed placements and included in :attr:`best_cost` and :attr:`trace`, defaults to 0
+        :param checkpointing: has to be empty, tabu search can neither continue from nor emit checkpoints
+        (optional)
+        :param cancellation: stop the run once this event is set,
+        it may be set from another thread (optional)
+        :param cancellation_interval: the number of cycles between two checks of the cancellation,
+        defaults to 100
+        :param reporting: the callback receiving :class:`ProgressReport` objects of the run
+        and the interval of all progress reports, defaults to an interval of 0.05 seconds (optional)
+
+        :return: the assignment with the lowest cost visited during the run
+
+        :raises ValueError: if neither a maximum number of cycles nor a time budget is given,
+        or if a checkpoint or a checkpoint callback is given
+        """
+        criteria: StoppingCriteria = StoppingCriteria(
+            max_cycles, stopping, cancellation, cancellation_interval
+        )
+        if checkpointing is not None and (
+            checkpointing.resume_from is not None or checkpointing.callback is not None
+        ):
+            raise ValueError("Tabu search does not support checkpoints")
+        self.cancelled = False
+        objective: ObjectiveFunction = ObjectiveFunction(
+            self.attributes, self.attribute_weights
+        )
+        if initial_assignment is None:
+            seeder: RandomAlgorithm | StratifiedSeeder = (
+                StratifiedSeeder(self.attributes, self.__random, self.attribute_weights)
+                if stratified_start
+                else RandomAlgorithm(self.__random)
+            )
+            initial_assignment = seeder.find_assignment(
+                participants, groups_per_iteration, iterations
+            )
+        state: CompactAssignment = CompactAssignment.from_assignment(
+            initial_assignment, objective.encode(initial_assignment).participants
+        )
+        search: LocalSearch = LocalSearch(
+            objective,
+            state,
+            MovementPenalty(state, reference_assignment, movement_penalty),
+            mix_weight=mix_weight,
+            diversity_weight=diversity_weight,
+            guided_rate=guided_rate,
+            move_set=move_set,
+        )
+        best: BestAssignmentTracker = BestAssignmentTracker(state, search.cost())
+        self.trace.clear()
+        self.__search(
+            search,
+            state,
+            best,
+            criteria,
+            ProgressReporter.from_options(
+                criteria.progress_total, progress_callback, reporting
+            ),
+        )
+        self.best_cost = best.cost
+        self.best_cycle = best.cycle
+        return best.best_assignment().to_assignment()
+
+    def __search(
+        self,
+        search: LocalSearch,
+        state: CompactAssignment,
+        best: BestAssignmentTracker,
+        criteria: StoppingCriteria,
+        reporter: ProgressReporter,
+    ) -> None:
+        """Run the tabu search cycles until one of the stopping criteria is met, changing the assignment in place.
+
+        :param search: Proposes and applies the moves of the run
+        :param state: The current assignment
+        :param best: The tracker of the best assignment, its cost is the one of the current assignment
+        :param criteria: The stopping criteria of the run
+        :param reporter: Reports the progress of the run
+        """
+        tenure: int = (
+            max(2, state.group_ids.size // 50)
+            if self.tabu_tenure is None
+            else self.tabu_tenure
+        )
+        # the cycle until which each participant is tabu, indexed by [iteration, participant]
+        tabu_until: np.ndarray = np.zeros(state.group_ids.shape, dtype=np.int64)
+        start: float = time.perf_counter()
+        cost: float = best.cost
+        cycle: int = 0
+        progress: float = 0.0
+        reporter.start(progress, cycle, cost, best.cost)
+        while progress < 1:
+            cycle += 1
+            progress = criteria.progress(cycle, time.perf_counter() - start)
+            move_type, move, delta = self.__select_move(
+                search, tabu_until, cycle, cost, best.cost
+            )
+            if move is not None:
+                search.apply(move, best)
+                search.record(move_type, delta < 0)
+                for iteration, participant_1, participant_2 in move:
+                    tabu_until[iteration, [participant_1, participant_2]] = (
+                        cycle + tenure
+                    )
+                cost += delta
+            best.update(cycle, cost)
+            self.trace.record(cycle, 0.0, cost)
+            reporter.update(progress, cycle, cost, best.cost)
+
+            if criteria.should_stop(cycle, best.cycle, move is not None and delta < 0):
+                break
+
+        reporter.finish(progress, cycle, cost, best.cost)
+        self.cancelled = criteria.cancelled
+
+    def __select_move(
+        self,
+        search: LocalSearch,
+        tabu_until: np.ndarray,
+        cycle: int,
+        cost: float,
+        best_cost: float,
+    ) -> tuple[int, Move | None, float]:
+        """Evaluate a sample of candidate moves and return the best admissible one.
+
+        A move is admissible if none of its participants is tabu in the iteration it is moved in,
+        or if it leads to a cost lower than the lowest one so far.
+
+        :param search: Proposes the candidate moves, every candidate is undone after its evaluation
+        :param tabu_until: The cycle until which each participant is tabu, indexed by [iteration, participant]
+        :param cycle: The number of the current cycle
+        :param cost: The cost of the current assignment
+        :param best_cost: The lowest cost so far
+
+        :return: The index of the move type, the swaps and the cost change of the best admissible move,
+        None instead of the swaps if every candidate is tabu
+        """
+        selected: tuple[int, Move | None, float] = (0, None, inf)
+        for _ in range(self.candidate_count):
+            move_type, move, delta = search.propose(self.__random)
+            search.undo(move)
+            admissible: bool = cost + delta < best_cost or not any(
+                tabu_until[iteration, participant_1] > cycle
+                or tabu_until[iteration, participant_2] > cycle
+                for iteration, participant_1, participant_2 in move
+            )
+            if admissible and delta < selected[2]:
+                selected = (move_type, move, delta)
+        return selected
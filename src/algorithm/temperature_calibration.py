@@ -0,0 +1,69 @@
+"""Module containing the calibration of annealing temperatures."""
+
+from math import log
+from random import Random
+import numpy as np
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.objective_function import ObjectiveFunction
+
+#: the progress at which the annealing schedule reaches the final temperature,
+#: before its linear factor `(1 - progress)` drives the temperature to zero at the very end
+FINAL_PROGRESS: float = 0.9
+
+
+def calibrate_temperature(
+    objective: ObjectiveFunction,
+    state: CompactAssignment,
+    random: Random,
+    mix_weight: float = 1,
+    diversity_weight: float = 1,
+    sample_count: int = 300,
+    initial_acceptance_rate: float = 0.8,
+    final_acceptance_rate: float = 0.001,
+    final_progress: float | None = FINAL_PROGRESS,
+) -> tuple[float, float] | None:
+    """Derive the initial temperature and the temperature scaling from the cost changes of random swaps.
+
+    The initial temperature accepts an average uphill swap with the initial acceptance rate,
+    the scaling lowers it to a temperature accepting small uphill swaps,
+    those at the tenth percentile, with the final acceptance rate at the final progress.
+    The scaling accounts for the whole annealing schedule ``initial * (1 - progress) * exp(-scaling * progress)``
+    of :meth:`SimulatedAnnealingAlgorithm.get_temperature`, including its linear factor,
+    or, without a final progress, a purely exponential ladder ending at ``initial * exp(-scaling)``.
+    The swaps are only evaluated, the assignment is not changed.
+
+    :param objective: the objective function the swaps are evaluated with
+    :param state: the assignment to sample the swaps in
+    :param random: the source of randomness
+    :param mix_weight: the weight of the mix cost, defaults to 1
+    :param diversity_weight: the weight of the diversity cost, defaults to 1
+    :param sample_count: the number of sampled swaps, defaults to 300
+    :param initial_acceptance_rate: the targeted acceptance rate of uphill swaps at the start, defaults to 0.8
+    :param final_acceptance_rate: the targeted acceptance rate of small uphill swaps at the end, defaults to 0.001
+    :param final_progress: the progress at which the annealing schedule reaches the final temperature,
+    None for a purely exponential ladder of temperatures, defaults to :data:`FINAL_PROGRESS`
+
+    :return: the initial temperature and the temperature scaling, None if no sampled swap increased the cost
+    """
+    deltas: np.ndarray = np.array(
+        [
+            objective.swap_delta(
+                state,
+                *state.random_swap(random),
+                mix_weight,
+                diversity_weight,
+            )
+            for _ in range(sample_count)
+        ]
+    )
+    uphill: np.ndarray = deltas[deltas > 0]
+    if uphill.size == 0:
+        return None
+    initial_temperature: float = -float(uphill.mean()) / log(initial_acceptance_rate)
+    final_temperature: float = -float(np.quantile(uphill, 0.1)) / log(
+        final_acceptance_rate
+    )
+    scaling: float = log(initial_temperature / final_temperature)
+    if final_progress is not None:
+        scaling = (scaling + log(1 - final_progress)) / final_progress
+    return initial_temperature, max(scaling, 0.0)
@@ -0,0 +1,94 @@
+"""Module containing the trace recorder of optimization runs."""
+
+import numpy as np
+
+
+class TraceRecorder:
+    """Records the temperature and cost of every `stride`-th cycle of one optimization run.
+
+    Samples are stored in a ring buffer, once it is full the oldest samples are overwritten,
+    so the memory used by a recorder does not grow with the length of the run.
+
+    :param capacity: the maximum number of stored samples, defaults to 10000
+    :param stride: only cycles divisible by the stride are recorded, defaults to 1
+
+    :raises ValueError: if the capacity or the stride is smaller than 1
+    """
+
+    capacity: int
+    stride: int
+
+    __cycles: np.ndarray
+    __temperatures: np.ndarray
+    __costs: np.ndarray
+    __recorded: int
+
+    def __init__(self, capacity: int = 10000, stride: int = 1) -> None:
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        if stride < 1:
+            raise ValueError("Stride must be at least 1")
+        self.capacity = capacity
+        self.stride = stride
+        self.__cycles = np.zeros(capacity, dtype=np.int64)
+        self.__temperatures = np.zeros(capacity)
+        self.__costs = np.zeros(capacity)
+        self.__recorded = 0
+
+    def __len__(self) -> int:
+        return min(self.__recorded, self.capacity)
+
+    def record(self, cycle: int, temperature: float, cost: float) -> None:
+        """Record a sample if the cycle is divisible by the stride.
+
+        :param cycle: the number of the cycle
+        :param temperature: the temperature in the cycle
+        :param cost: the cost of the current assignment after the cycle
+        """
+        if cycle % self.stride != 0:
+            return
+        slot: int = self.__recorded % self.capacity
+        self.__cycles[slot] = cycle
+        self.__temperatures[slot] = temperature
+        self.__costs[slot] = cost
+        self.__recorded += 1
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self.__recorded = 0
+
+    @property
+    def cycles(self) -> np.ndarray:
+        """Cycles of the stored samples, oldest first.
+
+        :return: the cycle numbers
+        """
+        return self.__ordered(self.__cycles)
+
+    @property
+    def temperatures(self) -> np.ndarray:
+        """Temperatures of the stored samples, oldest first.
+
+        :return: the temperatures
+        """
+        return self.__ordered(self.__temperatures)
+
+    @property
+    def costs(self) -> np.ndarray:
+        """Costs of the stored samples, oldest first.
+
+        :return: the costs
+        """
+        return self.__ordered(self.__costs)
+
+    def __ordered(self, buffer: np.ndarray) -> np.ndarray:
+        """Return the stored part of a buffer in recording order.
+
+        :param buffer: one of the sample buffers
+
+        :return: a copy of the stored samples, oldest first
+        """
+        if self.__recorded <= self.capacity:
+            return buffer[: self.__recorded].copy()
+        start: int = self.__recorded % self.capacity
+        return np.concatenate([buffer[start:], buffer[:start]])
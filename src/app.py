@@ -7,6 +7,7 @@ from random import Random
 import sys
 import time
 import ctypes
+import multiprocessing
 from typing import override
 
 from PyQt6.QtWidgets import (
@@ -21,6 +22,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QDesktopServices, QIcon, QGuiApplication, QFocusEvent
 from PyQt6.QtCore import QUrl, Qt, QProcess, QDir, QThread
 from algorithm.objective_function import ObjectiveFunction
+from algorithm.progress_reporter import ProgressReport
 from algorithm.simulated_annealing_algorithm import SimulatedAnnealingAlgorithm
 from ui.attribute_table_items import AttributeState, CheckableHeaderItem
 from ui.algorithm_worker import AlgorithmWorker
@@ -40,6 +42,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
     # pylint: disable=too-few-public-methods
     # pylint: disable=too-many-instance-attributes
 
+    #: the maximum number of annealing cycles per participant and iteration
+    CYCLES_PER_PLACEMENT: int = 50
+    #: the number of cycles per participant and iteration without improvement after which the annealing stops
+    STALL_CYCLES_PER_PLACEMENT: int = 10
+
     __input_path: os.PathLike | None = None
     __output_path: os.PathLike | None = None
     __participants_list: list[Participant]
@@ -65,6 +72,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # self.read_input_button.clicked.connect(self.__read_input_file)
         self.output_pick_button.clicked.connect(self.__output_file_picker)
         self.run_algorithm_button.clicked.connect(self.__start_algorithm)
+        self.cancel_algorithm_button.clicked.connect(self.__cancel_algorithm)
         # self.select_synonym_button.clicked.connect()
         self.reset_synonyms_button.clicked.connect(self.__reset_synonyms)
         self.undo_button.clicked.connect(self.__undo)
@@ -75,6 +83,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         # self.read_input_button.setEnabled(False)
         self.run_algorithm_button.setEnabled(False)
+        self.cancel_algorithm_button.setEnabled(False)
         # self.select_synonym_button.setEnabled(False)
         self.select_synonym_label.setVisible(False)
         self.weigh_attribute_label.setVisible(False)
@@ -142,10 +151,13 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.algorithm_thread.finished.connect(self.algorithm_thread.deleteLater)
 
         # worker startup and cleanup
-        self.algorithm_worker.progress.connect(self.__progress_callback)
+        self.algorithm_worker.report.connect(self.__report_callback)
         self.algorithm_worker.finished.connect(self.__on_algorithm_finished)
         self.algorithm_worker.finished.connect(self.algorithm_thread.quit)
         self.algorithm_worker.finished.connect(self.algorithm_worker.deleteLater)
+        self.algorithm_worker.failed.connect(self.__on_algorithm_failed)
+        self.algorithm_worker.failed.connect(self.algorithm_thread.quit)
+        self.algorithm_worker.failed.connect(self.algorithm_worker.deleteLater)
 
         # worker variables
         self.algorithm_worker.algorithm_instance = algorithm_instance
@@ -154,16 +166,53 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.algorithm_worker.number_of_iterations = int(
             self.iterations_spinbox.value()
         )
-        self.algorithm_worker.number_of_epochs = 1000
+        # scale the run with the number of placements and stop early once the best cost stalls,
+        # the time budget only caps very large rosters
+        placements: int = (
+            len(self.algorithm_worker.participants)
+            * self.algorithm_worker.number_of_iterations
+        )
+        self.algorithm_worker.number_of_epochs = self.CYCLES_PER_PLACEMENT * placements
+        self.algorithm_worker.stall_cycles = (
+            self.STALL_CYCLES_PER_PLACEMENT * placements
+        )
+        self.algorithm_worker.time_budget = 10.0
+        self.algorithm_worker.auto_temperature = True
+        self.algorithm_worker.stratified_start = True
+        # keep the interface responsive while the algorithm runs
+        self.algorithm_worker.run_in_process = True
 
+        self.cancel_algorithm_button.setEnabled(True)
         self.algorithm_thread.start()
 
+    def __cancel_algorithm(self) -> None:
+        """Stops the running algorithm, which then finishes with the best assignment found so far."""
+        self.cancel_algorithm_button.setEnabled(False)
+        self.algorithm_worker.cancel()
+        self.output_progress.setFormat("Cancelling...")
+        self.output_progress.update()
+
+    def __on_algorithm_failed(self, message: str) -> None:
+        """Callback for the algorithm worker thread if the algorithm fails. Shows a warning.
+
+        :param message: the error message emitted by the algorithm worker
+        """
+        self.cancel_algorithm_button.setEnabled(False)
+        self.output_progress.setFormat("Failed!")
+        self.output_progress.update()
+        self.__show_warning_popup(
+            f"A problem occured while running the algorithm: {message}",
+            "Try again, or restart the application if the problem persists",
+        )
+
     def __on_algorithm_finished(self, assignment_object: object) -> None:
         """Callback for the algorithm worker thread. Writes the assignment of the algorithm and shows a notification.
 
         :param assignment_object: the :type AssignmentObject: emitted by the algorithm worker
         """
         final_assignment: Assignment = assignment_object
+        cancelled: bool = self.algorithm_worker.cancellation.is_set()
+        self.cancel_algorithm_button.setEnabled(False)
         try:
             Writer(self.__output_path).write_file(final_assignment)
         except Exception as writer_exception:
@@ -173,7 +222,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             )
             return
 
-        self.output_progress.setFormat("Finished!")
+        self.output_progress.setFormat("Cancelled!" if cancelled else "Finished!")
         self.output_progress.update()
 
         time_passed: float = time.time() - self.start_time
@@ -186,7 +235,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         message_box: QMessageBox = QMessageBox()
         message_box.setTextFormat(Qt.TextFormat.RichText)
         message_box.setText(
-            f"Algorithm executed successfully in {round(time_passed, 1)} seconds"
+            f"Algorithm cancelled after {round(time_passed, 1)} seconds, the best assignment found so far is kept"
+            if cancelled
+            else f"Algorithm executed successfully in {round(time_passed, 1)} seconds"
         )
         message_box.setInformativeText(
             f"Group assignments saved to {self.__output_path}"
@@ -215,7 +266,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         message_box.setDefaultButton(ok_button)
         message_box.setEscapeButton(ok_button)
         # message_box.setIcon(QMessageBox.Icon.Information)
-        message_box.setWindowTitle("GroupGen: Algorithm executed successfully!")
+        message_box.setWindowTitle(
+            "GroupGen: Algorithm cancelled!"
+            if cancelled
+            else "GroupGen: Algorithm executed successfully!"
+        )
         message_box.exec()
         response: QAbstractButton | None = message_box.clickedButton()
 
@@ -250,14 +305,25 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         message_box.setIcon(QMessageBox.Icon.Warning)
         message_box.exec()
 
-    def __progress_callback(self, current: int, maximum: int) -> None:
-        """Callback for the progress bar
+    def __report_callback(self, report_object: object) -> None:
+        """Callback for the progress bar, showing the throughput, the costs and the remaining time of the run.
 
-        :param current: current progress
-        :param maximum: maximum progress
+        :param report_object: the :class:`ProgressReport` emitted by the algorithm worker
         """
-        self.output_progress.setValue(int((float(current) / float(maximum)) * 100.0))
-        self.output_progress.repaint()
+        report: ProgressReport = report_object
+        self.output_progress.setValue(
+            int((float(report.current) / float(report.total)) * 100.0)
+        )
+        if self.cancel_algorithm_button.isEnabled():
+            remaining: str = (
+                ""
+                if report.remaining_seconds is None
+                else f", {round(report.remaining_seconds)} s left"
+            )
+            self.output_progress.setFormat(
+                f"%p% ({round(report.cycles_per_second):,} cycles/s, "
+                + f"cost {report.cost:.4f}, best {report.best_cost:.4f}{remaining})"
+            )
 
     def __synonym_filter_participants(self) -> set[Participant]:
         """Returns a set of partcicpants that are each equivalent to one of the stored participants,
@@ -544,6 +610,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
 def main():
     """Entrypoint"""
+    # the optimizer may start worker processes, which frozen builds have to dispatch here
+    multiprocessing.freeze_support()
     QApplication.setStyle("fusion")
     app: QApplication = QApplication(sys.argv)
     window: MainWindow = MainWindow()
@@ -0,0 +1,467 @@
+# Form implementation generated from reading ui file 'assets/main_window.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1152, 648)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        MainWindow.setMinimumSize(QtCore.QSize(1152, 648))
+        MainWindow.setFocusPolicy(QtCore.Qt.FocusPolicy.ClickFocus)
+        self.main_layout = QtWidgets.QWidget(parent=MainWindow)
+        self.main_layout.setObjectName("main_layout")
+        self._main_layout = QtWidgets.QVBoxLayout(self.main_layout)
+        self._main_layout.setContentsMargins(10, 10, 10, 10)
+        self._main_layout.setObjectName("_main_layout")
+        self.input_picker_layout = QtWidgets.QWidget(parent=self.main_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.input_picker_layout.sizePolicy().hasHeightForWidth()
+        )
+        self.input_picker_layout.setSizePolicy(sizePolicy)
+        self.input_picker_layout.setObjectName("input_picker_layout")
+        self._input_picker_layout = QtWidgets.QHBoxLayout(self.input_picker_layout)
+        self._input_picker_layout.setSizeConstraint(
+            QtWidgets.QLayout.SizeConstraint.SetDefaultConstraint
+        )
+        self._input_picker_layout.setContentsMargins(0, 0, 0, 0)
+        self._input_picker_layout.setSpacing(6)
+        self._input_picker_layout.setObjectName("_input_picker_layout")
+        self.input_pick_button = QtWidgets.QPushButton(parent=self.input_picker_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.input_pick_button.sizePolicy().hasHeightForWidth()
+        )
+        self.input_pick_button.setSizePolicy(sizePolicy)
+        self.input_pick_button.setMinimumSize(QtCore.QSize(160, 30))
+        self.input_pick_button.setObjectName("input_pick_button")
+        self._input_picker_layout.addWidget(self.input_pick_button)
+        self.input_file_path_line_edit = QtWidgets.QLineEdit(
+            parent=self.input_picker_layout
+        )
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.input_file_path_line_edit.sizePolicy().hasHeightForWidth()
+        )
+        self.input_file_path_line_edit.setSizePolicy(sizePolicy)
+        self.input_file_path_line_edit.setMinimumSize(QtCore.QSize(550, 30))
+        self.input_file_path_line_edit.setObjectName("input_file_path_line_edit")
+        self._input_picker_layout.addWidget(self.input_file_path_line_edit)
+        self._main_layout.addWidget(self.input_picker_layout)
+        self.synonym_layout = QtWidgets.QWidget(parent=self.main_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.synonym_layout.sizePolicy().hasHeightForWidth()
+        )
+        self.synonym_layout.setSizePolicy(sizePolicy)
+        self.synonym_layout.setObjectName("synonym_layout")
+        self._synonym_layout = QtWidgets.QHBoxLayout(self.synonym_layout)
+        self._synonym_layout.setContentsMargins(0, 0, 0, 0)
+        self._synonym_layout.setObjectName("_synonym_layout")
+        self.reset_synonyms_button = QtWidgets.QPushButton(parent=self.synonym_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.reset_synonyms_button.sizePolicy().hasHeightForWidth()
+        )
+        self.reset_synonyms_button.setSizePolicy(sizePolicy)
+        self.reset_synonyms_button.setMinimumSize(QtCore.QSize(160, 30))
+        self.reset_synonyms_button.setObjectName("reset_synonyms_button")
+        self._synonym_layout.addWidget(self.reset_synonyms_button)
+        self.reset_synonyms_label = QtWidgets.QLabel(parent=self.synonym_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.reset_synonyms_label.sizePolicy().hasHeightForWidth()
+        )
+        self.reset_synonyms_label.setSizePolicy(sizePolicy)
+        self.reset_synonyms_label.setMinimumSize(QtCore.QSize(218, 0))
+        self.reset_synonyms_label.setObjectName("reset_synonyms_label")
+        self._synonym_layout.addWidget(self.reset_synonyms_label)
+        self.undo_button = QtWidgets.QPushButton(parent=self.synonym_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.undo_button.sizePolicy().hasHeightForWidth())
+        self.undo_button.setSizePolicy(sizePolicy)
+        self.undo_button.setMinimumSize(QtCore.QSize(160, 30))
+        self.undo_button.setObjectName("undo_button")
+        self._synonym_layout.addWidget(self.undo_button)
+        self.redo_button = QtWidgets.QPushButton(parent=self.synonym_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.redo_button.sizePolicy().hasHeightForWidth())
+        self.redo_button.setSizePolicy(sizePolicy)
+        self.redo_button.setMinimumSize(QtCore.QSize(160, 30))
+        self.redo_button.setObjectName("redo_button")
+        self._synonym_layout.addWidget(self.redo_button)
+        self.sorting_label = QtWidgets.QLabel(parent=self.synonym_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.sorting_label.sizePolicy().hasHeightForWidth()
+        )
+        self.sorting_label.setSizePolicy(sizePolicy)
+        self.sorting_label.setMinimumSize(QtCore.QSize(70, 30))
+        self.sorting_label.setLocale(
+            QtCore.QLocale(
+                QtCore.QLocale.Language.English, QtCore.QLocale.Country.Germany
+            )
+        )
+        self.sorting_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.sorting_label.setObjectName("sorting_label")
+        self._synonym_layout.addWidget(self.sorting_label)
+        self.sorting_comboBox = QtWidgets.QComboBox(parent=self.synonym_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.sorting_comboBox.sizePolicy().hasHeightForWidth()
+        )
+        self.sorting_comboBox.setSizePolicy(sizePolicy)
+        self.sorting_comboBox.setMinimumSize(QtCore.QSize(160, 30))
+        self.sorting_comboBox.setEditable(False)
+        self.sorting_comboBox.setMaxVisibleItems(2)
+        self.sorting_comboBox.setInsertPolicy(QtWidgets.QComboBox.InsertPolicy.NoInsert)
+        self.sorting_comboBox.setPlaceholderText("")
+        self.sorting_comboBox.setObjectName("sorting_comboBox")
+        self.sorting_comboBox.addItem("")
+        self.sorting_comboBox.addItem("")
+        self._synonym_layout.addWidget(self.sorting_comboBox)
+        self._main_layout.addWidget(self.synonym_layout)
+        self.excluded_layout = QtWidgets.QWidget(parent=self.main_layout)
+        self.excluded_layout.setObjectName("excluded_layout")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.excluded_layout)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setSpacing(0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.select_synonym_label = QtWidgets.QLabel(parent=self.excluded_layout)
+        self.select_synonym_label.setEnabled(True)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.select_synonym_label.sizePolicy().hasHeightForWidth()
+        )
+        self.select_synonym_label.setSizePolicy(sizePolicy)
+        self.select_synonym_label.setMinimumSize(QtCore.QSize(0, 0))
+        self.select_synonym_label.setObjectName("select_synonym_label")
+        self.verticalLayout.addWidget(self.select_synonym_label)
+        self.weigh_attribute_label = QtWidgets.QLabel(parent=self.excluded_layout)
+        self.weigh_attribute_label.setObjectName("weigh_attribute_label")
+        self.verticalLayout.addWidget(self.weigh_attribute_label)
+        self._main_layout.addWidget(self.excluded_layout)
+        self.attributes_table = AttributeMergeTable(parent=self.main_layout)
+        self.attributes_table.setFocusPolicy(QtCore.Qt.FocusPolicy.ClickFocus)
+        self.attributes_table.setStyleSheet("")
+        self.attributes_table.setDragEnabled(False)
+        self.attributes_table.setDragDropMode(
+            QtWidgets.QAbstractItemView.DragDropMode.NoDragDrop
+        )
+        self.attributes_table.setDefaultDropAction(QtCore.Qt.DropAction.CopyAction)
+        self.attributes_table.setSelectionMode(
+            QtWidgets.QAbstractItemView.SelectionMode.SingleSelection
+        )
+        self.attributes_table.setWordWrap(False)
+        self.attributes_table.setObjectName("attributes_table")
+        self.attributes_table.setColumnCount(0)
+        self.attributes_table.setRowCount(0)
+        self.attributes_table.horizontalHeader().setCascadingSectionResizes(False)
+        self.attributes_table.verticalHeader().setCascadingSectionResizes(True)
+        self.attributes_table.verticalHeader().setStretchLastSection(True)
+        self._main_layout.addWidget(self.attributes_table)
+        self.output_picker_layout = QtWidgets.QWidget(parent=self.main_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Expanding,
+            QtWidgets.QSizePolicy.Policy.Preferred,
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.output_picker_layout.sizePolicy().hasHeightForWidth()
+        )
+        self.output_picker_layout.setSizePolicy(sizePolicy)
+        self.output_picker_layout.setSizeIncrement(QtCore.QSize(0, 0))
+        self.output_picker_layout.setLayoutDirection(
+            QtCore.Qt.LayoutDirection.RightToLeft
+        )
+        self.output_picker_layout.setObjectName("output_picker_layout")
+        self._output_picker_layout = QtWidgets.QHBoxLayout(self.output_picker_layout)
+        self._output_picker_layout.setContentsMargins(0, 6, 0, 0)
+        self._output_picker_layout.setObjectName("_output_picker_layout")
+        self.output_file_path_line_edit = QtWidgets.QLineEdit(
+            parent=self.output_picker_layout
+        )
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.output_file_path_line_edit.sizePolicy().hasHeightForWidth()
+        )
+        self.output_file_path_line_edit.setSizePolicy(sizePolicy)
+        self.output_file_path_line_edit.setMinimumSize(QtCore.QSize(550, 30))
+        self.output_file_path_line_edit.setObjectName("output_file_path_line_edit")
+        self._output_picker_layout.addWidget(self.output_file_path_line_edit)
+        self.output_pick_button = QtWidgets.QPushButton(
+            parent=self.output_picker_layout
+        )
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.output_pick_button.sizePolicy().hasHeightForWidth()
+        )
+        self.output_pick_button.setSizePolicy(sizePolicy)
+        self.output_pick_button.setMinimumSize(QtCore.QSize(160, 30))
+        self.output_pick_button.setObjectName("output_pick_button")
+        self._output_picker_layout.addWidget(self.output_pick_button)
+        self.output_progress = QtWidgets.QProgressBar(parent=self.output_picker_layout)
+        self.output_progress.setEnabled(True)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.output_progress.sizePolicy().hasHeightForWidth()
+        )
+        self.output_progress.setSizePolicy(sizePolicy)
+        self.output_progress.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.output_progress.setProperty("value", 0)
+        self.output_progress.setObjectName("output_progress")
+        self._output_picker_layout.addWidget(self.output_progress)
+        self._main_layout.addWidget(self.output_picker_layout)
+        self.groups_layout = QtWidgets.QWidget(parent=self.main_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.groups_layout.sizePolicy().hasHeightForWidth()
+        )
+        self.groups_layout.setSizePolicy(sizePolicy)
+        self.groups_layout.setLayoutDirection(QtCore.Qt.LayoutDirection.RightToLeft)
+        self.groups_layout.setObjectName("groups_layout")
+        self._groups_layout = QtWidgets.QHBoxLayout(self.groups_layout)
+        self._groups_layout.setContentsMargins(0, 0, 0, 0)
+        self._groups_layout.setObjectName("_groups_layout")
+        self.groups_spinbox = QtWidgets.QSpinBox(parent=self.groups_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.groups_spinbox.sizePolicy().hasHeightForWidth()
+        )
+        self.groups_spinbox.setSizePolicy(sizePolicy)
+        self.groups_spinbox.setMinimumSize(QtCore.QSize(90, 30))
+        self.groups_spinbox.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.groups_spinbox.setProperty("value", 4)
+        self.groups_spinbox.setObjectName("groups_spinbox")
+        self._groups_layout.addWidget(self.groups_spinbox)
+        self.groups_label = QtWidgets.QLabel(parent=self.groups_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.groups_label.sizePolicy().hasHeightForWidth())
+        self.groups_label.setSizePolicy(sizePolicy)
+        self.groups_label.setMinimumSize(QtCore.QSize(220, 30))
+        self.groups_label.setLayoutDirection(QtCore.Qt.LayoutDirection.RightToLeft)
+        self.groups_label.setAlignment(
+            QtCore.Qt.AlignmentFlag.AlignLeading
+            | QtCore.Qt.AlignmentFlag.AlignLeft
+            | QtCore.Qt.AlignmentFlag.AlignVCenter
+        )
+        self.groups_label.setObjectName("groups_label")
+        self._groups_layout.addWidget(self.groups_label)
+        self._main_layout.addWidget(self.groups_layout)
+        self.iterations_layout = QtWidgets.QWidget(parent=self.main_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.iterations_layout.sizePolicy().hasHeightForWidth()
+        )
+        self.iterations_layout.setSizePolicy(sizePolicy)
+        self.iterations_layout.setLayoutDirection(QtCore.Qt.LayoutDirection.RightToLeft)
+        self.iterations_layout.setObjectName("iterations_layout")
+        self._iterations_layout = QtWidgets.QHBoxLayout(self.iterations_layout)
+        self._iterations_layout.setContentsMargins(0, 0, 0, 0)
+        self._iterations_layout.setObjectName("_iterations_layout")
+        self.iterations_spinbox = QtWidgets.QSpinBox(parent=self.iterations_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.iterations_spinbox.sizePolicy().hasHeightForWidth()
+        )
+        self.iterations_spinbox.setSizePolicy(sizePolicy)
+        self.iterations_spinbox.setMinimumSize(QtCore.QSize(90, 30))
+        self.iterations_spinbox.setLayoutDirection(
+            QtCore.Qt.LayoutDirection.LeftToRight
+        )
+        self.iterations_spinbox.setProperty("value", 3)
+        self.iterations_spinbox.setObjectName("iterations_spinbox")
+        self._iterations_layout.addWidget(self.iterations_spinbox)
+        self.iterations_label = QtWidgets.QLabel(parent=self.iterations_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.iterations_label.sizePolicy().hasHeightForWidth()
+        )
+        self.iterations_label.setSizePolicy(sizePolicy)
+        self.iterations_label.setMinimumSize(QtCore.QSize(220, 30))
+        self.iterations_label.setAlignment(
+            QtCore.Qt.AlignmentFlag.AlignLeading
+            | QtCore.Qt.AlignmentFlag.AlignLeft
+            | QtCore.Qt.AlignmentFlag.AlignVCenter
+        )
+        self.iterations_label.setObjectName("iterations_label")
+        self._iterations_layout.addWidget(self.iterations_label)
+        self._main_layout.addWidget(self.iterations_layout)
+        self.algorithm_layout = QtWidgets.QWidget(parent=self.main_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Preferred
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.algorithm_layout.sizePolicy().hasHeightForWidth()
+        )
+        self.algorithm_layout.setSizePolicy(sizePolicy)
+        self.algorithm_layout.setLayoutDirection(QtCore.Qt.LayoutDirection.RightToLeft)
+        self.algorithm_layout.setObjectName("algorithm_layout")
+        self._algorithm_layout = QtWidgets.QHBoxLayout(self.algorithm_layout)
+        self._algorithm_layout.setContentsMargins(0, 0, 0, 0)
+        self._algorithm_layout.setObjectName("_algorithm_layout")
+        self.run_algorithm_button = QtWidgets.QPushButton(parent=self.algorithm_layout)
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.run_algorithm_button.sizePolicy().hasHeightForWidth()
+        )
+        self.run_algorithm_button.setSizePolicy(sizePolicy)
+        self.run_algorithm_button.setMinimumSize(QtCore.QSize(160, 30))
+        self.run_algorithm_button.setObjectName("run_algorithm_button")
+        self._algorithm_layout.addWidget(self.run_algorithm_button)
+        self.cancel_algorithm_button = QtWidgets.QPushButton(
+            parent=self.algorithm_layout
+        )
+        sizePolicy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(
+            self.cancel_algorithm_button.sizePolicy().hasHeightForWidth()
+        )
+        self.cancel_algorithm_button.setSizePolicy(sizePolicy)
+        self.cancel_algorithm_button.setMinimumSize(QtCore.QSize(160, 30))
+        self.cancel_algorithm_button.setObjectName("cancel_algorithm_button")
+        self._algorithm_layout.addWidget(self.cancel_algorithm_button)
+        self._main_layout.addWidget(self.algorithm_layout)
+        MainWindow.setCentralWidget(self.main_layout)
+
+        self.retranslateUi(MainWindow)
+        self.sorting_comboBox.setCurrentIndex(0)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.input_pick_button.setText(_translate("MainWindow", "Select Input File"))
+        self.reset_synonyms_button.setText(_translate("MainWindow", "Reset Synonyms"))
+        self.reset_synonyms_label.setText(
+            _translate("MainWindow", "Undo any synonym merging")
+        )
+        self.undo_button.setText(_translate("MainWindow", "Undo"))
+        self.redo_button.setText(_translate("MainWindow", "Redo"))
+        self.sorting_label.setText(_translate("MainWindow", "Sorting by:"))
+        self.sorting_comboBox.setItemText(0, _translate("MainWindow", "Value"))
+        self.sorting_comboBox.setItemText(1, _translate("MainWindow", "Frequency"))
+        self.select_synonym_label.setText(
+            _translate(
+                "MainWindow",
+                "Drag a value onto another to treat it as a synonym of that value",
+            )
+        )
+        self.weigh_attribute_label.setText(
+            _translate(
+                "MainWindow",
+                "Click on a column header to switch between that attribute being treated normally, ignored, prioritized by a factor of 2 or deprioritized by a factor 2 by the algorithm",
+            )
+        )
+        self.output_pick_button.setText(_translate("MainWindow", "Select Output File"))
+        self.groups_label.setText(_translate("MainWindow", "Number of Groups:"))
+        self.iterations_label.setText(_translate("MainWindow", "Number of Iterations:"))
+        self.run_algorithm_button.setText(_translate("MainWindow", "Start Algorithm"))
+        self.cancel_algorithm_button.setText(_translate("MainWindow", "Cancel"))
+
+
+from ui.attribute_merge_table import AttributeMergeTable
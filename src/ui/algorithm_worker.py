@@ -1,28 +1,67 @@
+from threading import Event
 from PyQt6.QtCore import QObject, pyqtSignal
 from data_structures import Participant, Assignment
-from algorithm.simulated_annealing_algorithm import SimulatedAnnealingAlgorithm
+from algorithm.progress_reporter import ReportingOptions
+from algorithm.search_algorithm import SearchAlgorithm
+from algorithm.stopping_criteria import StoppingOptions
 
 
 class AlgorithmWorker(QObject):
     """Algorithm worker thread object."""
 
     finished = pyqtSignal(object)
-    progress = pyqtSignal(int, int)
+    failed = pyqtSignal(str)
+    report = pyqtSignal(object)
 
-    algorithm_instance: SimulatedAnnealingAlgorithm
+    algorithm_instance: SearchAlgorithm
     participants: set[Participant]
     number_of_groups: int
     number_of_iterations: int
-    number_of_epochs: int
+    number_of_epochs: int | None
+    time_budget: float | None = None
+    stall_cycles: int | None = None
+    auto_temperature: bool = False
+    stratified_start: bool = False
+    run_in_process: bool = False
+    cancellation: Event
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.cancellation = Event()
+
+    def cancel(self) -> None:
+        """Ask a running algorithm to stop, it then emits the best assignment found so far.
+
+        Call it directly from another thread, the worker thread is busy running the algorithm
+        and does not process queued signals.
+        """
+        self.cancellation.set()
 
     def run(self) -> None:
-        """Run the algorithm"""
-        self.finished.emit(
-            self.algorithm_instance.find_assignment(
-                self.participants,
-                self.number_of_groups,
-                self.number_of_iterations,
-                self.number_of_epochs,
-                progress_callback=self.progress.emit,
-            )
+        """Run the algorithm and emit its assignment, or emit the error message if it fails."""
+        try:
+            self.finished.emit(self.__find_assignment())
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self.failed.emit(str(error))
+
+    def __find_assignment(self) -> Assignment:
+        """Run the algorithm, in a child process if requested, so it does not hold the interpreter lock of the interface
+
+        :return: the assignment found by the algorithm
+        """
+        find_assignment = (
+            self.algorithm_instance.find_assignment_in_process
+            if self.run_in_process
+            else self.algorithm_instance.find_assignment
+        )
+        return find_assignment(
+            self.participants,
+            self.number_of_groups,
+            self.number_of_iterations,
+            self.number_of_epochs,
+            stopping=StoppingOptions(self.time_budget, self.stall_cycles),
+            auto_temperature=self.auto_temperature,
+            stratified_start=self.stratified_start,
+            cancellation=self.cancellation,
+            reporting=ReportingOptions(self.report.emit),
         )
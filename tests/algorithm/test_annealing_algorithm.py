@@ -1,10 +1,22 @@
 """Module containing tests for the simulated annealing algorithm."""
 
+from itertools import count
 from random import Random
+from threading import Event
+import time
+from typing import Iterator
+import pytest
+
 from data_structures import Assignment, Participant
+from algorithm.search_algorithm import ChainStatistics
 from algorithm.simulated_annealing_algorithm import SimulatedAnnealingAlgorithm
 from algorithm.random_algorithm import RandomAlgorithm
 from algorithm.objective_function import ObjectiveFunction
+from algorithm.progress_reporter import ProgressReport, ReportingOptions
+from algorithm.annealing_checkpoint import AnnealingCheckpoint, CheckpointOptions
+from algorithm.move_set import MoveSet
+from algorithm.stratified_seeder import StratifiedSeeder
+from algorithm.stopping_criteria import StoppingOptions
 
 
 def test_find_assignment():
@@ -80,3 +92,467 @@ def test_quality():
     assert objective.calculate_weighted_cost(
         annealing_assignment
     ) < objective.calculate_weighted_cost(brute_force_assignment)
+
+
+def test_find_assignment_multi_start():
+    """Tests whether multi-start annealing is reproducible and returns the best chain."""
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+        Participant(5, {"gender": "w", "nationalität": "mordor", "fb": "1"}),
+        Participant(6, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(7, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(8, {"gender": "w", "nationalität": "angmar", "fb": "3"}),
+        Participant(9, {"gender": "d", "nationalität": "mordor", "fb": "1"}),
+        Participant(10, {"gender": "d", "nationalität": "mordor", "fb": "1"}),
+    ]
+    test_seed: int = 11112222
+    attributes: list[str] = list(participants[0].attributes.keys())
+    results: list[tuple[Assignment, list[ChainStatistics]]] = [
+        SimulatedAnnealingAlgorithm(
+            attributes, Random(test_seed)
+        ).find_assignment_multi_start(set(participants), 3, 3, 100, 3, max_workers)
+        for max_workers in (1, 3)
+    ]
+
+    assert results[0][0] == results[1][0]
+    assert [chain.seed for chain in results[0][1]] == [
+        chain.seed for chain in results[1][1]
+    ]
+    assert len({chain.seed for chain in results[0][1]}) == 3
+
+    # the chains are scored with the bounds of the random sample drawn after the seeds
+    random: Random = Random(test_seed)
+    for _ in range(3):
+        random.getrandbits(64)
+    objective: ObjectiveFunction = ObjectiveFunction(attributes)
+    objective.recalculate_bounds(
+        RandomAlgorithm(random).find_assignment(set(participants), 3, 3)
+    )
+    for chain, result in zip(results[0][1], results[1][1]):
+        assert chain.cost == pytest.approx(result.cost)
+    best_cost: float = objective.calculate_weighted_cost(results[0][0])
+    assert best_cost == pytest.approx(min(chain.cost for chain in results[0][1]))
+    for group in results[0][0][0]:
+        for participant in group:
+            assert participant is participants[participant.uid]
+
+
+def test_trace():
+    """Tests whether the trace holds the sampled costs of the last run only."""
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+        Participant(5, {"gender": "w", "nationalität": "mordor", "fb": "1"}),
+        Participant(6, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+    ]
+    attributes: list[str] = list(participants[0].attributes.keys())
+    algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        attributes, Random(11112222), trace_capacity=20, trace_stride=5
+    )
+    algorithm.find_assignment(set(participants), 2, 3, 40)
+    algorithm.find_assignment(set(participants), 2, 3, 50)
+
+    assert algorithm.trace.cycles.tolist() == list(range(5, 55, 5))
+    assert algorithm.trace.temperatures[-1] == 0
+    assert ((algorithm.trace.costs >= 0) & (algorithm.trace.costs <= 1)).all()
+
+
+def test_stopping_criteria(monkeypatch):
+    """Tests whether runs stop at the time budget and once they stall or freeze."""
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+        Participant(5, {"gender": "w", "nationalität": "mordor", "fb": "1"}),
+        Participant(6, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+    ]
+    algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        list(participants[0].attributes.keys()), Random(11112222)
+    )
+    progress: list[tuple[int, int]] = []
+
+    # a clock advancing a hundredth of a second on every reading makes the time budget deterministic
+    clock: Iterator[float] = count(0, 0.01)
+    with monkeypatch.context() as patch:
+        patch.setattr(time, "perf_counter", lambda: next(clock))
+        algorithm.find_assignment(
+            set(participants),
+            2,
+            3,
+            None,
+            stopping=StoppingOptions(0.2),
+            progress_callback=lambda current, total: progress.append((current, total)),
+        )
+    assert algorithm.trace.cycles[-1] <= 20
+    assert progress[0] == (0, 1000)
+    assert progress[-1] == (1000, 1000)
+
+    algorithm.find_assignment(
+        set(participants), 2, 3, 10000, stopping=StoppingOptions(stall_cycles=50)
+    )
+    assert algorithm.trace.cycles[-1] < 10000
+
+    algorithm.find_assignment(
+        set(participants),
+        2,
+        3,
+        10000,
+        temperature_scaling=100,
+        stopping=StoppingOptions(min_acceptance_rate=0.01, acceptance_window=100),
+    )
+    assert algorithm.trace.cycles[-1] < 10000
+
+    with pytest.raises(ValueError):
+        algorithm.find_assignment(set(participants), 2, 3, None)
+
+
+def test_best_assignment():
+    """Tests whether the best visited assignment and the cycle it was found at are returned."""
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+        Participant(5, {"gender": "w", "nationalität": "mordor", "fb": "1"}),
+        Participant(6, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+    ]
+    algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        list(participants[0].attributes.keys()), Random(11112222)
+    )
+    algorithm.find_assignment(set(participants), 2, 3, 200, intitial_temperature=10)
+
+    costs: list[float] = algorithm.trace.costs.tolist()
+    assert algorithm.best_cost == pytest.approx(min(costs))
+    assert algorithm.best_cycle == costs.index(min(costs)) + 1
+
+
+def test_move_set():
+    """Tests whether annealing with rotations and repeated pair moves keeps the assignment shape."""
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+        Participant(5, {"gender": "w", "nationalität": "mordor", "fb": "1"}),
+        Participant(6, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(7, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(8, {"gender": "w", "nationalität": "angmar", "fb": "3"}),
+        Participant(9, {"gender": "d", "nationalität": "mordor", "fb": "1"}),
+    ]
+    algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        list(participants[0].attributes.keys()), Random(11112222)
+    )
+    assignment: Assignment = algorithm.find_assignment(
+        set(participants), 3, 3, 300, move_set=MoveSet()
+    )
+
+    for iteration in assignment:
+        assert sorted(len(group) for group in iteration) == [3, 3, 4]
+        assert set().union(*iteration) == set(participants)
+    assert algorithm.best_cost == pytest.approx(algorithm.trace.costs.min())
+
+
+def test_stratified_start():
+    """Tests whether annealing from a stratified assignment never returns a worse one."""
+    participants: list[Participant] = [
+        Participant(
+            index, {"gender": "mwd"[index % 3], "fb": ["1", "2", "3", "4"][index % 4]}
+        )
+        for index in range(20)
+    ]
+    attributes: list[str] = list(participants[0].attributes.keys())
+    algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        attributes, Random(11112222)
+    )
+    assignment: Assignment = algorithm.find_assignment(
+        set(participants), 5, 3, 200, stratified_start=True, auto_temperature=True
+    )
+    seed: Assignment = StratifiedSeeder(attributes, Random(11112222)).find_assignment(
+        set(participants), 5, 3
+    )
+
+    objective: ObjectiveFunction = ObjectiveFunction(attributes)
+    assert objective.calculate_weighted_cost(
+        assignment
+    ) <= objective.calculate_weighted_cost(seed)
+
+
+def test_checkpoint():
+    """Tests whether a run continued from a serialized checkpoint ends like the uninterrupted run."""
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+        Participant(5, {"gender": "w", "nationalität": "mordor", "fb": "1"}),
+        Participant(6, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(7, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(8, {"gender": "w", "nationalität": "angmar", "fb": "3"}),
+    ]
+    attributes: list[str] = list(participants[0].attributes.keys())
+    checkpoints: list[AnnealingCheckpoint] = []
+    algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        attributes, Random(11112222)
+    )
+    uninterrupted: Assignment = algorithm.find_assignment(
+        set(participants),
+        3,
+        3,
+        300,
+        auto_temperature=True,
+        checkpointing=CheckpointOptions(interval=100, callback=checkpoints.append),
+    )
+    assert [checkpoint.cycle for checkpoint in checkpoints] == [100, 200, 300]
+    assert algorithm.checkpoint.cycle == 300
+
+    copies: list[Participant] = [
+        Participant(participant.uid, participant.attributes)
+        for participant in participants
+    ]
+    resumed_algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        attributes
+    )
+    resumed: Assignment = resumed_algorithm.find_assignment(
+        set(copies),
+        3,
+        3,
+        300,
+        checkpointing=CheckpointOptions(
+            AnnealingCheckpoint.from_json(checkpoints[0].to_json())
+        ),
+    )
+    assert resumed == uninterrupted
+    assert resumed_algorithm.best_cost == pytest.approx(algorithm.best_cost)
+    assert resumed_algorithm.trace.cycles[0] == 101
+
+    resumed_algorithm.find_assignment(
+        set(copies),
+        3,
+        3,
+        400,
+        checkpointing=CheckpointOptions(resumed_algorithm.checkpoint),
+    )
+    assert resumed_algorithm.trace.cycles.tolist() == list(range(301, 401))
+
+    with pytest.raises(ValueError):
+        resumed_algorithm.find_assignment(
+            set(copies[:-1]),
+            3,
+            3,
+            400,
+            checkpointing=CheckpointOptions(resumed_algorithm.checkpoint),
+        )
+
+
+def test_checkpoint_single_iteration():
+    """Tests whether a single iteration is checkpointed and resumed instead of solved anew."""
+    participants: list[Participant] = [
+        Participant(
+            index, {"gender": "mwd"[index % 3], "fb": ["1", "2", "3", "4"][index % 4]}
+        )
+        for index in range(12)
+    ]
+    attributes: list[str] = list(participants[0].attributes.keys())
+    checkpoints: list[AnnealingCheckpoint] = []
+    algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        attributes, Random(11112222)
+    )
+    uninterrupted: Assignment = algorithm.find_assignment(
+        set(participants),
+        3,
+        1,
+        200,
+        checkpointing=CheckpointOptions(interval=100, callback=checkpoints.append),
+    )
+    assert [checkpoint.cycle for checkpoint in checkpoints] == [100, 200]
+    assert algorithm.checkpoint.cycle == 200
+
+    resumed_algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        attributes
+    )
+    resumed: Assignment = resumed_algorithm.find_assignment(
+        set(participants), 3, 1, 200, checkpointing=CheckpointOptions(checkpoints[0])
+    )
+    objective: ObjectiveFunction = ObjectiveFunction(attributes)
+    objective.recalculate_bounds(uninterrupted)
+    # a single iteration has many equally good assignments, ties may be broken differently
+    assert objective.calculate_weighted_cost(resumed) == pytest.approx(
+        objective.calculate_weighted_cost(uninterrupted)
+    )
+    assert resumed_algorithm.trace.cycles[0] == 101
+
+
+def test_initial_assignment():
+    """Tests whether a warm-started run never returns an assignment worse than its start."""
+    participants: list[Participant] = [
+        Participant(
+            index, {"gender": "mwd"[index % 3], "fb": ["1", "2", "3", "4"][index % 4]}
+        )
+        for index in range(12)
+    ]
+    attributes: list[str] = list(participants[0].attributes.keys())
+    initial_assignment: Assignment = RandomAlgorithm(Random(11112222)).find_assignment(
+        set(participants), 3, 3
+    )
+    assignment: Assignment = SimulatedAnnealingAlgorithm(
+        attributes, Random(11112222)
+    ).find_assignment(
+        set(participants),
+        3,
+        3,
+        100,
+        auto_temperature=True,
+        initial_assignment=initial_assignment,
+    )
+
+    objective: ObjectiveFunction = ObjectiveFunction(attributes)
+    assert objective.calculate_weighted_cost(
+        assignment
+    ) <= objective.calculate_weighted_cost(initial_assignment)
+
+
+def test_reoptimize():
+    """Tests whether reoptimization adapts to roster changes and keeps most placements at a high penalty."""
+    participants: list[Participant] = [
+        Participant(
+            index, {"gender": "mwd"[index % 3], "fb": ["1", "2", "3", "4"][index % 4]}
+        )
+        for index in range(12)
+    ]
+    test_algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        list(participants[0].attributes.keys()), Random(11112222)
+    )
+    assignment: Assignment = test_algorithm.find_assignment(
+        set(participants), 3, 3, 300
+    )
+    added: set[Participant] = {Participant(12, {"gender": "w", "fb": "1"})}
+    removed: set[Participant] = {participants[0]}
+    reoptimized: Assignment = test_algorithm.reoptimize(
+        assignment, added, removed, 300, movement_penalty=10
+    )
+
+    assert len(reoptimized) == 3
+    for iteration, reoptimized_iteration in zip(assignment, reoptimized):
+        assert len(reoptimized_iteration) == 3
+        assert (
+            set().union(*reoptimized_iteration) == (set(participants) - removed) | added
+        )
+        kept: int = sum(
+            len(group & reoptimized_group)
+            for group, reoptimized_group in zip(iteration, reoptimized_iteration)
+        )
+        assert kept >= len(participants) - 3
+
+
+def test_reoptimize_single_iteration():
+    """Tests whether reoptimizing a single iteration keeps most placements instead of solving it anew."""
+    participants: list[Participant] = [
+        Participant(
+            index, {"gender": "mwd"[index % 3], "fb": ["1", "2", "3", "4"][index % 4]}
+        )
+        for index in range(30)
+    ]
+    test_algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        list(participants[0].attributes.keys()), Random(11112222)
+    )
+    assignment: Assignment = RandomAlgorithm(Random(11112222)).find_assignment(
+        set(participants), 5, 1
+    )
+    added: set[Participant] = {Participant(30, {"gender": "w", "fb": "1"})}
+    removed: set[Participant] = {participants[0]}
+    reoptimized: Assignment = test_algorithm.reoptimize(
+        assignment, added, removed, 300, movement_penalty=10
+    )
+
+    assert len(reoptimized) == 1
+    assert set().union(*reoptimized[0]) == (set(participants) - removed) | added
+    kept: int = sum(
+        len(group & reoptimized_group)
+        for group, reoptimized_group in zip(assignment[0], reoptimized[0])
+    )
+    assert kept >= len(participants) - 3
+
+
+def test_cancellation():
+    """Tests whether a cancelled run stops at the next check and returns the best assignment so far."""
+    participants: list[Participant] = [
+        Participant(
+            index, {"gender": "mwd"[index % 3], "fb": ["1", "2", "3", "4"][index % 4]}
+        )
+        for index in range(12)
+    ]
+    test_algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        list(participants[0].attributes.keys()), Random(11112222)
+    )
+    cancellation: Event = Event()
+    test_algorithm.find_assignment(
+        set(participants), 3, 3, 1000, cancellation=cancellation
+    )
+    assert not test_algorithm.cancelled
+
+    cancellation.set()
+    assignment: Assignment = test_algorithm.find_assignment(
+        set(participants), 3, 3, 1000, cancellation=cancellation
+    )
+    assert test_algorithm.cancelled
+    assert test_algorithm.trace.cycles[-1] == 100
+    assert len(assignment) == 3
+    assert all(len(group) == 4 for iteration in assignment for group in iteration)
+
+
+def test_find_assignment_in_process():
+    """Tests whether a run in a child process is reproducible, reports its progress and can be cancelled."""
+    participants: list[Participant] = [
+        Participant(
+            index, {"gender": "mwd"[index % 3], "fb": ["1", "2", "3", "4"][index % 4]}
+        )
+        for index in range(12)
+    ]
+    attributes: list[str] = list(participants[0].attributes.keys())
+    reports: list[ProgressReport] = []
+    assignments: list[Assignment] = [
+        SimulatedAnnealingAlgorithm(
+            attributes, Random(11112222)
+        ).find_assignment_in_process(
+            set(participants),
+            3,
+            3,
+            500,
+            reporting=ReportingOptions(reports.append),
+            auto_temperature=True,
+        )
+        for _ in range(2)
+    ]
+    assert assignments[0] == assignments[1]
+    assert all(len(group) == 4 for iteration in assignments[0] for group in iteration)
+    assert set().union(*assignments[0][0]) == set(participants)
+    assert reports[0].current == 0
+    assert reports[-1].current == 500
+
+    algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        attributes, Random(11112222)
+    )
+    cancellation: Event = Event()
+    cancellation.set()
+    assignment: Assignment = algorithm.find_assignment_in_process(
+        set(participants),
+        3,
+        3,
+        None,
+        cancellation=cancellation,
+        stopping=StoppingOptions(60),
+    )
+    assert algorithm.cancelled
+    assert len(assignment) == 3
@@ -0,0 +1,41 @@
+"""Module containing tests for the tracker of the best assignment."""
+
+import pytest
+
+from algorithm.best_assignment_tracker import BestAssignmentTracker
+from algorithm.compact_assignment import CompactAssignment
+from data_structures import Assignment, Participant
+
+
+@pytest.fixture
+def participants() -> list[Participant]:
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m"}),
+        Participant(1, {"gender": "m"}),
+        Participant(2, {"gender": "w"}),
+        Participant(3, {"gender": "w"}),
+    ]
+    return participants
+
+
+@pytest.mark.parametrize("swap_count", [2, 20])
+def test_best_assignment(participants, swap_count):
+    """Tests whether the best assignment is restored from the journal and from the snapshot."""
+    assignment: Assignment = [[set(participants[:2]), set(participants[2:])]]
+    state: CompactAssignment = CompactAssignment.from_assignment(assignment)
+    tracker: BestAssignmentTracker = BestAssignmentTracker(state, 1.0)
+
+    state.swap(0, 0, 2)
+    tracker.record_swap(0, 0, 2)
+    assert tracker.update(1, 0.5)
+    best: Assignment = state.to_assignment()
+
+    for cycle in range(swap_count):
+        participant: int = 1 if cycle % 2 == 0 else 0
+        state.swap(0, participant, 3 - participant)
+        tracker.record_swap(0, participant, 3 - participant)
+        assert not tracker.update(cycle + 2, 0.5 + cycle)
+
+    assert tracker.cost == 0.5
+    assert tracker.cycle == 1
+    assert tracker.best_assignment().to_assignment() == best
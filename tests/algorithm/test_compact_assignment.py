@@ -0,0 +1,75 @@
+"""Module containing tests for the array-backed assignment representation."""
+
+import numpy as np
+import pytest
+
+from algorithm.compact_assignment import CompactAssignment
+from data_structures import Assignment, Participant
+
+
+@pytest.fixture
+def participants() -> list[Participant]:
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+    ]
+    return participants
+
+
+def test_conversion(participants):
+    """Tests whether converting to the array-backed representation and back is lossless."""
+    assignment: Assignment = [
+        [{participants[4], participants[0]}, set(participants[1:4])],
+        [set(participants[:3]), {participants[3], participants[4]}],
+    ]
+    compact: CompactAssignment = CompactAssignment.from_assignment(assignment)
+
+    assert compact.participants == participants
+    assert compact.iteration_count == 2
+    assert compact.groups_per_iteration == 2
+    assert compact.group_ids.tolist() == [[0, 1, 1, 1, 0], [0, 0, 0, 1, 1]]
+    assert sorted(compact.group_members(0, 4).tolist()) == [0, 4]
+    assert compact.to_assignment() == assignment
+
+
+def test_swap(participants):
+    """Tests whether swapping updates group ids, members and positions consistently."""
+    assignment: Assignment = [[set(participants[:3]), set(participants[3:])]]
+    compact: CompactAssignment = CompactAssignment.from_assignment(
+        assignment, participants[::-1]
+    )
+    copied: CompactAssignment = compact.copy()
+    compact.swap(0, 0, 4)
+
+    # index 0 is participant 4, index 4 is participant 0
+    assert compact.to_assignment() == [
+        [
+            {participants[4], participants[1], participants[2]},
+            {participants[3], participants[0]},
+        ]
+    ]
+    for group_members in compact.members[0]:
+        for position, participant in enumerate(group_members.tolist()):
+            assert compact.positions[0, participant] == position
+    assert copied.to_assignment() == assignment
+
+
+def test_swap_undo(participants):
+    """Tests whether applying a swap twice restores the original assignment in place."""
+    assignment: Assignment = [
+        [{participants[4], participants[0]}, set(participants[1:4])],
+        [set(participants[:3]), {participants[3], participants[4]}],
+    ]
+    compact: CompactAssignment = CompactAssignment.from_assignment(assignment)
+    group_ids: np.ndarray = compact.group_ids
+    positions: np.ndarray = compact.positions.copy()
+
+    compact.swap(1, 2, 3)
+    assert compact.group_ids is group_ids
+    compact.swap(1, 2, 3)
+
+    assert compact.to_assignment() == assignment
+    assert (compact.positions == positions).all()
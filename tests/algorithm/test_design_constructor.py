@@ -0,0 +1,69 @@
+"""Module containing tests for the combinatorial design constructor."""
+
+from random import Random
+import pytest
+
+from data_structures import Assignment, Participant
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.design_constructor import DesignConstructor
+from algorithm.meeting_matrix import MeetingMatrix
+from algorithm.simulated_annealing_algorithm import SimulatedAnnealingAlgorithm
+
+
+def repeat_count(assignment: Assignment) -> int:
+    """Count the repeated encounters of pairs in an assignment."""
+    return MeetingMatrix.from_compact(
+        CompactAssignment.from_assignment(assignment)
+    ).repeat_count
+
+
+@pytest.mark.parametrize(
+    "participant_count, groups_per_iteration, iterations",
+    [(16, 4, 5), (81, 9, 10), (20, 5, 5), (8, 4, 7), (49, 7, 8)],
+)
+def test_find_design(participant_count, groups_per_iteration, iterations):
+    """Tests whether designs without repeated meetings are found for feasible shapes."""
+    participants: set[Participant] = {
+        Participant(index, {}) for index in range(participant_count)
+    }
+    constructor: DesignConstructor = DesignConstructor(Random(11112222))
+    assignment: Assignment = constructor.find_design(
+        participants, groups_per_iteration, iterations
+    )
+
+    assert len(assignment) == iterations
+    for iteration in assignment:
+        assert len(iteration) == groups_per_iteration
+        assert {len(group) for group in iteration} == {
+            participant_count // groups_per_iteration
+        }
+        assert set().union(*iteration) == participants
+    assert repeat_count(assignment) == 0
+
+
+def test_find_assignment():
+    """Tests whether shapes without a design get an assignment of the correct shape instead."""
+    participants: set[Participant] = {Participant(index, {}) for index in range(12)}
+    constructor: DesignConstructor = DesignConstructor(Random(11112222))
+
+    assert constructor.find_design(participants, 3, 2) is None
+    assert constructor.find_design(participants, 4, 5) is None
+    assignment: Assignment = constructor.find_assignment(participants, 4, 5)
+    for iteration in assignment:
+        assert sorted(len(group) for group in iteration) == [3, 3, 3, 3]
+        assert set().union(*iteration) == participants
+
+
+def test_annealing_mix_only():
+    """Tests whether annealing without attributes returns a design without running cycles."""
+    participants: set[Participant] = {
+        Participant(index, {"gender": "mw"[index % 2]}) for index in range(25)
+    }
+    algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        [], Random(11112222)
+    )
+    assignment: Assignment = algorithm.find_assignment(participants, 5, 6, 1000)
+
+    assert repeat_count(assignment) == 0
+    assert len(algorithm.trace) == 0
+    assert algorithm.best_cost == 0
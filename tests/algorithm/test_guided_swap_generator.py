@@ -0,0 +1,65 @@
+"""Module containing tests for the guided generator of swap proposals."""
+
+from random import Random
+import pytest
+
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.guided_swap_generator import GuidedSwapGenerator
+from algorithm.meeting_matrix import MeetingMatrix
+from algorithm.objective_function import ObjectiveFunction
+from data_structures import Assignment, Participant
+
+
+@pytest.fixture
+def participants() -> list[Participant]:
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+        Participant(5, {"gender": "w", "nationalität": "mordor", "fb": "1"}),
+        Participant(6, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(7, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(8, {"gender": "w", "nationalität": "angmar", "fb": "3"}),
+    ]
+    return participants
+
+
+def test_group_costs(participants):
+    """Tests whether the group costs add up to the weighted cost and stay up to date after swaps."""
+    assignment: Assignment = [
+        [set(participants[:3]), set(participants[3:6]), set(participants[6:])],
+        [set(participants[:3]), set(participants[3:6]), set(participants[6:])],
+    ]
+    objective: ObjectiveFunction = ObjectiveFunction(["gender", "nationalität", "fb"])
+    state: CompactAssignment = CompactAssignment.from_assignment(assignment)
+    meetings: MeetingMatrix = MeetingMatrix.from_compact(state)
+    generator: GuidedSwapGenerator = GuidedSwapGenerator(
+        objective, state, meetings, 2, 1
+    )
+
+    assert generator.group_costs.sum() == pytest.approx(
+        objective.calculate_state_cost(state, 2, 1)
+    )
+
+    random: Random = Random(11112222)
+    for _ in range(20):
+        iteration, participant_1, participant_2 = generator.propose(random)
+        assert (
+            state.group_ids[iteration, participant_1]
+            != state.group_ids[iteration, participant_2]
+        )
+        meetings.swap(
+            participant_1,
+            state.group_members(iteration, participant_1),
+            participant_2,
+            state.group_members(iteration, participant_2),
+        )
+        state.swap(iteration, participant_1, participant_2)
+        generator.update(participant_1, participant_2)
+
+    assert generator.group_costs == pytest.approx(objective.group_costs(state, 2, 1))
+    assert generator.group_costs.sum() == pytest.approx(
+        objective.calculate_state_cost(state, 2, 1)
+    )
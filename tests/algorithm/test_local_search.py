@@ -0,0 +1,54 @@
+"""Module containing tests for the moves of a local search."""
+
+from random import Random
+import numpy as np
+import pytest
+
+from algorithm.best_assignment_tracker import BestAssignmentTracker
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.local_search import LocalSearch
+from algorithm.move_set import MoveSet
+from algorithm.movement_penalty import MovementPenalty
+from algorithm.objective_function import ObjectiveFunction
+from algorithm.random_algorithm import RandomAlgorithm
+from data_structures import Assignment, Participant
+
+
+def test_local_search():
+    """Tests whether undone moves leave the assignment unchanged
+    and whether taken moves change the cost by their evaluated delta."""
+    random: Random = Random(11112222)
+    participants: list[Participant] = [
+        Participant(index, {"gender": "m" if index % 3 == 0 else "w"})
+        for index in range(12)
+    ]
+    assignment: Assignment = RandomAlgorithm(random).find_assignment(
+        set(participants), 3, 3
+    )
+    objective: ObjectiveFunction = ObjectiveFunction(["gender"])
+    state: CompactAssignment = CompactAssignment.from_assignment(
+        assignment, objective.encode(assignment).participants
+    )
+    penalty: MovementPenalty = MovementPenalty(state, assignment, 0.5)
+    search: LocalSearch = LocalSearch(objective, state, penalty, 1, 2, 0.5, MoveSet())
+    cost: float = objective.calculate_state_cost(state, 1, 2)
+    best: BestAssignmentTracker = BestAssignmentTracker(state, cost)
+
+    for cycle in range(1, 51):
+        group_ids: np.ndarray = state.group_ids.copy()
+        move_type, move, delta = search.propose(random)
+        if cycle % 2 == 0:
+            search.undo(move)
+            assert np.array_equal(state.group_ids, group_ids)
+        else:
+            search.take(move, best)
+            cost += delta
+        search.record(move_type, delta < 0)
+        best.update(cycle, cost)
+        assert cost == pytest.approx(
+            objective.calculate_state_cost(state, 1, 2) + penalty.cost(state.group_ids)
+        )
+    assert best.cost == pytest.approx(
+        objective.calculate_state_cost(best.best_assignment(), 1, 2)
+        + penalty.cost(best.best_group_ids())
+    )
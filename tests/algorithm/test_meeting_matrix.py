@@ -0,0 +1,78 @@
+"""Module containing tests for the meeting matrix."""
+
+import pytest
+
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.meeting_matrix import MeetingMatrix
+from data_structures import Assignment, Participant
+
+
+@pytest.fixture
+def participants() -> list[Participant]:
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+        Participant(5, {"gender": "w", "nationalität": "mordor", "fb": "1"}),
+    ]
+    return participants
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_counts(participants, sparse):
+    """Tests whether meetings and repeated encounters are counted correctly."""
+    assignment: Assignment = [
+        [set(participants[:3]), set(participants[3:])],
+        [
+            {participants[0], participants[1], participants[3]},
+            {participants[2], participants[4], participants[5]},
+        ],
+        [set(participants[:3]), set(participants[3:])],
+    ]
+    compact: CompactAssignment = CompactAssignment.from_assignment(assignment)
+    matrix: MeetingMatrix = MeetingMatrix.from_compact(compact, sparse)
+
+    assert matrix.count(0, 1) == 3
+    assert matrix.count(0, 3) == 1
+    assert matrix.count(0, 5) == 0
+    assert matrix.partner_count(0) == 3
+    assert matrix.partner_count(4) == 3
+    # (0, 1) meet three times, (0, 2), (1, 2), (3, 4), (3, 5) twice, (4, 5) three times
+    assert matrix.repeat_count == 3 + 1 + 1 + 1 + 1 + 3
+
+    # in the group {0, 1, 2}: 0 meets 1 twice and 2 once elsewhere, 1 meets 0 twice and 2 once, 2 meets both once
+    assert sorted(matrix.member_repeat_counts(compact.members[0][0]).tolist()) == [
+        2,
+        3,
+        3,
+    ]
+
+    matrix.remove_group(compact.members[2][0])
+    assert matrix.count(0, 1) == 2
+    assert matrix.repeat_count == 1 + 1 + 1 + 3
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_swap(participants, sparse):
+    """Tests whether swap_delta predicts the change applied by swap."""
+    assignment: Assignment = [
+        [set(participants[:3]), set(participants[3:])],
+        [set(participants[:3]), set(participants[3:])],
+    ]
+    compact: CompactAssignment = CompactAssignment.from_assignment(assignment)
+    matrix: MeetingMatrix = MeetingMatrix.from_compact(compact, sparse)
+    assert matrix.repeat_count == 6
+
+    delta: int = matrix.swap_delta(
+        2, compact.group_members(1, 2), 3, compact.group_members(1, 3)
+    )
+    matrix.swap(2, compact.group_members(1, 2), 3, compact.group_members(1, 3))
+
+    assert delta == -4
+    assert matrix.repeat_count == 2
+    assert matrix.count(2, 3) == 0
+    assert matrix.count(0, 3) == 1
+    assert matrix.count(2, 4) == 1
+    assert matrix.partner_count(2) == 4
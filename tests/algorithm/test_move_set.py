@@ -0,0 +1,124 @@
+"""Module containing tests for the move types and their selection."""
+
+from random import Random
+import pytest
+
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.meeting_matrix import MeetingMatrix
+from algorithm.move_set import (
+    Move,
+    MoveSet,
+    RepeatedPairMove,
+    RotationMove,
+    SwapMove,
+    track_meetings,
+)
+from data_structures import Assignment, Participant
+
+
+@pytest.fixture
+def participants() -> list[Participant]:
+    participants: list[Participant] = [
+        Participant(index, {"gender": "m" if index % 2 == 0 else "w"})
+        for index in range(9)
+    ]
+    return participants
+
+
+def test_rotation_move(participants):
+    """Tests whether a rotation moves three participants of different groups into the next group."""
+    assignment: Assignment = [
+        [set(participants[:3]), set(participants[3:6]), set(participants[6:])]
+    ]
+    state: CompactAssignment = CompactAssignment.from_assignment(assignment)
+    move: Move = RotationMove().propose(
+        state, MeetingMatrix.from_compact(state), Random(11112222)
+    )
+    rotated: list[int] = [move[0][1], move[0][2], move[1][2]]
+    groups_before: list[int] = state.group_ids[0, rotated].tolist()
+    for swap in move:
+        state.swap(*swap)
+
+    assert len(set(groups_before)) == 3
+    assert state.group_ids[0, rotated].tolist() == groups_before[1:] + groups_before[:1]
+
+
+def test_repeated_pair_move(participants):
+    """Tests whether a repeated pair move separates a pair in two iterations."""
+    assignment: Assignment = [
+        [set(participants[:3]), set(participants[3:6]), set(participants[6:])],
+        [set(participants[:3]), set(participants[3:6]), set(participants[6:])],
+    ]
+    state: CompactAssignment = CompactAssignment.from_assignment(assignment)
+    meetings: MeetingMatrix = MeetingMatrix.from_compact(state)
+    move: Move = RepeatedPairMove().propose(state, meetings, Random(11112222))
+    participant_1: int = move[0][1]
+    participant_2: int = move[1][1]
+    for iteration, swapped_1, swapped_2 in move:
+        meetings.swap(
+            swapped_1,
+            state.group_members(iteration, swapped_1),
+            swapped_2,
+            state.group_members(iteration, swapped_2),
+        )
+        state.swap(iteration, swapped_1, swapped_2)
+
+    assert sorted(swap[0] for swap in move) == [0, 1]
+    assert meetings.count(participant_1, participant_2) == 0
+
+    single_iteration: CompactAssignment = CompactAssignment(
+        state.participants, state.group_ids[:1], 3
+    )
+    assert (
+        RepeatedPairMove().propose(
+            single_iteration,
+            MeetingMatrix.from_compact(single_iteration),
+            Random(11112222),
+        )
+        is None
+    )
+
+
+def test_move_set_probabilities(participants):
+    """Tests whether the selection adapts to successful move types, keeps a floor and skips inapplicable ones."""
+    two_groups: CompactAssignment = CompactAssignment.from_assignment(
+        [[set(participants[:5]), set(participants[5:])]]
+    )
+    move_set: MoveSet = MoveSet(
+        [SwapMove(), RotationMove()], min_probability=0.1, adaptation_rate=0.5
+    )
+    move_set.reset(two_groups)
+    assert move_set.probabilities == [1, 0]
+    index, move = move_set.propose(
+        two_groups, MeetingMatrix.from_compact(two_groups), Random(11112222)
+    )
+    assert index == 0
+    assert len(move) == 1
+
+    three_groups: CompactAssignment = CompactAssignment.from_assignment(
+        [[set(participants[:3]), set(participants[3:6]), set(participants[6:])]]
+    )
+    move_set.reset(three_groups)
+    assert move_set.probabilities == pytest.approx([0.5, 0.5])
+    for _ in range(10):
+        move_set.record(0, False)
+        move_set.record(1, True)
+    assert move_set.probabilities[0] == pytest.approx(0.1, abs=0.01)
+    assert sum(move_set.probabilities) == pytest.approx(1)
+
+
+def test_track_meetings(participants):
+    """Tests whether the meeting matrix is only built for searches proposing moves from it."""
+    state: CompactAssignment = CompactAssignment.from_assignment(
+        [[set(participants[:3]), set(participants[3:6]), set(participants[6:])]] * 2
+    )
+    assert track_meetings(state, None, 0) is None
+    assert track_meetings(state, MoveSet([SwapMove(), RotationMove()]), 0) is None
+
+    meetings: MeetingMatrix | None = track_meetings(state, MoveSet(), 0)
+    assert meetings is not None
+    assert meetings.repeat_count == MeetingMatrix.from_compact(state).repeat_count
+    assert track_meetings(state, None, 0.5) is not None
+
+    with pytest.raises(ValueError):
+        RepeatedPairMove().propose(state, None, Random(11112222))
@@ -0,0 +1,48 @@
+"""Module containing tests for the penalty for moving participants."""
+
+from random import Random
+import pytest
+
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.move_set import Move
+from algorithm.movement_penalty import MovementPenalty
+from data_structures import Assignment, Participant
+
+
+def test_movement_penalty():
+    """Tests whether the penalty counts the changed placements of the reference participants
+    and whether its change matches the one of a move."""
+    participants: list[Participant] = [
+        Participant(index, {"gender": "m" if index % 2 == 0 else "w"})
+        for index in range(6)
+    ]
+    # the last participant is not part of the reference assignment
+    reference: Assignment = [
+        [set(participants[:3]), set(participants[3:5])],
+        [{participants[0], participants[2], participants[4]}, set(participants[1:5:2])],
+    ]
+    state: CompactAssignment = CompactAssignment.from_assignment(
+        [
+            [set(participants[:3]), set(participants[3:])],
+            [set(participants[::2]), set(participants[1::2])],
+        ],
+        participants,
+    )
+    penalty: MovementPenalty = MovementPenalty(state, reference, 1.2)
+    assert penalty.cost(state.group_ids) == 0.0
+
+    state.swap(0, 0, 5)
+    assert penalty.cost(state.group_ids) == pytest.approx(1.2 / 12)
+    state.swap(1, 1, 2)
+    assert penalty.cost(state.group_ids) == pytest.approx(3 * 1.2 / 12)
+
+    random: Random = Random(11112222)
+    for _ in range(20):
+        move: Move = [state.random_swap(random), state.random_swap(random)]
+        before: float = penalty.cost(state.group_ids)
+        delta: float = penalty.delta(state, move)
+        for swap in move:
+            state.swap(*swap)
+        assert penalty.cost(state.group_ids) == pytest.approx(before + delta)
+
+    assert MovementPenalty(state, None, 1.2).cost(state.group_ids) == 0.0
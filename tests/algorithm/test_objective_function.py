@@ -1,5 +1,8 @@
+from random import Random
+import numpy as np
 import pytest
 
+from algorithm.compact_assignment import CompactAssignment
 from algorithm.objective_function import ObjectiveFunction
 from data_structures import Assignment, Iteration, Group, Participant
 
@@ -61,6 +64,9 @@ def test_mix_cost(participants):
 
     assert test_function.mix_cost(assignment_1) > test_function.mix_cost(assignment_2)
     assert test_function.mix_cost(assignment_1) == test_function.mix_cost(assignment_3)
+    # two groups sharing n members add n - 1, normalized by the pairs of iterations times participants
+    assert test_function.mix_cost(assignment_1) == pytest.approx(4 / 6)
+    assert test_function.mix_cost(assignment_2) == pytest.approx(2 / 6)
 
 
 def test_diversity_cost(participants):
@@ -91,3 +97,91 @@ def test_diversity_cost(participants):
 
 
 # def test_recalculate_bounds():
+
+
+def test_swap_delta(participants):
+    test_function: ObjectiveFunction = ObjectiveFunction(
+        ["gender", "nationalität", "fb"], {"gender": 2}
+    )
+    group_men: Group = {participants[0], participants[1], participants[2]}
+    group_women: Group = {participants[3], participants[4], participants[5]}
+    group_gondor: Group = {participants[1], participants[2], participants[3]}
+    group_not_gondor: Group = {participants[0], participants[4], participants[5]}
+    assignment: Assignment = [
+        [group_men, group_women],
+        [group_gondor, group_not_gondor],
+        [group_men, group_women],
+    ]
+    swapped_men: Group = {participants[0], participants[1], participants[3]}
+    swapped_women: Group = {participants[2], participants[4], participants[5]}
+    swapped: Assignment = [
+        [group_men, group_women],
+        [group_gondor, group_not_gondor],
+        [swapped_men, swapped_women],
+    ]
+    state: CompactAssignment = CompactAssignment.from_assignment(assignment)
+
+    for mix_weight, diversity_weight in [(1, 1), (3, 1), (1, 0)]:
+        expected: float = test_function.calculate_weighted_cost(
+            swapped, mix_weight, diversity_weight
+        ) - test_function.calculate_weighted_cost(
+            assignment, mix_weight, diversity_weight
+        )
+        assert test_function.swap_delta(
+            state, 2, 2, 3, mix_weight, diversity_weight
+        ) == pytest.approx(expected)
+    assert state.group_ids[2].tolist() == [0, 0, 0, 1, 1, 1]
+
+
+def test_swap_delta_random_swaps(participants):
+    test_function: ObjectiveFunction = ObjectiveFunction(
+        ["gender", "nationalität", "fb"], {"gender": 2}
+    )
+    iteration: Iteration = [
+        {participants[0], participants[1], participants[2]},
+        {participants[3], participants[4], participants[5]},
+    ]
+    state: CompactAssignment = CompactAssignment.from_assignment(
+        [iteration, iteration, iteration]
+    )
+    random: Random = Random(31415)
+    cost: float = test_function.calculate_state_cost(state, 2, 1)
+
+    for _ in range(50):
+        swap: tuple[int, int, int] = state.random_swap(random)
+        delta: float = test_function.swap_delta(state, *swap, 2, 1)
+        state.swap(*swap)
+        new_cost: float = test_function.calculate_state_cost(state, 2, 1)
+        assert delta == pytest.approx(new_cost - cost)
+        cost = new_cost
+
+
+def test_batch_weighted_costs(participants):
+    group_men: Group = {participants[0], participants[1], participants[2]}
+    group_women: Group = {participants[3], participants[4], participants[5]}
+    group_gondor: Group = {participants[1], participants[2], participants[3]}
+    group_not_gondor: Group = {participants[0], participants[4], participants[5]}
+    group_div_1: Group = {participants[0], participants[1], participants[4]}
+    group_div_2: Group = {participants[2], participants[3], participants[5]}
+    assignments: list[Assignment] = [
+        [[group_men, group_women], [group_gondor, group_not_gondor]],
+        [[group_div_1, group_div_2], [group_div_1, group_div_2]],
+        [[group_men, group_women], [group_div_1, group_div_2]],
+    ]
+    test_function: ObjectiveFunction = ObjectiveFunction(
+        ["gender", "nationalität", "fb"], {"fb": 0.5}
+    )
+    encoding = test_function.encode(assignments[0])
+    costs = test_function.batch_weighted_costs(
+        encoding,
+        np.stack([encoding.group_ids(assignment) for assignment in assignments]),
+        2,
+        2,
+        1,
+    )
+
+    assert costs.shape == (3,)
+    for cost, assignment in zip(costs, assignments):
+        assert cost == pytest.approx(
+            test_function.calculate_weighted_cost(assignment, 2, 1)
+        )
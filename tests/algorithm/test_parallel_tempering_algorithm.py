@@ -0,0 +1,122 @@
+"""Module containing tests for the parallel tempering algorithm."""
+
+from math import exp
+from random import Random
+from threading import Event
+import pytest
+
+from data_structures import Assignment, Participant
+from algorithm.annealing_checkpoint import CheckpointOptions
+from algorithm.parallel_tempering_algorithm import ParallelTemperingAlgorithm
+from algorithm.progress_reporter import ProgressReport, ReportingOptions
+from algorithm.stopping_criteria import StoppingOptions
+
+
+@pytest.fixture
+def participants() -> list[Participant]:
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+        Participant(5, {"gender": "w", "nationalität": "mordor", "fb": "1"}),
+        Participant(6, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(7, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(8, {"gender": "w", "nationalität": "angmar", "fb": "3"}),
+        Participant(9, {"gender": "d", "nationalität": "mordor", "fb": "1"}),
+        Participant(10, {"gender": "d", "nationalität": "mordor", "fb": "1"}),
+    ]
+    return participants
+
+
+def test_get_temperatures():
+    """Tests whether the temperature ladder spans the annealing temperature range."""
+    algorithm: ParallelTemperingAlgorithm = ParallelTemperingAlgorithm(
+        [], replica_count=3
+    )
+    temperatures: list[float] = algorithm.get_temperatures(2, 4)
+
+    assert temperatures == pytest.approx([2, 2 * exp(-2), 2 * exp(-4)])
+    assert ParallelTemperingAlgorithm([], replica_count=1).get_temperatures(2, 4) == [2]
+
+
+def test_find_assignment(participants):
+    """Tests whether find_assignment generates assignments of the correct shape
+    that do not depend on the number of processes."""
+    progress: list[tuple[int, int]] = []
+    assignments: list[Assignment] = [
+        ParallelTemperingAlgorithm(
+            list(participants[0].attributes.keys()),
+            Random(11112222),
+            replica_count=3,
+            exchange_interval=20,
+            process_count=process_count,
+        ).find_assignment(
+            set(participants),
+            4,
+            2,
+            50,
+            progress_callback=lambda current, total: progress.append((current, total)),
+        )
+        for process_count in (1, 2)
+    ]
+
+    assert assignments[0] == assignments[1]
+    assert [len(group) for group in assignments[0][0]] == [3, 3, 3, 2]
+    assert [len(group) for group in assignments[0][1]] == [3, 3, 3, 2]
+    assert progress[0] == (0, 50)
+    assert progress[-1] == (50, 50)
+
+
+def test_annealing_arguments(participants):
+    """Tests whether parallel tempering takes the arguments of simulated annealing in the same order,
+    including the ones the algorithm worker passes, and stops at the exchange rounds."""
+    algorithm: ParallelTemperingAlgorithm = ParallelTemperingAlgorithm(
+        list(participants[0].attributes.keys()),
+        Random(11112222),
+        replica_count=3,
+        exchange_interval=20,
+    )
+    assignment: Assignment = algorithm.find_assignment(
+        set(participants), 4, 2, 50, 1, 15, 1, 1
+    )
+    assert len(assignment) == 2
+    assert algorithm.best_cycle in (0, 20, 40, 50)
+
+    reports: list[ProgressReport] = []
+    cancellation: Event = Event()
+    algorithm.find_assignment(
+        set(participants),
+        4,
+        2,
+        None,
+        stopping=StoppingOptions(60, 40),
+        auto_temperature=True,
+        stratified_start=True,
+        cancellation=cancellation,
+        reporting=ReportingOptions(reports.append),
+    )
+    assert not algorithm.cancelled
+    assert reports[-1].cycle == algorithm.best_cycle + 40
+
+    cancellation.set()
+    algorithm.find_assignment(
+        set(participants),
+        4,
+        2,
+        1000,
+        cancellation=cancellation,
+        reporting=ReportingOptions(reports.append),
+    )
+    assert algorithm.cancelled
+    assert reports[-1].cycle == 20
+
+    with pytest.raises(ValueError):
+        algorithm.find_assignment(
+            set(participants),
+            4,
+            2,
+            50,
+            checkpointing=CheckpointOptions(callback=lambda checkpoint: None),
+        )
@@ -0,0 +1,64 @@
+"""Module containing tests for the participant encoding."""
+
+import numpy as np
+import pytest
+
+from algorithm.objective_function import ObjectiveFunction
+from algorithm.participant_encoding import ParticipantEncoding
+from data_structures import Assignment, Participant
+
+
+@pytest.fixture
+def participants() -> list[Participant]:
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+        Participant(5, {"gender": "w", "nationalität": "mordor", "fb": "1"}),
+    ]
+    return participants
+
+
+def test_codes(participants):
+    """Tests whether attribute values are numbered per attribute and offset into shared slots."""
+    encoding: ParticipantEncoding = ParticipantEncoding(
+        participants[::-1], ["gender", "nationalität"], {"gender": 2}
+    )
+    assert encoding.participants == participants[::-1]
+    assert encoding.index_of(participants[3]) == 2
+    assert encoding.codes[:, 0].tolist() == [0, 0, 0, 1, 1, 1]
+    assert encoding.codes[:, 1].tolist() == [0, 1, 2, 2, 2, 0]
+    assert encoding.slots[:, 1].tolist() == [2, 3, 4, 4, 4, 2]
+    assert encoding.slot_weights.tolist() == [2, 2, 1, 1, 1]
+    assert encoding.slot_totals.tolist() == [3, 3, 2, 1, 3]
+    assert encoding.matches(participants)
+    assert not encoding.matches(participants[1:])
+    assert encoding.covers(participants[1:])
+
+
+def test_group_histograms(participants):
+    """Tests whether value counts of all groups are computed in one pass."""
+    encoding: ParticipantEncoding = ParticipantEncoding(participants, ["gender", "fb"])
+    assignment: Assignment = [
+        [set(participants[:3]), set(participants[3:])],
+        [{participants[0], participants[4], participants[5]}, set(participants[1:4])],
+    ]
+    group_ids: np.ndarray = encoding.group_ids(assignment)
+    assert group_ids.tolist() == [[0, 0, 0, 1, 1, 1], [0, 1, 1, 1, 0, 0]]
+
+    histograms: np.ndarray = encoding.group_histograms(group_ids, 2)
+    assert histograms.shape == (2, 2, encoding.slot_count)
+    assert histograms[0, 0].tolist() == [3, 0, 1, 1, 1]
+    assert histograms[1, 0].tolist() == [1, 2, 2, 1, 0]
+    assert np.array_equal(
+        histograms[1, 1], encoding.histogram(encoding.indices(assignment[1][1]))
+    )
+    assert encoding.histogram_sizes(histograms).tolist() == [[3, 3], [3, 3]]
+
+
+def test_no_attributes(participants):
+    """Tests whether assignments without considered attributes have no diversity cost."""
+    assignment: Assignment = [[set(participants[:3]), set(participants[3:])]]
+    assert ObjectiveFunction([]).diversity_cost(assignment) == 0
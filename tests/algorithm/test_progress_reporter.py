@@ -0,0 +1,61 @@
+"""Module containing tests for the progress reporter."""
+
+from algorithm.progress_reporter import ProgressReport, ProgressReporter
+
+
+def test_throttling():
+    """Tests whether updates within the interval are dropped but the start and the end are always reported."""
+    progress: list[tuple[int, int]] = []
+    reporter: ProgressReporter = ProgressReporter(
+        100, lambda current, total: progress.append((current, total)), interval=60
+    )
+    reporter.start(0.0, 0, 1.0, 1.0)
+    for cycle in range(1, 101):
+        reporter.update(cycle / 100, cycle, 1.0, 1.0)
+    reporter.finish(1.0, 100, 0.5, 0.5)
+    assert progress == [(0, 100), (100, 100)]
+
+    progress.clear()
+    reporter = ProgressReporter(
+        100, lambda current, total: progress.append((current, total)), interval=0
+    )
+    reporter.start(0.0, 0, 1.0, 1.0)
+    for cycle in range(1, 101):
+        reporter.update(cycle / 100, cycle, 1.0, 1.0)
+    reporter.finish(1.0, 100, 0.5, 0.5)
+    assert progress == [(cycle, 100) for cycle in range(101)]
+
+
+def test_report():
+    """Tests whether reports carry the costs, the throughput and the remaining time."""
+    reports: list[ProgressReport] = []
+    reporter: ProgressReporter = ProgressReporter(
+        1000, report_callback=reports.append, interval=0
+    )
+    reporter.start(0.0, 0, 2.0, 2.0)
+    reporter.update(0.25, 250, 1.5, 1.25)
+    reporter.finish(1.0, 1000, 1.0, 0.75)
+
+    assert reports[0].current == 0
+    assert reports[0].remaining_seconds is None
+    assert reports[1].current == 250
+    assert reports[1].cycle == 250
+    assert reports[1].cost == 1.5
+    assert reports[1].best_cost == 1.25
+    assert reports[1].cycles_per_second > 0
+    assert reports[1].remaining_seconds is not None
+    assert reports[1].remaining_seconds >= 0
+    assert reports[2].current == 1000
+    assert reports[2].remaining_seconds == 0
+
+
+def test_early_finish():
+    """Tests whether a run stopped early reports the progress it made instead of completion."""
+    progress: list[tuple[int, int]] = []
+    reporter: ProgressReporter = ProgressReporter(
+        1000, lambda current, total: progress.append((current, total)), interval=60
+    )
+    reporter.start(0.0, 0, 1.0, 1.0)
+    reporter.update(0.2, 200, 1.0, 1.0)
+    reporter.finish(0.4, 400, 0.5, 0.5)
+    assert progress == [(0, 1000), (400, 1000)]
@@ -1,6 +1,7 @@
 """Module containing tests for the random algorithm."""
 
 from random import Random
+import numpy as np
 from algorithm.random_algorithm import RandomAlgorithm
 from algorithm.objective_function import ObjectiveFunction
 from data_structures import Assignment, Participant
@@ -90,3 +91,69 @@ def test_brute_force():
     assert objective.calculate_weighted_cost(
         brute_force_assignment
     ) < objective.calculate_weighted_cost(random_assignment)
+
+
+def test_batch_group_ids():
+    """Tests whether batches of assignments have the shape and group sizes of find_assignment."""
+    test_algorithm: RandomAlgorithm = RandomAlgorithm(Random(11112222))
+    batch: np.ndarray = test_algorithm.batch_group_ids(11, 4, 3, 50)
+
+    assert batch.shape == (50, 3, 11)
+    for assignment in batch:
+        for iteration in assignment:
+            assert np.bincount(iteration, minlength=4).tolist() == [3, 3, 3, 2]
+    assert len({assignment.tobytes() for assignment in batch}) > 1
+
+
+def test_brute_force_stopping(monkeypatch):
+    """Tests whether brute force is independent of the number of processes and stops at the target cost or time."""
+    participants: list[Participant] = [
+        Participant(
+            index, {"gender": "mwd"[index % 3], "fb": ["1", "2", "3", "4"][index % 4]}
+        )
+        for index in range(12)
+    ]
+    assignments: list[Assignment] = [
+        RandomAlgorithm(Random(11112222)).brute_force_assignment(
+            set(participants), 3, 3, 1000, process_count=process_count
+        )
+        for process_count in (1, 2)
+    ]
+    assert assignments[0] == assignments[1]
+
+    chunk_counts: list[int] = [0]
+    batch_group_ids = RandomAlgorithm.batch_group_ids
+
+    def count_chunk(self, *arguments):
+        chunk_counts[0] += 1
+        return batch_group_ids(self, *arguments)
+
+    monkeypatch.setattr(RandomAlgorithm, "batch_group_ids", count_chunk)
+    # no assignment has a negative cost, so every chunk is scored
+    RandomAlgorithm(Random(11112222)).brute_force_assignment(
+        set(participants), 3, 3, 1000, target_cost=-1
+    )
+    assert chunk_counts[0] == 4
+
+    # the run scores with the bounds of its first assignment, drawn before any chunk
+    objective: ObjectiveFunction = ObjectiveFunction(["gender", "fb"])
+    objective.recalculate_bounds(
+        RandomAlgorithm(Random(11112222)).find_assignment(set(participants), 3, 3)
+    )
+    target_cost: float = objective.calculate_weighted_cost(
+        RandomAlgorithm(Random(11112222)).brute_force_assignment(
+            set(participants), 3, 3, 2 * RandomAlgorithm.BATCH_SIZE
+        )
+    )
+    chunk_counts[0] = 0
+    assignment: Assignment = RandomAlgorithm(Random(11112222)).brute_force_assignment(
+        set(participants), 3, 3, 10**9, target_cost=target_cost
+    )
+    assert 1 <= chunk_counts[0] <= 2
+    assert len(assignment) == 3
+
+    chunk_counts[0] = 0
+    RandomAlgorithm(Random(11112222)).brute_force_assignment(
+        set(participants), 3, 3, None, target_cost=-1, time_budget=0
+    )
+    assert chunk_counts[0] == 1
@@ -0,0 +1,34 @@
+"""Module containing tests for the repair of assignments after roster changes."""
+
+from random import Random
+
+from data_structures import Assignment, Participant
+from algorithm.random_algorithm import RandomAlgorithm
+from algorithm.roster_repair import repair_assignment
+
+
+def test_repair_assignment():
+    """Tests whether repaired groups are balanced and keep the placements of unaffected participants."""
+    participants: list[Participant] = [Participant(index, {}) for index in range(20)]
+    assignment: Assignment = RandomAlgorithm(Random(11112222)).find_assignment(
+        set(participants), 4, 3
+    )
+    added: set[Participant] = {Participant(index, {}) for index in range(20, 23)}
+    removed: set[Participant] = set(participants[:6])
+    repaired: Assignment = repair_assignment(
+        assignment, added, removed, Random(11112222)
+    )
+
+    assert len(repaired) == 3
+    for iteration, repaired_iteration in zip(assignment, repaired):
+        sizes: list[int] = [len(group) for group in repaired_iteration]
+        assert max(sizes) - min(sizes) <= 1
+        members: set[Participant] = set().union(*repaired_iteration)
+        assert members == (set(participants) - removed) | added
+        kept: int = sum(
+            len(group & repaired_group - added)
+            for group, repaired_group in zip(iteration, repaired_iteration)
+        )
+        assert kept >= len(participants) - len(removed) - 1
+    for group in assignment[0]:
+        assert len(group) == 5
@@ -0,0 +1,68 @@
+"""Module containing tests for the single iteration solver."""
+
+from itertools import combinations
+from random import Random
+import pytest
+
+from data_structures import Assignment, Participant
+from algorithm.objective_function import ObjectiveFunction
+from algorithm.simulated_annealing_algorithm import SimulatedAnnealingAlgorithm
+from algorithm.single_iteration_solver import SingleIterationSolver
+
+
+@pytest.fixture
+def participants() -> list[Participant]:
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+        Participant(5, {"gender": "w", "nationalität": "mordor", "fb": "1"}),
+        Participant(6, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(7, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(8, {"gender": "w", "nationalität": "angmar", "fb": "3"}),
+        Participant(9, {"gender": "d", "nationalität": "mordor", "fb": "1"}),
+        Participant(10, {"gender": "d", "nationalität": "mordor", "fb": "1"}),
+    ]
+    return participants
+
+
+def test_find_assignment(participants):
+    """Tests whether the solver finds the optimal split into two groups."""
+    attributes: list[str] = list(participants[0].attributes.keys())
+    assignment: Assignment = SingleIterationSolver(
+        attributes, Random(11112222)
+    ).find_assignment(set(participants), 2)
+
+    assert len(assignment) == 1
+    assert sorted(len(group) for group in assignment[0]) == [5, 6]
+    assert set().union(*assignment[0]) == set(participants)
+
+    objective: ObjectiveFunction = ObjectiveFunction(attributes)
+    optimum: float = min(
+        objective.calculate_weighted_cost(
+            [[set(group), set(participants) - set(group)]]
+        )
+        for group in combinations(participants, 5)
+    )
+    assert objective.calculate_weighted_cost(assignment) == pytest.approx(optimum)
+
+
+def test_annealing_fast_path(participants):
+    """Tests whether annealing solves a single iteration without running cycles."""
+    progress: list[tuple[int, int]] = []
+    algorithm: SimulatedAnnealingAlgorithm = SimulatedAnnealingAlgorithm(
+        list(participants[0].attributes.keys()), Random(11112222)
+    )
+    assignment: Assignment = algorithm.find_assignment(
+        set(participants),
+        3,
+        1,
+        100000,
+        progress_callback=lambda current, total: progress.append((current, total)),
+    )
+
+    assert sorted(len(group) for group in assignment[0]) == [3, 4, 4]
+    assert len(algorithm.trace) == 0
+    assert progress == [(100000, 100000)]
@@ -0,0 +1,68 @@
+"""Module containing tests for the stopping criteria."""
+
+from threading import Event
+import pytest
+
+from algorithm.stopping_criteria import StoppingCriteria, StoppingOptions
+
+
+def test_progress():
+    """Tests whether the progress follows the larger fraction of the cycle limit and the time budget."""
+    assert StoppingCriteria(100).progress(25, 1000.0) == pytest.approx(0.25)
+    assert StoppingCriteria(None, StoppingOptions(10.0)).progress(
+        10**6, 2.5
+    ) == pytest.approx(0.25)
+    assert StoppingCriteria(100, StoppingOptions(10.0)).progress(
+        25, 5.0
+    ) == pytest.approx(0.5)
+    assert StoppingCriteria(100).progress(200, 0.0) == 1.0
+
+    assert StoppingCriteria(100).progress_total == 100
+    assert StoppingCriteria(None, StoppingOptions(10.0)).progress_total == 1000
+
+    with pytest.raises(ValueError):
+        StoppingCriteria(None)
+
+
+def test_early_stops():
+    """Tests whether stalled runs and runs accepting too few moves are stopped."""
+    criteria: StoppingCriteria = StoppingCriteria(
+        1000,
+        StoppingOptions(
+            stall_cycles=50, min_acceptance_rate=0.1, acceptance_window=100
+        ),
+    )
+    assert not criteria.is_stalled(149, 100)
+    assert criteria.is_stalled(150, 100)
+    assert not criteria.is_window_complete(150)
+    assert criteria.is_window_complete(200)
+    assert criteria.is_frozen(9)
+    assert not criteria.is_frozen(10)
+    assert criteria.is_frozen(4, 50)
+
+    unlimited: StoppingCriteria = StoppingCriteria(1000)
+    assert not unlimited.is_stalled(1000, 0)
+    assert not unlimited.is_frozen(0)
+
+
+def test_should_stop():
+    """Tests whether the accepted moves are counted per acceptance window and cancellations are noticed."""
+    criteria: StoppingCriteria = StoppingCriteria(
+        1000, StoppingOptions(min_acceptance_rate=0.5, acceptance_window=4)
+    )
+    assert not criteria.should_stop(1, 1, True)
+    assert not criteria.should_stop(2, 2, True)
+    assert not criteria.should_stop(3, 2, False)
+    assert not criteria.should_stop(4, 2, False)
+    assert criteria.accepted == 0
+    assert not criteria.should_stop(5, 2, True)
+    assert criteria.should_stop(8, 2, False)
+    assert criteria.accepted == 1
+
+    cancellation: Event = Event()
+    cancelled: StoppingCriteria = StoppingCriteria(1000, None, cancellation, 10)
+    assert not cancelled.should_stop(10, 10, True)
+    cancellation.set()
+    assert not cancelled.should_stop(11, 11, True)
+    assert cancelled.should_stop(20, 20, True)
+    assert cancelled.cancelled
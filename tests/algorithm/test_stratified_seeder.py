@@ -0,0 +1,71 @@
+"""Module containing tests for the stratified seeder."""
+
+from random import Random
+import pytest
+
+from data_structures import Assignment, Participant
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.meeting_matrix import MeetingMatrix
+from algorithm.objective_function import ObjectiveFunction
+from algorithm.random_algorithm import RandomAlgorithm
+from algorithm.stratified_seeder import StratifiedSeeder
+
+
+@pytest.fixture
+def participants() -> list[Participant]:
+    participants: list[Participant] = [
+        Participant(
+            index,
+            {
+                "gender": "mwd"[index % 3],
+                "nationalität": ["mordor", "gondor", "angmar", "lindon"][index % 4],
+            },
+        )
+        for index in range(23)
+    ]
+    return participants
+
+
+def test_find_assignment(participants):
+    """Tests whether the groups have balanced sizes and a balanced share of the heaviest attribute."""
+    seeder: StratifiedSeeder = StratifiedSeeder(
+        ["gender", "nationalität"], Random(11112222), {"gender": 2}
+    )
+    assignment: Assignment = seeder.find_assignment(set(participants), 5, 7)
+
+    assert len(assignment) == 7
+    for iteration in assignment:
+        assert sorted(len(group) for group in iteration) == [4, 4, 5, 5, 5]
+        assert set().union(*iteration) == set(participants)
+        for group in iteration:
+            genders: list[str] = [
+                participant.get_attribute("gender") for participant in group
+            ]
+            counts: list[int] = [genders.count(gender) for gender in "mwd"]
+            assert max(counts) - min(counts) <= 1
+
+
+def test_repeat_meetings(participants):
+    """Tests whether no pair meets twice within a prime number of iterations
+    not smaller than the group size."""
+    assignment: Assignment = StratifiedSeeder(
+        ["gender", "nationalität"], Random(11112222)
+    ).find_assignment(set(participants), 5, 5)
+    meetings: MeetingMatrix = MeetingMatrix.from_compact(
+        CompactAssignment.from_assignment(assignment)
+    )
+
+    assert meetings.repeat_count == 0
+
+
+def test_cost(participants):
+    """Tests whether the seeded assignment is better than a random one."""
+    attributes: list[str] = ["gender", "nationalität"]
+    objective: ObjectiveFunction = ObjectiveFunction(attributes)
+    assert objective.calculate_weighted_cost(
+        StratifiedSeeder(attributes, Random(11112222)).find_assignment(
+            set(participants), 5, 3
+        )
+    ) < objective.calculate_weighted_cost(
+        RandomAlgorithm(Random(11112222)).find_assignment(set(participants), 5, 3)
+    )
@@ -0,0 +1,186 @@
+"""Module containing tests for the tabu search algorithm."""
+
+from random import Random
+from threading import Event
+import pytest
+
+from data_structures import Assignment, Participant
+from algorithm.annealing_checkpoint import CheckpointOptions
+from algorithm.move_set import MoveSet
+from algorithm.random_algorithm import RandomAlgorithm
+from algorithm.objective_function import ObjectiveFunction
+from algorithm.progress_reporter import ProgressReport, ReportingOptions
+from algorithm.tabu_search_algorithm import TabuSearchAlgorithm
+from algorithm.stopping_criteria import StoppingOptions
+
+
+@pytest.fixture
+def participants() -> list[Participant]:
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+        Participant(5, {"gender": "w", "nationalität": "mordor", "fb": "1"}),
+        Participant(6, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(7, {"gender": "m", "nationalität": "angmar", "fb": "2"}),
+        Participant(8, {"gender": "w", "nationalität": "angmar", "fb": "3"}),
+        Participant(9, {"gender": "d", "nationalität": "mordor", "fb": "1"}),
+        Participant(10, {"gender": "d", "nationalität": "mordor", "fb": "1"}),
+    ]
+    return participants
+
+
+def test_find_assignment(participants):
+    """Tests whether find_assignment generates assignments of the correct shape and reports its progress."""
+    progress: list[tuple[int, int]] = []
+    algorithm: TabuSearchAlgorithm = TabuSearchAlgorithm(
+        list(participants[0].attributes.keys()), Random(11112222)
+    )
+    assignment: Assignment = algorithm.find_assignment(
+        set(participants),
+        4,
+        3,
+        20,
+        progress_callback=lambda current, total: progress.append((current, total)),
+    )
+
+    assert len(assignment) == 3
+    for iteration in assignment:
+        assert sorted(len(group) for group in iteration) == [2, 3, 3, 3]
+        assert set().union(*iteration) == set(participants)
+    assert progress[0] == (0, 20)
+    assert progress[-1] == (20, 20)
+    assert algorithm.trace.cycles.tolist() == list(range(1, 21))
+    assert algorithm.best_cost == pytest.approx(algorithm.trace.costs.min())
+
+
+def test_assignment_quality(participants):
+    """Tests whether tabu search with 50 moves performs better than brute force with 500 assignments."""
+    attributes: list[str] = list(participants[0].attributes.keys())
+    tabu_assignment: Assignment = TabuSearchAlgorithm(
+        attributes, Random(11112222)
+    ).find_assignment(set(participants), 4, 3, 50)
+    brute_force_assignment: Assignment = RandomAlgorithm(
+        Random(11112222)
+    ).brute_force_assignment(set(participants), 4, 3, 500)
+
+    objective: ObjectiveFunction = ObjectiveFunction(attributes)
+    assert objective.calculate_weighted_cost(
+        tabu_assignment
+    ) < objective.calculate_weighted_cost(brute_force_assignment)
+
+
+def test_stopping_criteria(participants):
+    """Tests whether runs stop once they stall or stop improving."""
+    algorithm: TabuSearchAlgorithm = TabuSearchAlgorithm(
+        list(participants[0].attributes.keys()), Random(11112222), candidate_count=5
+    )
+    algorithm.find_assignment(
+        set(participants), 4, 3, 10000, stopping=StoppingOptions(stall_cycles=50)
+    )
+    assert algorithm.trace.cycles[-1] < 10000
+
+    algorithm.find_assignment(
+        set(participants),
+        4,
+        3,
+        10000,
+        stopping=StoppingOptions(min_acceptance_rate=0.5, acceptance_window=100),
+    )
+    assert algorithm.trace.cycles[-1] < 10000
+
+    with pytest.raises(ValueError):
+        algorithm.find_assignment(set(participants), 4, 3, None)
+
+
+def test_move_set(participants):
+    """Tests whether tabu search with rotations and repeated pair moves keeps the assignment shape."""
+    assignment: Assignment = TabuSearchAlgorithm(
+        list(participants[0].attributes.keys()), Random(11112222), candidate_count=5
+    ).find_assignment(set(participants), 3, 3, 100, guided_rate=0.5, move_set=MoveSet())
+
+    for iteration in assignment:
+        assert sorted(len(group) for group in iteration) == [3, 4, 4]
+        assert set().union(*iteration) == set(participants)
+
+
+def test_annealing_arguments(participants):
+    """Tests whether tabu search takes the arguments of simulated annealing in the same order,
+    including the ones the algorithm worker passes, and can be cancelled."""
+    algorithm: TabuSearchAlgorithm = TabuSearchAlgorithm(
+        list(participants[0].attributes.keys()), Random(11112222), candidate_count=5
+    )
+    assignment: Assignment = algorithm.find_assignment(
+        set(participants), 3, 3, 100, 1, 15, 1, 1
+    )
+    assert len(assignment) == 3
+    assert algorithm.trace.cycles[-1] == 100
+
+    reports: list[ProgressReport] = []
+    cancellation: Event = Event()
+    algorithm.find_assignment(
+        set(participants),
+        3,
+        3,
+        1000,
+        stopping=StoppingOptions(None, None),
+        auto_temperature=True,
+        stratified_start=True,
+        cancellation=cancellation,
+        reporting=ReportingOptions(reports.append),
+    )
+    assert not algorithm.cancelled
+    assert reports[-1].current == reports[-1].total
+
+    cancellation.set()
+    algorithm.find_assignment(set(participants), 3, 3, 1000, cancellation=cancellation)
+    assert algorithm.cancelled
+    assert algorithm.trace.cycles[-1] == 100
+
+    with pytest.raises(ValueError):
+        algorithm.find_assignment(
+            set(participants),
+            3,
+            3,
+            100,
+            checkpointing=CheckpointOptions(callback=lambda checkpoint: None),
+        )
+
+
+def test_initial_assignment(participants):
+    """Tests whether a run continues from the initial assignment and keeps the placements of a reference."""
+    attributes: list[str] = list(participants[0].attributes.keys())
+    initial_assignment: Assignment = RandomAlgorithm(Random(1)).find_assignment(
+        set(participants), 3, 3
+    )
+    algorithm: TabuSearchAlgorithm = TabuSearchAlgorithm(
+        attributes, Random(11112222), candidate_count=5
+    )
+    kept: Assignment = algorithm.find_assignment(
+        set(participants),
+        3,
+        3,
+        100,
+        initial_assignment=initial_assignment,
+        reference_assignment=initial_assignment,
+        movement_penalty=1000,
+    )
+    assert [set(map(frozenset, iteration)) for iteration in kept] == [
+        set(map(frozenset, iteration)) for iteration in initial_assignment
+    ]
+    assert algorithm.best_cycle == 0
+
+
+def test_find_assignment_in_process(participants):
+    """Tests whether a run in a child process is reproducible."""
+    attributes: list[str] = list(participants[0].attributes.keys())
+    assignments: list[Assignment] = [
+        TabuSearchAlgorithm(
+            attributes, Random(11112222), candidate_count=5
+        ).find_assignment_in_process(set(participants), 3, 3, 100)
+        for _ in range(2)
+    ]
+    assert assignments[0] == assignments[1]
+    assert set().union(*assignments[0][0]) == set(participants)
@@ -0,0 +1,83 @@
+"""Module containing tests for the calibration of annealing temperatures."""
+
+from math import exp, log
+from random import Random
+import numpy as np
+import pytest
+
+from algorithm.compact_assignment import CompactAssignment
+from algorithm.objective_function import ObjectiveFunction
+from algorithm.simulated_annealing_algorithm import SimulatedAnnealingAlgorithm
+from algorithm.temperature_calibration import FINAL_PROGRESS, calibrate_temperature
+from data_structures import Assignment, Participant
+
+
+def test_calibrate_temperature():
+    """Tests whether the calibrated temperatures accept uphill swaps at the targeted rates."""
+    participants: list[Participant] = [
+        Participant(0, {"gender": "m", "nationalität": "mordor", "fb": "1"}),
+        Participant(1, {"gender": "m", "nationalität": "gondor", "fb": "2"}),
+        Participant(2, {"gender": "m", "nationalität": "gondor", "fb": "3"}),
+        Participant(3, {"gender": "w", "nationalität": "gondor", "fb": "3"}),
+        Participant(4, {"gender": "w", "nationalität": "lindon", "fb": "2"}),
+        Participant(5, {"gender": "w", "nationalität": "mordor", "fb": "1"}),
+    ]
+    assignment: Assignment = [
+        [set(participants[:3]), set(participants[3:])],
+        [set(participants[::2]), set(participants[1::2])],
+    ]
+    state: CompactAssignment = CompactAssignment.from_assignment(assignment)
+    objective: ObjectiveFunction = ObjectiveFunction(["gender", "nationalität", "fb"])
+    group_ids_before: list[list[int]] = state.group_ids.tolist()
+
+    calibration: tuple[float, float] | None = calibrate_temperature(
+        objective, state, Random(11112222)
+    )
+
+    assert state.group_ids.tolist() == group_ids_before
+    assert calibration is not None
+    initial_temperature, scaling = calibration
+    assert initial_temperature > 0
+    assert scaling > 0
+
+    sample_random: Random = Random(11112222)
+    deltas: np.ndarray = np.array(
+        [
+            objective.swap_delta(state, *state.random_swap(sample_random))
+            for _ in range(300)
+        ]
+    )
+    uphill: np.ndarray = deltas[deltas > 0]
+    assert exp(-uphill.mean() / initial_temperature) == pytest.approx(0.8)
+    assert np.mean(np.exp(-uphill / initial_temperature)) == pytest.approx(0.8, abs=0.1)
+
+    final_temperature: float = SimulatedAnnealingAlgorithm(["gender"]).get_temperature(
+        FINAL_PROGRESS, initial_temperature, scaling
+    )
+    assert exp(-np.quantile(uphill, 0.1) / final_temperature) == pytest.approx(0.001)
+
+    ladder_calibration: tuple[float, float] | None = calibrate_temperature(
+        objective, state, Random(11112222), final_progress=None
+    )
+    assert ladder_calibration is not None
+    _, ladder_scaling = ladder_calibration
+    assert initial_temperature * exp(-ladder_scaling) == pytest.approx(
+        -np.quantile(uphill, 0.1) / log(0.001)
+    )
+
+
+def test_calibrate_temperature_without_uphill_swaps():
+    """Tests whether calibration gives up when no swap changes the cost."""
+    participants: list[Participant] = [
+        Participant(index, {"gender": "m"}) for index in range(4)
+    ]
+    assignment: Assignment = [[set(participants[:2]), set(participants[2:])]]
+
+    assert (
+        calibrate_temperature(
+            ObjectiveFunction(["gender"]),
+            CompactAssignment.from_assignment(assignment),
+            Random(11112222),
+        )
+        is None
+    )
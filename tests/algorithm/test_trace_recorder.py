@@ -0,0 +1,40 @@
+"""Module containing tests for the trace recorder."""
+
+import pytest
+
+from algorithm.trace_recorder import TraceRecorder
+
+
+def test_record():
+    """Tests whether only cycles matching the stride are recorded, oldest first."""
+    recorder: TraceRecorder = TraceRecorder(capacity=10, stride=2)
+    for cycle in range(1, 8):
+        recorder.record(cycle, cycle / 10, cycle * 10)
+
+    assert len(recorder) == 3
+    assert recorder.cycles.tolist() == [2, 4, 6]
+    assert recorder.temperatures.tolist() == pytest.approx([0.2, 0.4, 0.6])
+    assert recorder.costs.tolist() == [20, 40, 60]
+
+
+def test_ring_buffer():
+    """Tests whether the oldest samples are overwritten once the capacity is reached."""
+    recorder: TraceRecorder = TraceRecorder(capacity=3)
+    for cycle in range(1, 6):
+        recorder.record(cycle, 1, cycle)
+
+    assert len(recorder) == 3
+    assert recorder.cycles.tolist() == [3, 4, 5]
+    assert recorder.costs.tolist() == [3, 4, 5]
+
+    recorder.clear()
+    assert len(recorder) == 0
+    assert recorder.cycles.tolist() == []
+
+
+def test_invalid_arguments():
+    """Tests whether capacities and strides below 1 are rejected."""
+    with pytest.raises(ValueError):
+        TraceRecorder(capacity=0)
+    with pytest.raises(ValueError):
+        TraceRecorder(stride=0)
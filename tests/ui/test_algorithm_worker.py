@@ -0,0 +1,28 @@
+"""Module containing tests for algorithm_worker.py."""
+
+from unittest.mock import MagicMock
+
+from ui.algorithm_worker import AlgorithmWorker
+
+
+def test_failed_run():
+    """Tests whether a failing algorithm emits its error message instead of an assignment."""
+    worker: AlgorithmWorker = AlgorithmWorker()
+    worker.algorithm_instance = MagicMock()
+    worker.algorithm_instance.find_assignment_in_process.side_effect = RuntimeError(
+        "The annealing process failed"
+    )
+    worker.participants = set()
+    worker.number_of_groups = 2
+    worker.number_of_iterations = 2
+    worker.number_of_epochs = 10
+    worker.run_in_process = True
+    finished: list[object] = []
+    failed: list[str] = []
+    worker.finished.connect(finished.append)
+    worker.failed.connect(failed.append)
+
+    worker.run()
+
+    assert finished == []
+    assert failed == ["The annealing process failed"]